@@ -0,0 +1,401 @@
+"""Vexine benchmark suite.
+
+    python bench_vexine.py                         # run, print table
+    python bench_vexine.py --output bench.json     # also write JSON results
+    python bench_vexine.py --save-baseline         # store as bench_baseline.json
+    xvfb-run python bench_vexine.py --gui          # include Tk page timings
+
+Three groups are measured:
+  micro       per-call time of the analysis math and each tip generator
+  throughput  rows/sec for single-profile scoring versus batch scoring
+  gui         cold start, page build, navigation and teardown (needs a display)
+
+Results are compared against a stored baseline; any benchmark more than
+--tolerance worse than the baseline is reported as a regression (and
+makes the exit status 1 with --fail-on-regression).
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+
+import vexine_engine as engine
+from vexine_engine import HealthProfile
+
+
+DEFAULT_BASELINE = "bench_baseline.json"
+DEFAULT_TOLERANCE = 0.10
+SCHEMA_VERSION = 1
+
+
+def sample_profiles(n, seed=0):
+    """Random profiles over the GUI's input domains"""
+    rng = random.Random(seed)
+    age_lo, age_hi, _ = engine.AGE_RANGE
+    height_lo, height_hi, height_step = engine.HEIGHT_RANGE
+    weight_lo, weight_hi, weight_step = engine.WEIGHT_RANGE
+    return [
+        HealthProfile(
+            age=rng.randint(age_lo, age_hi),
+            gender=rng.choice(engine.GENDERS),
+            height_cm=height_lo + height_step * rng.randint(0, int((height_hi - height_lo) / height_step)),
+            weight_kg=weight_lo + weight_step * rng.randint(0, int((weight_hi - weight_lo) / weight_step)),
+            current_body_type=rng.choice(engine.CURRENT_BODY_TYPES),
+            desired_body_type=rng.choice(engine.DESIRED_BODY_TYPES),
+            fitness_level=rng.choice(engine.FITNESS_LEVELS),
+            goal=rng.choice(engine.GOALS),
+            activity_level=rng.choice(engine.ACTIVITY_LEVELS)
+        )
+        for _ in range(n)
+    ]
+
+
+def time_per_call(func, repeat=5):
+    """Best-of-repeat seconds per call of func()"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    runs = timer.repeat(repeat=repeat, number=number)
+    per_call = [run / number for run in runs]
+    return min(per_call), statistics.pstdev(per_call)
+
+
+def _result(value, unit, spread=0.0, higher_is_better=False):
+    return {"value": value, "unit": unit, "spread": spread, "higher_is_better": higher_is_better}
+
+
+# Benchmarks
+
+def bench_micro(repeat):
+    """Per-call timings of the engine entry points"""
+    from vexine_grid import CalorieGrid
+    from vexine_tips import TipRenderer
+
+    profile = HealthProfile(age=34, gender="female", height_cm=165.0, weight_kg=71.5,
+                            goal="lose weight", fitness_level="intermediate",
+                            desired_body_type="lean")
+    bmi = engine.calculate_bmi(profile.height_cm, profile.weight_kg)
+    cache = engine.AnalysisCache()
+    cache.analyze(profile)
+    grid = CalorieGrid.build()
+    result = engine.analyze(profile)
+    renderer = TipRenderer()
+    renderer.render_result(result, "de")
+
+    def calculate():
+        height_bmi = engine.calculate_bmi(profile.height_cm, profile.weight_kg)
+        bmr = engine.calculate_bmr(profile.weight_kg, profile.height_cm, profile.age, profile.gender)
+        return height_bmi, bmr * engine.activity_multiplier(profile.activity_level)
+
+    def calories():
+        bmr = engine.calculate_bmr(profile.weight_kg, profile.height_cm, profile.age, profile.gender)
+        return bmr * engine.activity_multiplier(profile.activity_level)
+
+    cases = {
+        "micro.calculate": calculate,
+        "micro.calories_formula": calories,
+        "micro.analyze": lambda: engine.analyze(profile),
+        "micro.analyze_cached": lambda: cache.analyze(profile),
+        "micro.nutrition_tips": lambda: engine.get_nutrition_tips(bmi, profile.goal, profile.fitness_level),
+        "micro.exercise_tips": lambda: engine.get_exercise_tips(bmi, profile.goal, profile.fitness_level,
+                                                                profile.desired_body_type),
+        "micro.lifestyle_tips": lambda: engine.get_lifestyle_tips(profile.fitness_level),
+        "micro.render_tips_localized": lambda: renderer.render_result(result, "de"),
+        "micro.bmr_harris_benedict": lambda: engine.harris_benedict_bmr(
+            profile.weight_kg, profile.height_cm, profile.age, profile.gender),
+        "micro.bmr_katch_mcardle": lambda: engine.katch_mcardle_bmr(
+            profile.weight_kg, profile.height_cm, profile.age, profile.gender),
+        "micro.calories_grid": lambda: grid.maintenance(profile.age, profile.gender, profile.height_cm,
+                                                        profile.weight_kg, profile.activity_level)
+    }
+    results = {}
+    for name, func in cases.items():
+        best, spread = time_per_call(func, repeat)
+        results[name] = _result(best, "s/call", spread)
+    return results
+
+
+def bench_throughput(rows, repeat):
+    """Rows/sec for one-at-a-time analyze() versus vectorized batch scoring"""
+    profiles = sample_profiles(rows)
+    results = {}
+
+    def single():
+        for profile in profiles:
+            engine.analyze(profile)
+
+    best, spread = time_per_call(single, repeat)
+    results["throughput.single"] = _result(rows / best, "rows/s", spread / best * rows / best, True)
+
+    try:
+        import vexine_batch
+    except ImportError:
+        print("numpy not available; skipping batch throughput", file=sys.stderr)
+        return results
+
+    columns = {name: [getattr(p, name) for p in profiles] for name in vexine_batch.PROFILE_COLUMNS}
+
+    def batch():
+        profile = vexine_batch.normalize_chunk(columns)
+        vexine_batch.score_encoded(vexine_batch.encode_profile(profile))
+
+    best, spread = time_per_call(batch, repeat)
+    results["throughput.batch"] = _result(rows / best, "rows/s", spread / best * rows / best, True)
+
+    # Encoding happens once upstream in a pipeline; this isolates the scoring itself
+    encoded = vexine_batch.encode_profile(vexine_batch.normalize_chunk(columns))
+    best, spread = time_per_call(lambda: vexine_batch.score_encoded(encoded), repeat)
+    results["throughput.batch_encoded"] = _result(rows / best, "rows/s", spread / best * rows / best, True)
+
+    from vexine_cohort import score_formulas, recommend_cohort
+    bmi = encoded["weight_kg"] / (encoded["height_cm"] / 100) ** 2
+    best, spread = time_per_call(lambda: recommend_cohort(
+        bmi, encoded["goal"], encoded["fitness_level"], encoded["desired_body_type"]).tip_counts(), repeat)
+    results["throughput.recommend_cohort"] = _result(rows / best, "rows/s", spread / best * rows / best, True)
+
+    # Every BMR equation in one pass (rows/s counts each row once)
+    best, spread = time_per_call(lambda: score_formulas(
+        encoded["height_cm"], encoded["weight_kg"], encoded["age"],
+        encoded["gender"], encoded["activity_level"]), repeat)
+    results["throughput.all_formulas"] = _result(rows / best, "rows/s", spread / best * rows / best, True)
+    return results
+
+
+def bench_startup(repeat):
+    """Cold start: time to the painted shell and until idle builds finish"""
+    import tkinter as tk
+    import vexine
+
+    shell, ready = [], []
+    for _ in range(repeat):
+        root = tk.Tk()
+        try:
+            start = time.perf_counter()
+            vexine.VexineApp(root)
+            shell.append(time.perf_counter() - start)
+            root.update()
+            ready.append(time.perf_counter() - start)
+        finally:
+            root.destroy()
+    return {
+        "gui.startup_shell": _result(min(shell), "s", statistics.pstdev(shell)),
+        "gui.startup_ready": _result(min(ready), "s", statistics.pstdev(ready))
+    }
+
+
+def bench_gui(repeat):
+    """Page build, navigation and teardown timings on a real Tk display
+
+    Analyses are recorded to a throwaway VEXINE_HISTORY, not the user's.
+    """
+    saved_history = os.environ.get("VEXINE_HISTORY")
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["VEXINE_HISTORY"] = os.path.join(tmp, "history.db")
+        try:
+            return _bench_gui(repeat)
+        finally:
+            if saved_history is None:
+                del os.environ["VEXINE_HISTORY"]
+            else:
+                os.environ["VEXINE_HISTORY"] = saved_history
+
+
+def _bench_gui(repeat):
+    import tkinter as tk
+    import vexine
+
+    results = bench_startup(repeat)
+    root = tk.Tk()
+    app = None
+    try:
+        app = vexine.VexineApp(root)
+        root.update()
+
+        def calculate():
+            # Analyses finish on the worker thread; wait until the page shows the result
+            app.calculate_and_proceed()
+            while app.worker.busy:
+                root.update()
+                time.sleep(0.001)
+
+        calculate()
+
+        def measure(func, setup=None):
+            samples = []
+            for _ in range(repeat):
+                if setup is not None:
+                    setup()
+                    root.update()
+                start = time.perf_counter()
+                func()
+                root.update()
+                samples.append(time.perf_counter() - start)
+            return _result(min(samples), "s", statistics.pstdev(samples))
+
+        results.update({
+            # show_page is a no-op for the current page, so start each sample on the other one
+            "gui.show_input_page": measure(app.show_input_page, setup=app.show_results_page),
+            "gui.show_results_page": measure(app.show_results_page, setup=app.show_input_page),
+            "gui.navigate_round_trip": measure(lambda: (app.show_input_page(),
+                                                        app.show_results_page())),
+            "gui.recalculate_round_trip": measure(lambda: (app.show_input_page(), calculate()))
+        })
+
+        # Dashboard updates and window resizes, widget cards vs CanvasDashboard
+        root.attributes('-fullscreen', False)
+        sizes = itertools.cycle(("1280x800", "1600x900"))
+        for suffix, canvas_dashboard in (("", False), ("_canvas", True)):
+            if app.canvas_dashboard != canvas_dashboard:
+                app.canvas_dashboard = canvas_dashboard
+                app.clear_page()
+                app.results_page.destroy()
+                app.results_page = None
+                calculate()
+            results[f"gui.update_results_page{suffix}"] = measure(app.update_results_page)
+            results[f"gui.resize_results_page{suffix}"] = measure(lambda: root.geometry(next(sizes)))
+        app.canvas_dashboard = False
+
+        # Full builds and teardowns; these replace the app's page widgets, so run last
+        app.clear_page()
+        for name, build in (("input_page", app.build_input_page),
+                            ("results_page", app.build_results_page)):
+            builds, teardowns = [], []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                page = build()
+                page.pack(fill=tk.BOTH, expand=True)
+                root.update()
+                builds.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                page.destroy()
+                root.update()
+                teardowns.append(time.perf_counter() - start)
+            results[f"gui.build_{name}"] = _result(min(builds), "s", statistics.pstdev(builds))
+            results[f"gui.teardown_{name}"] = _result(min(teardowns), "s", statistics.pstdev(teardowns))
+        return results
+    finally:
+        # The history connection belongs to the worker thread; close it there
+        if app is not None:
+            if app.history_db:
+                app.worker.submit(app.history_db.close)
+            app.worker.shutdown()
+        root.destroy()
+
+
+# Baseline comparison
+
+def compare(results, baseline, tolerance):
+    """Rows of (name, baseline, current, change, regressed); change > 0 means slower/worse"""
+    rows = []
+    for name, current in sorted(results.items()):
+        base = baseline.get(name)
+        if base is None or not base["value"]:
+            rows.append((name, None, current, None, False))
+            continue
+        ratio = current["value"] / base["value"]
+        change = (1 / ratio - 1) if current["higher_is_better"] else (ratio - 1)
+        rows.append((name, base, current, change, change > tolerance))
+    return rows
+
+
+def format_value(result):
+    value, unit = result["value"], result["unit"]
+    if unit in ("s", "s/call"):
+        if value < 1e-6:
+            return f"{value * 1e9:8.1f} ns"
+        if value < 1e-3:
+            return f"{value * 1e6:8.2f} us"
+        return f"{value * 1e3:8.2f} ms"
+    return f"{value:10,.0f} {unit}"
+
+
+def print_report(rows, tolerance):
+    print(f"{'benchmark':32} {'baseline':>14} {'current':>14} {'change':>8}")
+    for name, base, current, change, regressed in rows:
+        base_text = format_value(base) if base else "-"
+        change_text = f"{change:+7.1%}" if change is not None else "new"
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:32} {base_text:>14} {format_value(current):>14} {change_text:>8}{flag}")
+    regressions = sum(1 for row in rows if row[4])
+    if regressions:
+        print(f"\n{regressions} regression(s) beyond {tolerance:.0%}")
+
+
+def run(groups, rows, repeat):
+    results = {}
+    if "micro" in groups:
+        results.update(bench_micro(repeat))
+    if "throughput" in groups:
+        results.update(bench_throughput(rows, repeat))
+    if "gui" in groups:
+        results.update(bench_gui(repeat))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Vexine benchmarks")
+    parser.add_argument("--gui", action="store_true",
+                        help="include Tk page timings (needs a display, e.g. xvfb-run)")
+    parser.add_argument("--only", choices=("micro", "throughput", "gui"), action="append",
+                        help="run only the given group (repeatable)")
+    parser.add_argument("--rows", type=int, default=10000, help="profiles for throughput runs")
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions per benchmark")
+    parser.add_argument("--output", metavar="PATH", help="write JSON results here")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, metavar="PATH",
+                        help=f"baseline JSON to compare against (default {DEFAULT_BASELINE})")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"allowed slowdown before flagging (default {DEFAULT_TOLERANCE:.0%})")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="exit with status 1 if any benchmark regressed")
+    args = parser.parse_args(argv)
+
+    groups = set(args.only or ["micro", "throughput"] + (["gui"] if args.gui else []))
+    if "gui" in groups and not (os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin")):
+        print("no display; skipping gui benchmarks (run under xvfb-run)", file=sys.stderr)
+        groups.discard("gui")
+
+    results = run(groups, args.rows, args.repeat)
+    report = {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine()
+        },
+        "results": results
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f).get("results", {})
+
+    rows = compare(results, baseline, args.tolerance)
+    print_report(rows, args.tolerance)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nbaseline saved to {args.baseline}")
+
+    if args.fail_on_regression and any(row[4] for row in rows):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,480 @@
+"""Vexine load test: concurrent kiosk sessions, end to end.
+
+    python loadtest_vexine.py                               # both targets, default ramp
+    python loadtest_vexine.py --target engine --levels 1,4,16 --duration 5
+    python loadtest_vexine.py --output load.json --max-p99-ms 50
+
+Two targets are driven:
+  engine  threads acting as kiosks: each session edits the inputs field by
+          field through LiveAnalysis (as the GUI's variable traces do), then
+          does the calculate_and_proceed work: the analysis and a SQLite
+          history write plus trend query
+  server  keep-alive HTTP clients posting the same sessions' profiles to a
+          vexine_server started in a child process (needs NumPy)
+
+Concurrency is ramped through --levels; each level runs for --duration
+seconds and reports session throughput, latency percentiles, RSS growth and
+GC pauses of the process doing the work. Everything runs locally, so the
+report (JSON on stdout or --output) can gate CI via --max-p99-ms. Failed
+sessions are left out of the latency figures, each kiosk or client prints
+its first failure to stderr, and any failure makes the exit status 1.
+"""
+import argparse
+import asyncio
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+import vexine_engine as engine
+from vexine_engine import HealthProfile
+from vexine_history import HistoryStore
+from vexine_trace import HistogramSink
+
+
+DEFAULT_LEVELS = (1, 2, 4, 8, 16, 32)
+DEFAULT_DURATION = 2.0
+TARGETS = ("engine", "server")
+SCHEMA_VERSION = 1
+QUANTILES = (50, 90, 99)
+
+# Input order on the page; sessions edit fields in this order, like a person would
+SESSION_FIELDS = ("age", "gender", "height_cm", "weight_kg", "current_body_type",
+                  "desired_body_type", "fitness_level", "goal", "activity_level")
+
+# Option weights for the dropdowns, in the engine's option order
+ACTIVITY_WEIGHTS = (30, 30, 22, 12, 6)
+GOAL_WEIGHTS = (40, 25, 15, 20)
+FITNESS_WEIGHTS = (50, 35, 15)
+DESIRED_WEIGHTS = (35, 30, 15, 20)
+
+
+# Workload
+
+def _snap(value, domain):
+    """Clamp value to a spinbox (from, to, increment) domain and round to its step"""
+    lo, hi, step = domain
+    value = min(max(value, lo), hi)
+    return lo + round((value - lo) / step) * step
+
+
+def _current_body_type(bmi):
+    if bmi < 18.5:
+        return "underweight"
+    if bmi < 25:
+        return "average"
+    if bmi < 30:
+        return "overweight"
+    return "obese"
+
+
+def realistic_profile(rng):
+    """One profile drawn from adult population-like distributions
+
+    Values are snapped to the spinbox domains and options come from the
+    dropdown lists, so every profile is one the input page can produce.
+    """
+    gender = rng.choice(engine.GENDERS)
+    age = int(_snap(rng.triangular(16, 80, 35), engine.AGE_RANGE))
+    height = _snap(rng.gauss(176 if gender == "male" else 163, 7), engine.HEIGHT_RANGE)
+    bmi = rng.lognormvariate(3.24, 0.18)   # median BMI ~25.5
+    weight = _snap(bmi * (height / 100) ** 2, engine.WEIGHT_RANGE)
+    body_type = _current_body_type(bmi)
+    if body_type == "average" and rng.random() < 0.2:
+        body_type = "athletic"
+    return HealthProfile(
+        age=age,
+        gender=gender,
+        height_cm=height,
+        weight_kg=weight,
+        current_body_type=body_type,
+        desired_body_type=rng.choices(engine.DESIRED_BODY_TYPES, DESIRED_WEIGHTS)[0],
+        fitness_level=rng.choices(engine.FITNESS_LEVELS, FITNESS_WEIGHTS)[0],
+        goal=rng.choices(engine.GOALS, GOAL_WEIGHTS)[0],
+        activity_level=rng.choices(engine.ACTIVITY_LEVELS, ACTIVITY_WEIGHTS)[0]
+    )
+
+
+def session_edits(profile, defaults=HealthProfile()):
+    """The field changes a session makes from the default inputs, in page order"""
+    return [(name, getattr(profile, name)) for name in SESSION_FIELDS
+            if getattr(profile, name) != getattr(defaults, name)]
+
+
+# Measurement
+
+def rss_bytes(pid=None):
+    """Resident set size of a process (Linux /proc), or None if unavailable"""
+    try:
+        with open(f"/proc/{pid or 'self'}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class GcMonitor:
+    """Collector pause durations via gc.callbacks"""
+
+    def __init__(self):
+        self.pauses = HistogramSink()
+        self.collections = [0, 0, 0]
+        self._start = None
+
+    def _callback(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter_ns()
+        elif self._start is not None:
+            self.pauses.record("gc", 0, time.perf_counter_ns() - self._start, 0)
+            self.collections[info["generation"]] += 1
+            self._start = None
+
+    def start(self):
+        gc.callbacks.append(self._callback)
+
+    def stop(self):
+        if self._callback in gc.callbacks:
+            gc.callbacks.remove(self._callback)
+
+    def reset(self):
+        self.pauses.reset()
+        self.collections = [0, 0, 0]
+
+    def report(self):
+        stats = self.pauses.percentiles(QUANTILES).get("gc", {"count": 0, "mean_ms": 0.0, "max_ms": 0.0})
+        return {"collections": list(self.collections), "pauses": stats}
+
+
+def _level_report(level, sessions, errors, elapsed, latency, rss_before, rss_after, gc_report):
+    stats = latency.percentiles(QUANTILES).get("session", {})
+    return {
+        "concurrency": level,
+        "sessions": sessions,
+        "errors": errors,
+        "elapsed_s": elapsed,
+        "throughput": sessions / elapsed if elapsed > 0 else 0.0,
+        "latency_ms": {key[:-3]: value for key, value in stats.items() if key.endswith("_ms")},
+        "rss_before": rss_before,
+        "rss_after": rss_after,
+        "rss_growth": rss_after - rss_before if rss_before is not None and rss_after is not None else None,
+        "gc": gc_report
+    }
+
+
+# Engine target
+
+class KioskSession:
+    """What one GUI instance does per visitor, without Tk"""
+
+    def __init__(self, history_path, user):
+        self.live = None
+        self.cache = engine.AnalysisCache()
+        self.history = HistoryStore(history_path)
+        self.user = user
+
+    def run(self, profile):
+        """Edit the inputs, then calculate; returns the HealthResult"""
+        self.live = engine.LiveAnalysis()
+        for name, value in session_edits(profile):
+            self.live.update(**{name: value})
+        result = self.cache.analyze(self.live.profile if self.live.valid else profile)
+        self.history.record(result, user=self.user)
+        self.history.flush()
+        self.history.rolling_average(self.user, "bmi", window=7, limit=2)
+        return result
+
+    def close(self):
+        self.history.close()
+
+
+def run_engine_level(level, duration, history_path, seed):
+    """Run level concurrent kiosk threads for duration seconds"""
+    latency = HistogramSink()
+    counts = [0, 0]
+    counts_lock = threading.Lock()
+    start_barrier = threading.Barrier(level + 1)
+    deadline = [0.0]
+
+    def kiosk(index):
+        rng = random.Random(seed * 1000 + index)
+        session = None
+        done = failed = 0
+        try:
+            try:
+                session = KioskSession(history_path, f"kiosk-{index}")
+            except Exception:
+                failed += 1
+                _log_failure(f"engine kiosk {index}")
+            start_barrier.wait()
+            while session is not None and time.perf_counter() < deadline[0]:
+                profile = realistic_profile(rng)
+                start = time.perf_counter_ns()
+                try:
+                    session.run(profile)
+                except Exception:
+                    failed += 1
+                    if failed == 1:
+                        _log_failure(f"engine kiosk {index}")
+                    continue
+                latency.record("session", 0, time.perf_counter_ns() - start, 0)
+                done += 1
+        finally:
+            if session is not None:
+                session.close()
+            with counts_lock:
+                counts[0] += done
+                counts[1] += failed
+
+    threads = [threading.Thread(target=kiosk, args=(i,), daemon=True) for i in range(level)]
+    for thread in threads:
+        thread.start()
+    deadline[0] = time.perf_counter() + duration
+    started = time.perf_counter()
+    start_barrier.wait()
+    for thread in threads:
+        thread.join()
+    return counts[0], counts[1], time.perf_counter() - started, latency
+
+
+def load_engine(levels, duration, seed=0, progress=None):
+    """Ramp the engine target; returns one report per level"""
+    monitor = GcMonitor()
+    monitor.start()
+    reports = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="vexine-load-") as tmp:
+            history_path = os.path.join(tmp, "history.db")
+            for level in levels:
+                monitor.reset()
+                rss_before = rss_bytes()
+                sessions, errors, elapsed, latency = run_engine_level(level, duration, history_path, seed)
+                report = _level_report(level, sessions, errors, elapsed, latency,
+                                       rss_before, rss_bytes(), monitor.report())
+                reports.append(report)
+                if progress:
+                    progress("engine", report)
+    finally:
+        monitor.stop()
+    return reports
+
+
+# Server target
+
+def _serve_child(conn, max_batch_size, max_wait):
+    """Child process: run a ScoringServer, report its port, then GC stats on request"""
+    from vexine_server import ScoringServer
+
+    async def main():
+        monitor = GcMonitor()
+        monitor.start()
+        server = ScoringServer("127.0.0.1", 0, max_batch_size, max_wait)
+        await server.start()
+        conn.send(server.port)
+        loop = asyncio.get_running_loop()
+        while True:
+            command = await loop.run_in_executor(None, conn.recv)
+            if command == "stop":
+                break
+            if command == "reset":
+                monitor.reset()
+            conn.send({"gc": monitor.report(), "rss": rss_bytes(), "stats": server.batcher.stats()})
+        await server.close()
+
+    asyncio.run(main())
+
+
+async def _post(reader, writer, body):
+    writer.write(b"POST /analyze HTTP/1.1\r\nHost: localhost\r\nContent-Length: %d\r\n\r\n%s"
+                 % (len(body), body))
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def _run_server_level(port, level, duration, seed):
+    latency = HistogramSink()
+    counts = [0, 0]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + duration
+
+    async def client(index):
+        rng = random.Random(seed * 1000 + index)
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        failed = 0
+        try:
+            while loop.time() < deadline:
+                profile = realistic_profile(rng)
+                body = json.dumps(dict(session_edits(profile))).encode("utf-8")
+                start = time.perf_counter_ns()
+                try:
+                    status = await _post(reader, writer, body)
+                except (ConnectionError, asyncio.IncompleteReadError, ValueError, IndexError):
+                    counts[1] += 1
+                    _log_failure(f"server client {index}")
+                    break
+                if status != 200:
+                    counts[1] += 1
+                    if not failed:
+                        print(f"server client {index}: HTTP {status} for {body.decode('utf-8')}",
+                              file=sys.stderr)
+                    failed += 1
+                    continue
+                latency.record("session", 0, time.perf_counter_ns() - start, 0)
+                counts[0] += 1
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(level)))
+    return counts[0], counts[1], time.perf_counter() - started, latency
+
+
+def load_server(levels, duration, seed=0, max_batch_size=None, max_wait=None, progress=None):
+    """Ramp the server target against a child-process server; one report per level"""
+    from vexine_server import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT
+
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(
+        target=_serve_child, daemon=True,
+        args=(child, max_batch_size or DEFAULT_MAX_BATCH_SIZE,
+              DEFAULT_MAX_WAIT if max_wait is None else max_wait))
+    process.start()
+    reports = []
+    try:
+        if not parent.poll(30):
+            raise RuntimeError("scoring server did not start")
+        port = parent.recv()
+        for level in levels:
+            parent.send("reset")
+            rss_before = parent.recv()["rss"]
+            sessions, errors, elapsed, latency = asyncio.run(
+                _run_server_level(port, level, duration, seed))
+            parent.send("report")
+            child_report = parent.recv()
+            report = _level_report(level, sessions, errors, elapsed, latency,
+                                   rss_before, child_report["rss"], child_report["gc"])
+            report["batcher"] = child_report["stats"]
+            reports.append(report)
+            if progress:
+                progress("server", report)
+        parent.send("stop")
+        process.join(10)
+    finally:
+        if process.is_alive():
+            process.terminate()
+            process.join()
+    return reports
+
+
+# Reporting
+
+def _log_failure(source):
+    """Print the exception being handled, e.g. a worker's first failure"""
+    # One write, so tracebacks from concurrent kiosks do not interleave
+    print(f"{source} failed:\n{traceback.format_exc()}", end="", file=sys.stderr)
+
+
+def print_level(target, report, stream=sys.stderr):
+    latency = report["latency_ms"]
+    growth = report["rss_growth"]
+    growth_text = f"{growth / 2 ** 20:+7.1f} MiB" if growth is not None else "      -"
+    pauses = report["gc"]["pauses"]
+    print(f"{target:7} x{report['concurrency']:<4} {report['throughput']:10,.0f} sessions/s"
+          f"  p50 {latency.get('p50', 0):7.2f}  p99 {latency.get('p99', 0):7.2f} ms"
+          f"  rss {growth_text}  gc {pauses['count']:4} max {pauses['max_ms']:6.2f} ms"
+          + (f"  errors {report['errors']}" if report["errors"] else ""),
+          file=stream)
+
+
+def _parse_levels(text):
+    levels = tuple(int(part) for part in text.split(","))
+    if not levels or min(levels) < 1:
+        raise argparse.ArgumentTypeError("levels must be positive integers")
+    return levels
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the Vexine engine and scoring server")
+    parser.add_argument("--target", choices=TARGETS, action="append",
+                        help="target to drive (repeatable; default both)")
+    parser.add_argument("--levels", type=_parse_levels, default=DEFAULT_LEVELS,
+                        help=f"comma-separated concurrency ramp (default {','.join(map(str, DEFAULT_LEVELS))})")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION,
+                        help=f"seconds per level (default {DEFAULT_DURATION:g})")
+    parser.add_argument("--seed", type=int, default=0, help="profile generator seed")
+    parser.add_argument("--max-batch", type=int, help="server micro-batch size")
+    parser.add_argument("--max-wait-ms", type=float, help="server micro-batch wait")
+    parser.add_argument("--output", metavar="PATH", help="write the JSON report here instead of stdout")
+    parser.add_argument("--max-p99-ms", type=float,
+                        help="exit with status 1 if any level's p99 latency exceeds this "
+                             "(any failed session always does)")
+    args = parser.parse_args(argv)
+
+    if args.duration <= 0:
+        parser.error("--duration must be positive")
+    targets = args.target or list(TARGETS)
+    results = {}
+    if "engine" in targets:
+        results["engine"] = load_engine(args.levels, args.duration, args.seed, progress=print_level)
+    if "server" in targets:
+        try:
+            import numpy
+        except ImportError:
+            print("numpy not available; skipping server load test", file=sys.stderr)
+        else:
+            results["server"] = load_server(
+                args.levels, args.duration, args.seed, args.max_batch,
+                None if args.max_wait_ms is None else args.max_wait_ms / 1000, progress=print_level)
+
+    report = {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "levels": list(args.levels),
+            "duration_s": args.duration,
+            "seed": args.seed
+        },
+        "results": results
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        print(text)
+
+    status = 0
+    failing = [(target, level["concurrency"], level["errors"]) for target, levels in results.items()
+               for level in levels if level["errors"]]
+    if failing:
+        print("failed sessions: " + ", ".join(f"{t} x{c} ({n})" for t, c, n in failing), file=sys.stderr)
+        status = 1
+    if args.max_p99_ms is not None:
+        slow = [(target, level["concurrency"]) for target, levels in results.items() for level in levels
+                if level["latency_ms"].get("p99", 0) > args.max_p99_ms]
+        if slow:
+            print("p99 over budget: " + ", ".join(f"{t} x{c}" for t, c in slow), file=sys.stderr)
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,43 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 import math
+import os
+import sqlite3
+import sys
+
+import vexine_engine as engine
+import vexine_trace as trace
+from vexine_history import HistoryStore, DEFAULT_HISTORY_PATH, DEFAULT_USER
+from vexine_worker import AnalysisWorker
+from vexine_dashboard import CanvasDashboard
+from vexine_tips import TipRenderer, match_locale, DEFAULT_LOCALE
+from vexine_engine import (
+    HealthProfile, InvalidProfileError, GENDERS, CURRENT_BODY_TYPES,
+    DESIRED_BODY_TYPES, GOALS, FITNESS_LEVELS, ACTIVITY_LEVELS,
+    AGE_RANGE, HEIGHT_RANGE, WEIGHT_RANGE
+)
+
+
+FONT_FAMILY = 'Orbitron'
+MONO_FONT_FAMILY = 'Consolas'
+
+# Tips are rendered in batches of this many; later batches are added as the
+# view scrolls within TIP_PREFETCH (fraction of the content) of the end
+TIP_RENDER_BATCH = 40
+TIP_PREFETCH = 0.2
+
+# Input changes within this window are coalesced into one live preview update
+LIVE_UPDATE_MS = 120
+LIVE_FIELDS = ("age", "gender", "height_cm", "weight_kg", "current_body_type",
+               "desired_body_type", "fitness_level", "goal", "activity_level")
+
+# Background analyses are polled every WORKER_POLL_MS. One still running at
+# the first poll switches to the results page with a spinner that advances
+# every SPINNER_POLLS polls; quicker ones go straight to their results.
+WORKER_POLL_MS = 16
+SPINNER_POLLS = 5
+SPINNER_FRAMES = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
 
 
 class VexineApp:
@@ -14,6 +51,10 @@ class VexineApp:
         self.root.bind('<F11>', lambda e: self.root.attributes('-fullscreen', 
                     not self.root.attributes('-fullscreen')))
         
+        # F9 dumps profiler output and span percentiles (VEXINE_TRACE / VEXINE_PROFILE)
+        if trace.enabled() or trace.profiling():
+            self.root.bind('<F9>', lambda e: trace.dump())
+        
         # Futuristic Dark Color Scheme
         self.colors = {
             'bg': '#0a0a0a',              # Pure black
@@ -34,6 +75,10 @@ class VexineApp:
         # Configure root
         self.root.configure(bg=self.colors['bg'])
         
+        # Named fonts shared by all widgets, keyed by (family, size, weight)
+        self.fonts = {}
+        self.dropdown_style_ready = False
+        
         # Initialize variables
         self.age = tk.IntVar(value=25)
         self.gender = tk.StringVar(value="male")
@@ -50,15 +95,74 @@ class VexineApp:
         self.maintenance_calories = 0
         self.surplus_calories = 0
         self.deficit_calories = 0
-        
-        # Page container
+        self.result = None
+        
+        # Live preview: changes are coalesced, then applied incrementally.
+        # VEXINE_CALORIE_GRID=1 switches its calorie maths to table lookups.
+        calorie_grid = None
+        if os.environ.get("VEXINE_CALORIE_GRID"):
+            from vexine_grid import CalorieGrid
+            calorie_grid = CalorieGrid.cached()
+        self.live = engine.LiveAnalysis(self.get_profile(), calorie_grid=calorie_grid)
+        self.live_fields = set()
+        self.live_unparsed = set()
+        self.live_after = None
+        self.live_preview = None
+        for field in LIVE_FIELDS:
+            getattr(self, field).trace_add(
+                'write', lambda *_, field=field: self.on_input_changed(field))
+        
+        # Repeat analyses of the same inputs are served from here
+        self.analysis_cache = engine.AnalysisCache()
+        
+        # Persistent history (VEXINE_HISTORY / VEXINE_USER), opened on first use
+        self.history_db = None
+        self.history_user = os.environ.get("VEXINE_USER", DEFAULT_USER)
+        
+        # Tips are shown in VEXINE_LOCALE (e.g. "de", "pt_BR") with personal values
+        self.tip_locale = match_locale(os.environ.get("VEXINE_LOCALE")) or DEFAULT_LOCALE
+        self.tip_renderer = TipRenderer()
+        
+        # Analyses run on a worker thread and are collected by poll_worker.
+        # Only worker jobs touch analysis_cache and history_db.
+        self.worker = AnalysisWorker()
+        self.worker_after = None
+        self.worker_polls = 0
+        
+        # VEXINE_CANVAS_DASHBOARD=1 (or canvas_dashboard set before the results page
+        # is built) draws the BMI and calorie cards on one Canvas instead of widgets
+        self.canvas_dashboard = bool(os.environ.get("VEXINE_CANVAS_DASHBOARD"))
+        self.dashboard = None
+        
+        # Pages are built once and swapped with pack/pack_forget
         self.current_page = None
+        self.input_page = None
+        self.results_page = None
         
-        # Configure dropdown style
-        self.configure_dropdown_style()
+        # Paint the page shell first; its cards and the results page are built on idle
+        self.input_page = self.build_input_page(deferred=True)
+        self.show_page(self.input_page)
+    
+    def font(self, size, weight='normal', family=FONT_FAMILY):
+        """Shared named font, created on first use"""
+        key = (family, size, weight)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.fonts[key] = tkfont.Font(root=self.root, family=family,
+                                                 size=size, weight=weight)
+        return font
+    
+    def run_when_idle(self, steps):
+        """Run callables one per idle pass so events are handled in between"""
+        steps = iter(steps)
         
-        # Show input page
-        self.show_input_page()
+        def run_next():
+            step = next(steps, None)
+            if step is not None:
+                step()
+                self.root.after_idle(run_next)
+        
+        self.root.after_idle(run_next)
     
     def configure_dropdown_style(self):
         """Configure custom dropdown style with blue text on black background"""
@@ -89,12 +193,23 @@ class VexineApp:
         self.root.option_add('*TCombobox*Listbox.foreground', self.colors['secondary'])
         self.root.option_add('*TCombobox*Listbox.selectBackground', self.colors['secondary'])
         self.root.option_add('*TCombobox*Listbox.selectForeground', '#000000')
-        self.root.option_add('*TCombobox*Listbox.font', ('Orbitron', 10, 'bold'))
+        self.root.option_add('*TCombobox*Listbox.font', self.font(10, 'bold'))
+        self.dropdown_style_ready = True
     
+    @trace.traced("gui.clear_page")
     def clear_page(self):
-        """Clear current page"""
+        """Hide current page (its widgets are kept for reuse)"""
         if self.current_page:
-            self.current_page.destroy()
+            self.current_page.pack_forget()
+            self.current_page = None
+    
+    def show_page(self, page):
+        """Swap the visible page"""
+        if self.current_page is page:
+            return
+        self.clear_page()
+        page.pack(fill=tk.BOTH, expand=True)
+        self.current_page = page
     
     def reset_inputs(self):
         """Reset all input fields to default values"""
@@ -108,15 +223,24 @@ class VexineApp:
         self.goal.set("maintain")
         self.activity_level.set("moderate")
     
+    @trace.traced("gui.show_input_page")
     def show_input_page(self):
-        """Display the input page with full-width layout"""
-        self.clear_page()
+        """Display the input page, building it on first use"""
+        if self.input_page is None:
+            self.input_page = self.build_input_page()
+        self.show_page(self.input_page)
+    
+    @trace.traced("gui.build_input_page")
+    def build_input_page(self, deferred=False):
+        """Build the input page with full-width layout
         
-        self.current_page = tk.Frame(self.root, bg=self.colors['bg'])
-        self.current_page.pack(fill=tk.BOTH, expand=True)
+        With deferred=True only the header and empty columns are built now;
+        the cards follow one column per idle pass, then the results page.
+        """
+        page = tk.Frame(self.root, bg=self.colors['bg'])
         
         # Header with only VEXINE
-        header = tk.Frame(self.current_page, bg=self.colors['bg_secondary'], height=100)
+        header = tk.Frame(page, bg=self.colors['bg_secondary'], height=100)
         header.pack(fill=tk.X)
         header.pack_propagate(False)
         
@@ -127,25 +251,27 @@ class VexineApp:
         tk.Label(
             header,
             text="VEXINE",
-            font=('Orbitron', 48, 'bold'),
+            font=self.font(48, 'bold'),
             bg=self.colors['bg_secondary'],
             fg=self.colors['primary']
         ).pack(expand=True)
         
         # Subtitle below header
-        subtitle_frame = tk.Frame(self.current_page, bg=self.colors['bg'])
+        subtitle_frame = tk.Frame(page, bg=self.colors['bg'])
         subtitle_frame.pack(pady=(20, 0))
         
         tk.Label(
             subtitle_frame,
             text="INITIALIZE HEALTH PROFILE",
-            font=('Orbitron', 12),
+            font=self.font(12),
             bg=self.colors['bg'],
             fg=self.colors['secondary']
         ).pack()
         
+        self.live_preview = self.build_live_preview(page)
+        
         # Main content container with padding
-        content_container = tk.Frame(self.current_page, bg=self.colors['bg'])
+        content_container = tk.Frame(page, bg=self.colors['bg'])
         content_container.pack(fill=tk.BOTH, expand=True, padx=80, pady=30)
         
         # Grid layout - 3 columns across full width
@@ -163,50 +289,147 @@ class VexineApp:
         content_container.grid_columnconfigure(1, weight=1)
         content_container.grid_columnconfigure(2, weight=1)
         
-        # Column 1 - Biometric Data
+        steps = [
+            lambda: self.build_biometric_column(col1),
+            lambda: self.build_body_column(col2),
+            lambda: self.build_activity_column(col3),
+            lambda: self.build_calculate_button(content_container)
+        ]
+        if deferred:
+            self.run_when_idle(steps + [self.prebuild_results_page])
+        else:
+            for step in steps:
+                step()
+        
+        return page
+    
+    def build_live_preview(self, page):
+        """Strip under the subtitle showing BMI and calories as inputs change"""
+        strip = tk.Frame(page, bg=self.colors['card'])
+        strip.pack(pady=(15, 0), ipadx=20, ipady=6)
+        
+        def field(text, width):
+            tk.Label(strip, text=text, font=self.font(9, 'bold'),
+                     bg=self.colors['card'], fg=self.colors['text_dim']).pack(side=tk.LEFT, padx=(15, 5))
+            label = tk.Label(strip, font=self.font(12, 'bold'), width=width,
+                             bg=self.colors['card'], fg=self.colors['text'])
+            label.pack(side=tk.LEFT)
+            return label
+        
+        strip.bmi_label = field("BMI", 5)
+        strip.category_label = tk.Label(strip, font=self.font(9, 'bold'), width=12,
+                                        bg=self.colors['card'], fg=self.colors['text'])
+        strip.category_label.pack(side=tk.LEFT)
+        strip.maintenance_label = field("MAINTENANCE", 5)
+        strip.surplus_label = field("BULK", 5)
+        strip.deficit_label = field("CUT", 5)
+        
+        strip.shown = False
+        self.update_live_preview(strip, None)
+        return strip
+    
+    def on_input_changed(self, field):
+        """Variable trace callback; schedules one update per LIVE_UPDATE_MS"""
+        if self.worker.busy:
+            # The running analysis is for the old inputs
+            self.worker.cancel()
+            self.show_busy(False)
+        self.live_fields.add(field)
+        if self.live_after is None:
+            self.live_after = self.root.after(LIVE_UPDATE_MS, self.apply_live_changes)
+    
+    def apply_live_changes(self):
+        """Feed the changed inputs to the live analysis and refresh the preview"""
+        if self.live_after is not None:
+            self.root.after_cancel(self.live_after)
+            self.live_after = None
+        fields, self.live_fields = self.live_fields, set()
+        changes = {}
+        for field in fields:
+            try:
+                changes[field] = getattr(self, field).get()
+                self.live_unparsed.discard(field)
+            except tk.TclError:
+                # Half-typed spinbox text; keep the last good value
+                self.live_unparsed.add(field)
+        outputs = self.live.update(**changes)
+        if self.live_preview is not None:
+            self.update_live_preview(self.live_preview, outputs)
+    
+    def update_live_preview(self, strip, outputs):
+        """Refresh the preview labels for the changed outputs (None = all)"""
+        live = self.live
+        shown = live.valid and not self.live_unparsed
+        if not shown:
+            for label in (strip.bmi_label, strip.maintenance_label,
+                          strip.surplus_label, strip.deficit_label):
+                label.config(text="--")
+            strip.category_label.config(text="", fg=self.colors['text'])
+            strip.shown = False
+            return
+        if outputs is None or not strip.shown:
+            outputs = {"bmi", "bmi_band", "calories"}
+            strip.shown = True
+        
+        if "bmi" in outputs:
+            strip.bmi_label.config(text=f"{live.bmi:.1f}")
+        if "bmi_band" in outputs:
+            color = self.get_bmi_color(live.bmi)
+            strip.bmi_label.config(fg=color)
+            strip.category_label.config(text=engine.BMI_CATEGORIES[live.bmi_band], fg=color)
+        if "calories" in outputs:
+            strip.maintenance_label.config(text=f"{int(live.maintenance_calories)}")
+            strip.surplus_label.config(text=f"{int(live.surplus_calories)}")
+            strip.deficit_label.config(text=f"{int(live.deficit_calories)}")
+    
+    def build_biometric_column(self, col1):
+        """Column 1 - Biometric Data"""
         self.create_futuristic_card(col1, "BIOMETRIC DATA", [
-            ("AGE", self.age, 10, 100, 1),
-            ("HEIGHT", self.height_cm, 100, 250, 0.5, "CM"),
-            ("WEIGHT", self.weight_kg, 30, 200, 0.5, "KG")
+            ("AGE", self.age, *AGE_RANGE),
+            ("HEIGHT", self.height_cm, *HEIGHT_RANGE, "CM"),
+            ("WEIGHT", self.weight_kg, *WEIGHT_RANGE, "KG")
         ], color=self.colors['secondary'])
         
         gender_card = self.create_empty_card(col1, "GENDER PROFILE")
         self.create_neon_radio_group(gender_card, self.gender, 
-                                     [("MALE", "male"), ("FEMALE", "female")])
-        
-        # Column 2 - Body Profile & Goals
+                                     [(g.upper(), g) for g in GENDERS])
+    
+    def build_body_column(self, col2):
+        """Column 2 - Body Profile & Goals"""
         body_card = self.create_empty_card(col2, "BODY PROFILE")
-        tk.Label(body_card, text="CURRENT", font=('Orbitron', 9, 'bold'),
+        tk.Label(body_card, text="CURRENT", font=self.font(9, 'bold'),
                 bg=self.colors['card'], fg=self.colors['secondary']).pack(pady=(10,5))
         self.create_neon_dropdown(body_card, self.current_body_type,
-                                  ["underweight", "average", "athletic", "overweight", "obese"])
+                                  CURRENT_BODY_TYPES)
         
-        tk.Label(body_card, text="TARGET", font=('Orbitron', 9, 'bold'),
+        tk.Label(body_card, text="TARGET", font=self.font(9, 'bold'),
                 bg=self.colors['card'], fg=self.colors['secondary']).pack(pady=(20,5))
         self.create_neon_dropdown(body_card, self.desired_body_type,
-                                  ["lean", "athletic", "muscular", "maintain"])
+                                  DESIRED_BODY_TYPES)
         
         goal_card = self.create_empty_card(col2, "PRIMARY GOAL")
         self.create_neon_dropdown(goal_card, self.goal,
-                                  ["lose weight", "gain muscle", "maintain", "improve fitness"])
-        
-        # Column 3 - Fitness & Activity
+                                  GOALS)
+    
+    def build_activity_column(self, col3):
+        """Column 3 - Fitness & Activity"""
         activity_card = self.create_empty_card(col3, "ACTIVITY LEVEL")
         self.create_neon_dropdown(activity_card, self.activity_level, 
-                                  ["sedentary", "light", "moderate", "active", "very active"])
+                                  ACTIVITY_LEVELS)
         
         fitness_card = self.create_empty_card(col3, "FITNESS LEVEL")
         self.create_neon_dropdown(fitness_card, self.fitness_level,
-                                  ["beginner", "intermediate", "advanced"])
-        
-        # Calculate button at bottom spanning full width
+                                  FITNESS_LEVELS)
+    
+    def build_calculate_button(self, content_container):
+        """Calculate button at bottom spanning full width"""
         btn_frame = tk.Frame(content_container, bg=self.colors['bg'])
         btn_frame.grid(row=1, column=0, columnspan=3, pady=50)
         
         calc_btn = tk.Button(
             btn_frame,
             text="⚡ CALCULATE & ANALYZE ⚡",
-            font=('Orbitron', 18, 'bold'),
+            font=self.font(18, 'bold'),
             bg=self.colors['primary'],
             fg='#000000',
             activebackground=self.colors['secondary'],
@@ -223,18 +446,39 @@ class VexineApp:
         calc_btn.bind('<Enter>', lambda e: calc_btn.config(bg=self.colors['secondary']))
         calc_btn.bind('<Leave>', lambda e: calc_btn.config(bg=self.colors['primary']))
     
+    @trace.traced("gui.show_results_page")
     def show_results_page(self):
-        """Display the results page with compact layout"""
-        self.clear_page()
-        
-        self.current_page = tk.Frame(self.root, bg=self.colors['bg'])
-        self.current_page.pack(fill=tk.BOTH, expand=True)
+        """Display the results page (with the spinner while an analysis runs)"""
+        if self.results_page is None:
+            self.results_page = self.build_results_page()
+        self.show_busy(self.worker.busy)
+        self.show_page(self.results_page)
+    
+    def show_busy(self, busy):
+        """Switch the results page title between the spinner and ANALYSIS COMPLETE"""
+        if self.results_page is None:
+            return
+        if busy:
+            frame = SPINNER_FRAMES[self.worker_polls // SPINNER_POLLS % len(SPINNER_FRAMES)]
+            self.status_label.config(text=f"ANALYZING {frame}", fg=self.colors['secondary'])
+        else:
+            self.status_label.config(text="ANALYSIS COMPLETE", fg=self.colors['primary'])
+    
+    def prebuild_results_page(self):
+        """Build the (hidden) results page ahead of the first calculation"""
+        if self.results_page is None:
+            self.results_page = self.build_results_page()
+    
+    @trace.traced("gui.build_results_page")
+    def build_results_page(self):
+        """Build the results page with compact layout"""
+        page = tk.Frame(self.root, bg=self.colors['bg'])
         
         # Neon line at the very top
-        tk.Frame(self.current_page, bg=self.colors['primary'], height=3).pack(fill=tk.X)
+        tk.Frame(page, bg=self.colors['primary'], height=3).pack(fill=tk.X)
         
         # Header with back and recalculate buttons - REDUCED HEIGHT TO 125
-        header_frame = tk.Frame(self.current_page, bg=self.colors['bg_secondary'], height=125)
+        header_frame = tk.Frame(page, bg=self.colors['bg_secondary'], height=125)
         header_frame.pack(fill=tk.X)
         header_frame.pack_propagate(False)
         
@@ -246,7 +490,7 @@ class VexineApp:
         back_btn_header = tk.Button(
             header_content,
             text="← BACK",
-            font=('Orbitron', 11, 'bold'),
+            font=self.font(11, 'bold'),
             bg=self.colors['bg_secondary'],
             fg=self.colors['primary'],
             activebackground=self.colors['card'],
@@ -266,7 +510,7 @@ class VexineApp:
         recalc_btn_header = tk.Button(
             header_content,
             text="RECALCULATE →",
-            font=('Orbitron', 11, 'bold'),
+            font=self.font(11, 'bold'),
             bg=self.colors['bg_secondary'],
             fg=self.colors['primary'],
             activebackground=self.colors['card'],
@@ -286,52 +530,42 @@ class VexineApp:
         title_section = tk.Frame(header_content, bg=self.colors['bg_secondary'])
         title_section.place(relx=0.5, rely=0.5, anchor='center')
         
-        tk.Label(
+        self.status_label = tk.Label(
             title_section,
             text="ANALYSIS COMPLETE",
-            font=('Orbitron', 28, 'bold'),
+            font=self.font(28, 'bold'),
             bg=self.colors['bg_secondary'],
             fg=self.colors['primary']
-        ).pack(pady=(5, 2))
+        )
+        self.status_label.pack(pady=(5, 2))
         
         tk.Label(
             title_section,
             text="YOUR PERSONALIZED HEALTH MATRIX",
-            font=('Orbitron', 10),
+            font=self.font(10),
             bg=self.colors['bg_secondary'],
             fg=self.colors['secondary']
         ).pack(pady=(0, 5))
         
+        self.trend_label = tk.Label(
+            title_section,
+            font=self.font(9),
+            bg=self.colors['bg_secondary'],
+            fg=self.colors['text_dim']
+        )
+        self.trend_label.pack()
+        
         # Main content - REDUCED PADDING
-        content = tk.Frame(self.current_page, bg=self.colors['bg'])
+        content = tk.Frame(page, bg=self.colors['bg'])
         content.pack(fill=tk.BOTH, expand=True, padx=50, pady=20)
         
         # Top section - Smaller BMI + 3 calorie cards
-        top_section = tk.Frame(content, bg=self.colors['bg'])
-        top_section.pack(fill=tk.X, pady=(0, 20))
-        
-        # Large BMI Card (left) - REDUCED SIZE
-        self.create_large_bmi_card(top_section).pack(side=tk.LEFT, padx=(0, 15))
-        
-        # Calorie cards container (right)
-        calorie_container = tk.Frame(top_section, bg=self.colors['bg'])
-        calorie_container.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        # 3 Calorie cards in a row - REDUCED SIZE
-        self.create_compact_metric_card(calorie_container, "MAINTENANCE", 
-                                       f"{int(self.maintenance_calories)}", 
-                                       "CALORIES/DAY",
-                                       self.colors['secondary']).pack(side=tk.LEFT, padx=8, fill=tk.BOTH, expand=True)
-        
-        self.create_compact_metric_card(calorie_container, "SURPLUS", 
-                                       f"+{int(self.surplus_calories - self.maintenance_calories)}", 
-                                       "BULK PHASE",
-                                       self.colors['success']).pack(side=tk.LEFT, padx=8, fill=tk.BOTH, expand=True)
-        
-        self.create_compact_metric_card(calorie_container, "DEFICIT", 
-                                       f"-{int(self.maintenance_calories - self.deficit_calories)}", 
-                                       "CUT PHASE",
-                                       self.colors['danger']).pack(side=tk.LEFT, padx=8, fill=tk.BOTH, expand=True)
+        if self.canvas_dashboard:
+            self.dashboard = CanvasDashboard(content, self.colors, self.font)
+            self.dashboard.canvas.pack(fill=tk.X, pady=(0, 20))
+        else:
+            self.dashboard = None
+            self.build_metric_cards(content)
         
         # Bottom section - 3 recommendation columns - MORE SPACE
         rec_section = tk.Frame(content, bg=self.colors['bg'])
@@ -353,68 +587,152 @@ class VexineApp:
         lifestyle_col.grid(row=0, column=2, sticky='nsew', padx=(8, 0))
         
         # Create recommendation sections
-        self.create_recommendation_section(nutrition_col, "🥗 NUTRITION", 
-                                          self.get_nutrition_tips(self.bmi_value, self.goal.get(), 
-                                                                 self.fitness_level.get()))
+        self.nutrition_text = self.create_recommendation_section(nutrition_col, "🥗 NUTRITION", ())
+        self.exercise_text = self.create_recommendation_section(exercise_col, "🏋️ TRAINING", ())
+        self.lifestyle_text = self.create_recommendation_section(lifestyle_col, "🌟 LIFESTYLE", ())
         
-        self.create_recommendation_section(exercise_col, "🏋️ TRAINING", 
-                                          self.get_exercise_tips(self.bmi_value, self.goal.get(), 
-                                                                self.fitness_level.get(), 
-                                                                self.desired_body_type.get()))
+        return page
+    
+    def build_metric_cards(self, content):
+        """BMI and calorie cards as widget trees (see CanvasDashboard for the canvas version)"""
+        top_section = tk.Frame(content, bg=self.colors['bg'])
+        top_section.pack(fill=tk.X, pady=(0, 20))
         
-        self.create_recommendation_section(lifestyle_col, "🌟 LIFESTYLE", 
-                                          self.get_lifestyle_tips(self.fitness_level.get()))
+        # Large BMI Card (left) - REDUCED SIZE
+        self.bmi_card = self.create_large_bmi_card(top_section)
+        self.bmi_card.pack(side=tk.LEFT, padx=(0, 15))
+        
+        # Calorie cards container (right)
+        calorie_container = tk.Frame(top_section, bg=self.colors['bg'])
+        calorie_container.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # 3 Calorie cards in a row - REDUCED SIZE (values filled in by update_results_page)
+        self.maintenance_card = self.create_compact_metric_card(calorie_container, "MAINTENANCE", 
+                                                                "", "CALORIES/DAY",
+                                                                self.colors['secondary'])
+        self.maintenance_card.pack(side=tk.LEFT, padx=8, fill=tk.BOTH, expand=True)
+        
+        self.surplus_card = self.create_compact_metric_card(calorie_container, "SURPLUS", 
+                                                            "", "BULK PHASE",
+                                                            self.colors['success'])
+        self.surplus_card.pack(side=tk.LEFT, padx=8, fill=tk.BOTH, expand=True)
+        
+        self.deficit_card = self.create_compact_metric_card(calorie_container, "DEFICIT", 
+                                                            "", "CUT PHASE",
+                                                            self.colors['danger'])
+        self.deficit_card.pack(side=tk.LEFT, padx=8, fill=tk.BOTH, expand=True)
+    
+    @trace.traced("gui.update_results_page")
+    def update_results_page(self, trend=()):
+        """Refresh results page text and colors in place"""
+        metric_texts = (f"{int(self.maintenance_calories)}",
+                        f"+{int(self.surplus_calories - self.maintenance_calories)}",
+                        f"-{int(self.maintenance_calories - self.deficit_calories)}")
+        if self.dashboard is not None:
+            self.dashboard.update(f"{self.bmi_value:.1f}", self.get_bmi_color(self.bmi_value),
+                                  self.get_bmi_category(self.bmi_value),
+                                  self.get_bmi_range_text(self.bmi_value), metric_texts)
+        else:
+            self.update_bmi_card(self.bmi_card)
+            for card, text in zip((self.maintenance_card, self.surplus_card, self.deficit_card),
+                                  metric_texts):
+                card.value_label.config(text=text)
+        
+        tips = self.tip_renderer.render_result(self.result, self.tip_locale)
+        self.set_recommendation_tips(self.nutrition_text, tips.nutrition)
+        self.set_recommendation_tips(self.exercise_text, tips.exercise)
+        self.set_recommendation_tips(self.lifestyle_text, tips.lifestyle)
+        self.update_trend_label(trend)
+    
+    def open_history(self):
+        """The persistent HistoryStore, or None if it cannot be opened"""
+        if self.history_db is None:
+            try:
+                self.history_db = HistoryStore(os.environ.get("VEXINE_HISTORY", DEFAULT_HISTORY_PATH))
+            except (OSError, sqlite3.Error):
+                self.history_db = False
+        return self.history_db or None
+    
+    def record_history(self, result):
+        """Save an analysis to the persistent history"""
+        history_db = self.open_history()
+        if history_db is not None:
+            history_db.record(result, user=self.history_user)
+            history_db.flush()
+    
+    def trend_points(self):
+        """The last two BMI values with their 7-run averages"""
+        history_db = self.open_history()
+        return history_db.rolling_average(self.history_user, "bmi", window=7, limit=2) if history_db else []
+    
+    def update_trend_label(self, points):
+        """Show the BMI change since the last analysis and its rolling average"""
+        if len(points) < 2:
+            text = "FIRST ANALYSIS RECORDED" if points else ""
+        else:
+            previous, current = points
+            text = (f"BMI TREND {previous.value:.1f} → {current.value:.1f}   ·   "
+                    f"7-RUN AVERAGE {current.average:.1f}")
+        self.trend_label.config(text=text)
     
     def recalculate(self):
         """Reset inputs and return to input page"""
         self.reset_inputs()
         self.show_input_page()
     
+    @trace.traced("gui.create_large_bmi_card")
     def create_large_bmi_card(self, parent):
         """Create large BMI display card - REDUCED SIZE"""
         card = tk.Frame(parent, bg=self.colors['card'], width=280, height=200)
         card.pack_propagate(False)
         
         # Top colored line
-        color = self.get_bmi_color(self.bmi_value)
-        tk.Frame(card, bg=color, height=4).pack(fill=tk.X)
+        card.color_bar = tk.Frame(card, height=4)
+        card.color_bar.pack(fill=tk.X)
         
         tk.Label(
             card,
             text="BMI INDEX",
-            font=('Orbitron', 11, 'bold'),
+            font=self.font(11, 'bold'),
             bg=self.colors['card'],
             fg=self.colors['text_dim']
         ).pack(pady=(20, 5))
         
-        tk.Label(
+        card.value_label = tk.Label(
             card,
-            text=f"{self.bmi_value:.1f}",
-            font=('Orbitron', 56, 'bold'),
-            bg=self.colors['card'],
-            fg=color
-        ).pack(pady=10)
+            font=self.font(56, 'bold'),
+            bg=self.colors['card']
+        )
+        card.value_label.pack(pady=10)
         
-        tk.Label(
+        card.category_label = tk.Label(
             card,
-            text=self.get_bmi_category(self.bmi_value),
-            font=('Orbitron', 13, 'bold'),
+            font=self.font(13, 'bold'),
             bg=self.colors['card'],
             fg=self.colors['text']
-        ).pack()
+        )
+        card.category_label.pack()
         
         # BMI range indicator
-        range_text = self.get_bmi_range_text(self.bmi_value)
-        tk.Label(
+        card.range_label = tk.Label(
             card,
-            text=range_text,
-            font=('Orbitron', 8),
+            font=self.font(8),
             bg=self.colors['card'],
             fg=self.colors['text_dim']
-        ).pack(pady=(5, 15))
+        )
+        card.range_label.pack(pady=(5, 15))
         
+        self.update_bmi_card(card)
         return card
     
+    def update_bmi_card(self, card):
+        """Show the current BMI on a card from create_large_bmi_card"""
+        color = self.get_bmi_color(self.bmi_value)
+        card.color_bar.config(bg=color)
+        card.value_label.config(text=f"{self.bmi_value:.1f}", fg=color)
+        card.category_label.config(text=self.get_bmi_category(self.bmi_value))
+        card.range_label.config(text=self.get_bmi_range_text(self.bmi_value))
+    
     def create_compact_metric_card(self, parent, title, value, subtitle, color):
         """Create compact metric display card - REDUCED SIZE"""
         card = tk.Frame(parent, bg=self.colors['card'], height=110)
@@ -426,23 +744,24 @@ class VexineApp:
         tk.Label(
             card,
             text=title,
-            font=('Orbitron', 8, 'bold'),
+            font=self.font(8, 'bold'),
             bg=self.colors['card'],
             fg=self.colors['text_dim']
         ).pack(pady=(10, 3))
         
-        tk.Label(
+        card.value_label = tk.Label(
             card,
             text=value,
-            font=('Orbitron', 22, 'bold'),
+            font=self.font(22, 'bold'),
             bg=self.colors['card'],
             fg=color
-        ).pack(pady=3)
+        )
+        card.value_label.pack(pady=3)
         
         tk.Label(
             card,
             text=subtitle,
-            font=('Orbitron', 7),
+            font=self.font(7),
             bg=self.colors['card'],
             fg=self.colors['text_dim']
         ).pack(pady=(0, 8))
@@ -464,7 +783,7 @@ class VexineApp:
         tk.Label(
             card,
             text=title,
-            font=('Orbitron', 12, 'bold'),
+            font=self.font(12, 'bold'),
             bg=self.colors['card'],
             fg=color,
             pady=15
@@ -485,7 +804,7 @@ class VexineApp:
             tk.Label(
                 input_frame,
                 text=label_text,
-                font=('Orbitron', 9, 'bold'),
+                font=self.font(9, 'bold'),
                 bg=self.colors['card'],
                 fg=self.colors['text_dim'],
                 width=10
@@ -497,7 +816,7 @@ class VexineApp:
                 to=to,
                 textvariable=variable,
                 width=12,
-                font=('Orbitron', 11, 'bold'),
+                font=self.font(11, 'bold'),
                 bg='#000000',
                 fg=self.colors['secondary'],
                 buttonbackground=self.colors['card_border'],
@@ -511,7 +830,7 @@ class VexineApp:
                 tk.Label(
                     input_frame,
                     text=unit,
-                    font=('Orbitron', 9),
+                    font=self.font(9),
                     bg=self.colors['card'],
                     fg=self.colors['text_dim']
                 ).pack(side=tk.LEFT, padx=5)
@@ -529,7 +848,7 @@ class VexineApp:
         tk.Label(
             card,
             text=title,
-            font=('Orbitron', 12, 'bold'),
+            font=self.font(12, 'bold'),
             bg=self.colors['card'],
             fg=self.colors['secondary'],
             pady=15
@@ -548,7 +867,7 @@ class VexineApp:
                 text=text,
                 variable=variable,
                 value=value,
-                font=('Orbitron', 10, 'bold'),
+                font=self.font(10, 'bold'),
                 bg=self.colors['card'],
                 fg=self.colors['secondary'],
                 activebackground=self.colors['card'],
@@ -562,12 +881,15 @@ class VexineApp:
     
     def create_neon_dropdown(self, parent, variable, values):
         """Create neon styled dropdown with blue text on black background"""
+        if not self.dropdown_style_ready:
+            self.configure_dropdown_style()
+        
         combo = ttk.Combobox(
             parent,
             textvariable=variable,
             values=values,
             state='readonly',
-            font=('Orbitron', 10, 'bold'),
+            font=self.font(10, 'bold'),
             style='Custom.TCombobox',
             width=20
         )
@@ -575,8 +897,9 @@ class VexineApp:
         
         tk.Frame(parent, bg=self.colors['bg'], height=15).pack()
     
+    @trace.traced("gui.create_recommendation_section")
     def create_recommendation_section(self, parent, title, tips):
-        """Create scrollable recommendation section"""
+        """Create scrollable recommendation section, returning its Text widget"""
         # Container
         container = tk.Frame(parent, bg=self.colors['card'])
         container.pack(fill=tk.BOTH, expand=True)
@@ -588,7 +911,7 @@ class VexineApp:
         tk.Label(
             container,
             text=title,
-            font=('Orbitron', 11, 'bold'),
+            font=self.font(11, 'bold'),
             bg=self.colors['card'],
             fg=self.colors['accent'],
             pady=10
@@ -606,10 +929,11 @@ class VexineApp:
         text_widget = tk.Text(
             text_frame,
             wrap=tk.WORD,
-            font=('Consolas', 8),
+            font=self.font(8, family=MONO_FONT_FAMILY),
             bg=self.colors['bg_secondary'],
             fg=self.colors['text'],
-            yscrollcommand=scrollbar.set,
+            yscrollcommand=lambda first, last: self.on_tips_scrolled(text_widget, scrollbar,
+                                                                     first, last),
             relief=tk.FLAT,
             padx=8,
             pady=8,
@@ -620,220 +944,169 @@ class VexineApp:
         # Configure scrollbar
         scrollbar.config(command=text_widget.yview)
         
-        # Insert tips
-        for tip in tips:
-            text_widget.insert(tk.END, f"▸ {tip}\n\n")
-        
+        text_widget.tips = None
+        text_widget.rendered = 0
+        text_widget.render_pending = False
+        self.set_recommendation_tips(text_widget, tips)
+        return text_widget
+    
+    def set_recommendation_tips(self, text_widget, tips):
+        """Replace the tips shown in a recommendation Text widget
+        
+        Only the first batch is inserted now; the rest follow on scroll.
+        """
+        if text_widget.tips == tips:
+            return
+        text_widget.tips = tips
+        text_widget.rendered = 0
+        text_widget.config(state=tk.NORMAL)
+        text_widget.delete('1.0', tk.END)
+        text_widget.config(state=tk.DISABLED)
+        self.render_more_tips(text_widget)
+    
+    def render_more_tips(self, text_widget):
+        """Append the next batch of tips with a single insert"""
+        text_widget.render_pending = False
+        start = text_widget.rendered
+        batch = text_widget.tips[start:start + TIP_RENDER_BATCH]
+        if not batch:
+            return
+        text_widget.rendered = start + len(batch)
+        text_widget.config(state=tk.NORMAL)
+        text_widget.insert(tk.END, "".join(f"▸ {tip}\n\n" for tip in batch))
         text_widget.config(state=tk.DISABLED)
     
+    def on_tips_scrolled(self, text_widget, scrollbar, first, last):
+        """Update the scrollbar and queue another batch near the end"""
+        scrollbar.set(first, last)
+        if (float(last) >= 1 - TIP_PREFETCH and not text_widget.render_pending
+                and text_widget.rendered < len(text_widget.tips)):
+            text_widget.render_pending = True
+            self.root.after_idle(self.render_more_tips, text_widget)
+    
+    def get_profile(self):
+        """Snapshot the input variables as a HealthProfile"""
+        return HealthProfile(
+            age=self.age.get(),
+            gender=self.gender.get(),
+            height_cm=self.height_cm.get(),
+            weight_kg=self.weight_kg.get(),
+            current_body_type=self.current_body_type.get(),
+            desired_body_type=self.desired_body_type.get(),
+            fitness_level=self.fitness_level.get(),
+            goal=self.goal.get(),
+            activity_level=self.activity_level.get()
+        )
+    
+    def apply_result(self, result):
+        """Store an engine result on the app"""
+        self.result = result
+        self.bmi_value = result.bmi
+        self.maintenance_calories = result.maintenance_calories
+        self.surplus_calories = result.surplus_calories
+        self.deficit_calories = result.deficit_calories
+    
+    @trace.traced("gui.calculate_and_proceed")
     def calculate_and_proceed(self):
-        """Calculate BMI and calories, then show results"""
+        """Start the analysis on the worker; poll_worker shows the results"""
         try:
-            # Get values
-            height_m = self.height_cm.get() / 100
-            weight = self.weight_kg.get()
-            age = self.age.get()
-            gender = self.gender.get()
-            activity = self.activity_level.get()
-            
-            # Validate
-            if height_m <= 0 or weight <= 0:
-                messagebox.showerror("ERROR", "Invalid height or weight values!")
-                return
-            
-            # Calculate BMI
-            self.bmi_value = weight / (height_m ** 2)
-            
-            # Calculate calories using Mifflin-St Jeor Equation
-            if gender == "male":
-                bmr = (10 * weight) + (6.25 * self.height_cm.get()) - (5 * age) + 5
+            # The live profile is already parsed unless an update is pending
+            if self.live_fields:
+                self.apply_live_changes()
+            if self.live.valid and not self.live_unparsed:
+                self.worker.submit(self.run_analysis, self.live.profile)
             else:
-                bmr = (10 * weight) + (6.25 * self.height_cm.get()) - (5 * age) - 161
-            
-            # Activity multipliers
-            activity_multipliers = {
-                "sedentary": 1.2,
-                "light": 1.375,
-                "moderate": 1.55,
-                "active": 1.725,
-                "very active": 1.9
-            }
-            
-            multiplier = activity_multipliers.get(activity, 1.55)
-            self.maintenance_calories = bmr * multiplier
-            self.surplus_calories = self.maintenance_calories + 300
-            self.deficit_calories = self.maintenance_calories - 500
-            
-            # Show results page
-            self.show_results_page()
-            
+                self.worker.submit(self.run_analysis, self.get_profile())
         except Exception as e:
             messagebox.showerror("ERROR", f"Calculation failed: {str(e)}")
+            return
+        
+        self.worker_polls = 0
+        if self.worker_after is None:
+            self.worker_after = self.root.after(WORKER_POLL_MS, self.poll_worker)
+    
+    @trace.traced("worker.run_analysis")
+    def run_analysis(self, profile):
+        """Worker job: analyze through the cache, record history, fetch the trend"""
+        result = self.analysis_cache.analyze(profile)
+        # A cancelled or superseded analysis is discarded, so it is not recorded either
+        if self.worker.stale():
+            return result, None
+        self.record_history(result)
+        return result, self.trend_points()
+    
+    def poll_worker(self):
+        """Collect finished analyses; keeps polling while one is running"""
+        self.worker_after = None
+        for outcome in self.worker.poll():
+            self.finish_analysis(outcome)
+        if self.worker.busy:
+            self.worker_polls += 1
+            if self.worker_polls == 1:
+                self.show_results_page()
+            else:
+                self.show_busy(True)
+            self.worker_after = self.root.after(WORKER_POLL_MS, self.poll_worker)
+    
+    @trace.traced("gui.finish_analysis")
+    def finish_analysis(self, outcome):
+        """Show a worker outcome, or report its error on the input page"""
+        if outcome.error is not None:
+            self.show_busy(False)
+            self.show_input_page()
+            if isinstance(outcome.error, InvalidProfileError):
+                messagebox.showerror("ERROR", str(outcome.error))
+            else:
+                messagebox.showerror("ERROR", f"Calculation failed: {str(outcome.error)}")
+            return
+        result, trend = outcome.value
+        self.apply_result(result)
+        if self.results_page is None:
+            self.results_page = self.build_results_page()
+        self.update_results_page(trend)
+        self.show_results_page()
     
     def get_bmi_category(self, bmi):
         """Get BMI category"""
-        if bmi < 18.5:
-            return "UNDERWEIGHT"
-        elif 18.5 <= bmi < 25:
-            return "NORMAL"
-        elif 25 <= bmi < 30:
-            return "OVERWEIGHT"
-        else:
-            return "OBESE"
+        return engine.bmi_category(bmi)
     
     def get_bmi_color(self, bmi):
         """Get color based on BMI"""
-        if bmi < 18.5:
-            return self.colors['secondary']
-        elif 18.5 <= bmi < 25:
-            return self.colors['success']
-        elif 25 <= bmi < 30:
-            return self.colors['warning']
-        else:
-            return self.colors['danger']
+        return (self.colors['secondary'], self.colors['success'],
+                self.colors['warning'], self.colors['danger'])[engine.bmi_band(bmi)]
     
     def get_bmi_range_text(self, bmi):
         """Get BMI range information"""
-        if bmi < 18.5:
-            return "< 18.5 Range"
-        elif 18.5 <= bmi < 25:
-            return "18.5 - 24.9 Range"
-        elif 25 <= bmi < 30:
-            return "25.0 - 29.9 Range"
-        else:
-            return "≥ 30.0 Range"
+        return engine.bmi_range_text(bmi)
     
     def get_nutrition_tips(self, bmi, goal, fitness_level):
         """Generate nutrition tips"""
-        tips = []
-        
-        tips.append("Hydration: 3-4 liters of water daily minimum")
-        tips.append("Meal frequency: 5-6 small meals for optimal metabolism")
-        
-        if bmi < 18.5:
-            tips.append("Caloric surplus: +300-500 calories above maintenance")
-            tips.append("Protein: 1.8-2.2g per kg bodyweight daily")
-            tips.append("Healthy fats: Nuts, avocados, olive oil, fatty fish")
-            tips.append("Dense carbs: Oats, rice, pasta, sweet potatoes")
-        elif bmi >= 30:
-            tips.append("Caloric deficit: -500-750 calories below maintenance")
-            tips.append("Protein: 1.6-2.0g per kg to preserve muscle mass")
-            tips.append("Eliminate: Sugary drinks, processed foods, refined carbs")
-            tips.append("High volume: Fill 50% of plate with vegetables")
-            tips.append("Meal timing: Stop eating 3 hours before bed")
-        elif bmi >= 25:
-            tips.append("Moderate deficit: -300-500 calories daily")
-            tips.append("Protein: 1.4-1.8g per kg bodyweight")
-            tips.append("Complex carbs: Switch to whole grains, reduce refined carbs")
-            tips.append("Smart snacking: Greek yogurt, nuts (portioned), fruits")
-        else:
-            tips.append("Balanced macros: 40% carbs / 30% protein / 30% fats")
-            tips.append("Protein: 1.2-1.6g per kg for maintenance")
-            tips.append("Food variety: Include all food groups in moderation")
-        
-        if goal == "gain muscle":
-            tips.append("Post-workout: 30g protein within 30 mins")
-            tips.append("Pre-workout carbs: Oats, banana, rice for energy")
-            tips.append("Protein boost: Increase to 2.0-2.2g per kg")
-        elif goal == "lose weight":
-            tips.append("Tracking: Use MyFitnessPal or similar app")
-            tips.append("Fiber: 30g+ daily from vegetables and fruits")
-            tips.append("Sodium: Limit to reduce water retention")
-        
-        if fitness_level == "advanced":
-            tips.append("Nutrient timing: Carb cycling on training days")
-            tips.append("Supplements: Consider creatine, protein powder, BCAAs")
-        
-        return tips
+        return engine.get_nutrition_tips(bmi, goal, fitness_level)
     
     def get_exercise_tips(self, bmi, goal, fitness_level, desired_body):
         """Generate exercise tips"""
-        tips = []
-        
-        if fitness_level == "beginner":
-            tips.append("Frequency: 3-4 sessions per week, 30-45 mins each")
-            tips.append("Cardio foundation: Walking/jogging 20-30 mins, 3x weekly")
-            tips.append("Bodyweight basics: Squats, push-ups, planks (2x10 reps)")
-            tips.append("Form first: Master technique before adding weight")
-            tips.append("Recovery: 48 hours rest between training same muscles")
-        elif fitness_level == "intermediate":
-            tips.append("Frequency: 4-5 sessions weekly, 45-60 mins each")
-            tips.append("Split training: Upper/lower or push/pull/legs")
-            tips.append("Cardio: 30-40 mins, 3x weekly (running, cycling, swimming)")
-            tips.append("Progressive overload: Increase weight 2.5-5% weekly")
-        else:
-            tips.append("Frequency: 5-6 sessions weekly, varied intensity")
-            tips.append("Advanced splits: PPL or bro-split with periodization")
-            tips.append("Intensity techniques: Drop sets, supersets, rest-pause")
-            tips.append("Deload week: Every 4-6 weeks reduce volume by 50%")
-        
-        if bmi < 18.5:
-            tips.append("Strength focus: 70% resistance, 30% cardio")
-            tips.append("Compounds: Deadlifts, squats, bench press, rows (4x6-8)")
-            tips.append("Cardio limit: 2x weekly maximum, 20 mins sessions")
-        elif bmi >= 30:
-            tips.append("Low-impact cardio: Swimming, cycling, elliptical")
-            tips.append("Duration: Start 15-20 mins, progress to 45 mins")
-            tips.append("Resistance: 2x weekly to preserve muscle mass")
-            tips.append("Flexibility: Daily stretching or yoga for mobility")
-        elif bmi >= 25:
-            tips.append("HIIT training: 20-30 mins, 3-4x weekly")
-            tips.append("Resistance: 3x weekly full-body or split routine")
-            tips.append("Active recovery: Walking, swimming on rest days")
-        
-        if desired_body == "muscular":
-            tips.append("Heavy compounds: 4-6 reps, 4-5 sets, 80-85% 1RM")
-            tips.append("Core lifts: Deadlift, squat, bench, OHP, rows")
-            tips.append("Time under tension: Control eccentric phase (3 secs)")
-        elif desired_body == "lean":
-            tips.append("Circuit training: 12-15 reps, minimal rest (30s)")
-            tips.append("Metabolic conditioning: Burpees, kettlebell swings")
-            tips.append("HIIT: 30s work / 30s rest intervals, 20 mins")
-        elif desired_body == "athletic":
-            tips.append("Functional training: TRX, kettlebells, battle ropes")
-            tips.append("Plyometrics: Box jumps, jump squats, burpees")
-            tips.append("Agility: Ladder drills, cone drills, sprint intervals")
-        
-        if goal == "lose weight":
-            tips.append("Calorie burn target: 300-500 per session")
-            tips.append("Daily steps: Aim for 10,000+ via pedometer")
-        elif goal == "gain muscle":
-            tips.append("Cardio minimal: 2x weekly max to preserve mass")
-            tips.append("Progressive overload: Track and beat lifts weekly")
-        
-        return tips
+        return engine.get_exercise_tips(bmi, goal, fitness_level, desired_body)
     
     def get_lifestyle_tips(self, fitness_level):
         """Generate lifestyle tips"""
-        tips = [
-            "Sleep priority: 7-9 hours nightly for recovery and hormones",
-            "Stress management: 10 mins daily meditation or breathing",
-            "Progress tracking: Weekly photos, measurements, weight log",
-            "Consistency: Results visible after 8-12 weeks minimum",
-            "Accountability: Training partner or coach recommended",
-            "Meal prep: Prepare 3 days in advance to avoid bad choices",
-            "Listen to body: Rest when fatigued to prevent injury",
-            "Supplementation: Multivitamin, Vitamin D, Omega-3 basics"
-        ]
-        
-        if fitness_level == "beginner":
-            tips.append("Habit formation: Start small, build gradually")
-            tips.append("No comparison: Focus on personal progress only")
-            tips.append("Learning phase: Watch form videos, ask for help")
-        elif fitness_level == "advanced":
-            tips.append("Coaching: Consider hiring specialist for optimization")
-            tips.append("Periodization: Plan mesocycles to avoid plateaus")
-            tips.append("Recovery tools: Foam rolling, massage, ice baths")
-            tips.append("Advanced metrics: Track HRV, sleep quality, readiness")
-        
-        return tips
+        return engine.get_lifestyle_tips(fitness_level)
 
 
-def main():
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    
+    # Headless subcommands
+    if argv and argv[0] == "batch":
+        import vexine_batch
+        return vexine_batch.main(argv[1:])
+    if argv and argv[0] == "serve":
+        import vexine_server
+        return vexine_server.main(argv[1:])
+    
     root = tk.Tk()
     app = VexineApp(root)
     root.mainloop()
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,848 @@
+"""Streaming batch scoring for profile files.
+
+Reads profiles from CSV or Parquet in fixed-size chunks, scores each chunk
+with the vectorized cohort code and appends the results to the output
+file, so memory use does not grow with the input size.
+
+    python vexine.py batch profiles.csv results.parquet --chunk-size 100000
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from functools import partial
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import vexine_engine as engine
+from vexine_engine import HealthProfile
+from vexine_cohort import (
+    score_cohort, bmi_categories, encode_options, recommendation_keys,
+    tip_bitsets, group_keys, TIP_BITSET_WORDS
+)
+from vexine_store import (
+    ProfileStore, StoreWriter, COLUMN_TYPECODES, STORE_SUFFIX, INVALID_BAND, INVALID_RECOMMENDATION
+)
+from vexine_validate import validate_profile, describe
+
+
+DEFAULT_CHUNK_SIZE = 65536
+
+# Input columns, in HealthProfile order; missing columns take the defaults
+PROFILE_COLUMNS = tuple(f.name for f in fields(HealthProfile))
+PROFILE_DEFAULTS = HealthProfile()
+NUMERIC_COLUMNS = ("age", "height_cm", "weight_kg")
+# Optional measured body fat for the lean-mass BMR formulas; blank = estimate
+BODY_FAT_COLUMN = "body_fat_pct"
+# Optional unit columns read by the validation stage (see vexine_validate)
+UNIT_COLUMNS = ("height_unit", "weight_unit")
+ENUM_COLUMNS = {
+    "gender": engine.GENDERS,
+    "current_body_type": engine.CURRENT_BODY_TYPES,
+    "desired_body_type": engine.DESIRED_BODY_TYPES,
+    "fitness_level": engine.FITNESS_LEVELS,
+    "goal": engine.GOALS,
+    "activity_level": engine.ACTIVITY_LEVELS
+}
+
+METRIC_COLUMNS = (
+    "bmi", "bmr", "maintenance_calories", "surplus_calories", "deficit_calories"
+)
+RESULT_COLUMNS = (
+    "bmi", "bmi_category", "bmr",
+    "maintenance_calories", "surplus_calories", "deficit_calories"
+)
+
+# Tip output modes: full text, tip-ID bitset words, or the recommendation key
+TIP_COLUMNS = {
+    "text": tuple(f"{section}_tips" for section in engine.TIP_SECTIONS),
+    "bitset": tuple(f"tip_bits_{word}" for word in range(TIP_BITSET_WORDS)),
+    "key": ("recommendation",)
+}
+DEFAULT_TIP_MODE = "text"
+
+# Separator used when a tip list is written to a single text column
+TIP_SEPARATOR = " | "
+
+# Rejected-rows output: input row number, reason code and names, raw inputs
+REJECT_COLUMNS = ("row", "reason_code", "reasons") + PROFILE_COLUMNS + (BODY_FAT_COLUMN,) + UNIT_COLUMNS
+# Arrow types of the rejects columns (the rest are strings)
+REJECT_TYPES = dict(dict.fromkeys(REJECT_COLUMNS, "string"), row="int64", reason_code="uint32")
+
+# Chunk entry holding each row's 0-based data row number in the input file
+SOURCE_ROW_COLUMN = "_source_row"
+
+
+class BatchError(Exception):
+    """Raised for unusable batch inputs or outputs"""
+
+
+# Sources: each yields raw pieces of up to chunk_size rows, cheap to read and
+# to pickle; parse_*_piece turns one into (column chunk or None, row count).
+# Column chunks are dicts of column name -> sequence; SOURCE_ROW_COLUMN
+# numbers their rows from the start of the piece.
+
+def csv_pieces(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield (header, text) blocks of up to chunk_size CSV records
+
+    Blocks are only split at line ends outside quotes, so quoted fields may
+    span lines; the text is parsed later by parse_csv_piece.
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        lines = []
+        records = 0
+        quoted = False
+        header = None
+        for line in f:
+            lines.append(line)
+            if line.count('"') % 2:
+                quoted = not quoted
+            if quoted:
+                continue
+            if header is None:
+                header = [name.strip() for name in next(csv.reader(lines), [])]
+                lines = []
+                continue
+            records += 1
+            if records == chunk_size:
+                yield header, "".join(lines)
+                lines = []
+                records = 0
+        if lines and header is not None:
+            yield header, "".join(lines)
+
+
+def parse_csv_piece(piece):
+    """Column chunk of one csv_pieces block
+
+    Blank lines are skipped. Short rows are padded with empty cells, so
+    their missing fields read as blank (NaN for numbers) rather than
+    shortening every column of the chunk.
+    """
+    header, text = piece
+    rows = list(csv.reader(io.StringIO(text, newline='')))
+    kept = [i for i, row in enumerate(rows) if any(cell.strip() for cell in row)]
+    if not kept:
+        return None, len(rows)
+    width = len(header)
+    padding = [""] * width
+    columns = list(zip(*(rows[i] if len(rows[i]) >= width else rows[i] + padding[len(rows[i]):]
+                         for i in kept)))
+    chunk = {name: columns[i] for i, name in enumerate(header)}
+    chunk[SOURCE_ROW_COLUMN] = np.array(kept, dtype=np.int64)
+    return chunk, len(rows)
+
+
+def parquet_pieces(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield Arrow record batches of up to chunk_size rows"""
+    pq = _import_parquet()
+    yield from pq.ParquetFile(path).iter_batches(batch_size=chunk_size)
+
+
+def parse_parquet_piece(batch):
+    """Column chunk of one Arrow record batch"""
+    if not batch.num_rows:
+        return None, 0
+    chunk = {name: batch.column(i).to_numpy(zero_copy_only=False)
+             for i, name in enumerate(batch.schema.names)}
+    chunk[SOURCE_ROW_COLUMN] = np.arange(batch.num_rows, dtype=np.int64)
+    return chunk, batch.num_rows
+
+
+def open_source(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """(pieces, parse) for a CSV or Parquet input path"""
+    if _is_parquet(path):
+        return parquet_pieces(path, chunk_size), parse_parquet_piece
+    return csv_pieces(path, chunk_size), parse_csv_piece
+
+
+# Readers: each yields column chunks, numbering rows from the start of the
+# file (0-based data rows; the CSV header is not counted, blank lines are)
+
+def _read_chunks(pieces, parse):
+    start = 0
+    for piece in pieces:
+        chunk, rows = parse(piece)
+        if chunk is not None:
+            chunk[SOURCE_ROW_COLUMN] += start
+            yield chunk
+        start += rows
+
+
+def read_csv_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield column chunks from a CSV file with a header row (see parse_csv_piece)"""
+    return _read_chunks(csv_pieces(path, chunk_size), parse_csv_piece)
+
+
+def read_parquet_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield column chunks from a Parquet file"""
+    return _read_chunks(parquet_pieces(path, chunk_size), parse_parquet_piece)
+
+
+# Writers: write(columns) appends one chunk, close() finishes the file.
+# write() is format_chunk(columns, chunk), which can run in a worker process,
+# followed by write_formatted() of its result.
+
+class CsvResultWriter:
+    """Append result chunks to a CSV file"""
+
+    def __init__(self, path, columns):
+        self.columns = columns
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        csv.writer(self._file).writerow(columns)
+
+    @staticmethod
+    def format_chunk(columns, chunk):
+        """The chunk's rows as CSV text (what csv.writer would write)"""
+        cells = [_csv_cells(chunk[name]) for name in columns]
+        if not cells or not cells[0]:
+            return ""
+        return CSV_LINE_END.join(map(",".join, zip(*cells))) + CSV_LINE_END
+
+    def write_formatted(self, text):
+        self._file.write(text)
+
+    def write(self, chunk):
+        self.write_formatted(self.format_chunk(self.columns, chunk))
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetResultWriter:
+    """Append result chunks to a Parquet file, one row group per chunk
+
+    types optionally maps columns to Arrow type names; they are only used
+    for the schema of an empty file when no chunk was written (null otherwise).
+    """
+
+    def __init__(self, path, columns, types=None):
+        self.columns = columns
+        self.types = types or {}
+        self._path = path
+        self._writer = None
+
+    @staticmethod
+    def format_chunk(columns, chunk):
+        """The chunk as an Arrow table"""
+        import pyarrow as pa
+        return pa.table({name: chunk[name] for name in columns})
+
+    def write_formatted(self, table):
+        if self._writer is None:
+            self._writer = _import_parquet().ParquetWriter(self._path, table.schema)
+        self._writer.write_table(table)
+
+    def write(self, chunk):
+        self.write_formatted(self.format_chunk(self.columns, chunk))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            return
+        import pyarrow as pa
+        schema = pa.schema([(name, pa.type_for_alias(self.types.get(name, "null")))
+                            for name in self.columns])
+        _import_parquet().write_table(schema.empty_table(), self._path)
+
+
+class StoreResultWriter:
+    """Append result chunks to a memory-mappable store file (see vexine_store)"""
+
+    def __init__(self, path, columns):
+        self.columns = columns
+        self._writer = StoreWriter(path)
+
+    @staticmethod
+    def format_chunk(columns, chunk):
+        """The chunk's store columns, with option strings encoded"""
+        columns = {name: chunk[name] for name in columns}
+        for name, options in ENUM_COLUMNS.items():
+            columns[name] = encode_options(columns[name].astype(str), options, name)
+        return columns
+
+    def write_formatted(self, columns):
+        self._writer.extend_columns(columns)
+
+    def write(self, chunk):
+        self.write_formatted(self.format_chunk(self.columns, chunk))
+
+    def close(self):
+        self._writer.close()
+
+
+class RejectWriter:
+    """Rejected-rows side output (CSV or Parquet) with running reason counts"""
+
+    def __init__(self, path):
+        if _is_store(path):
+            raise BatchError("Rejected rows must be written to a .csv or .parquet file")
+        self.path = path
+        self.rows = 0
+        self.reason_counts = {}
+        self._writer = open_writer(path, REJECT_COLUMNS, REJECT_TYPES)
+
+    def write(self, chunk, result, offset):
+        """Write the rejected rows of one validated chunk
+
+        Rows are numbered by the chunk's SOURCE_ROW_COLUMN when the reader
+        provides one, else from the chunk start; offset is added to either.
+        """
+        rejected = reject_columns(chunk, result)
+        if rejected is not None:
+            self.write_columns(*rejected, offset)
+
+    def write_columns(self, columns, reason_counts, offset=0):
+        """Write reject_columns() output, adding offset to its row numbers"""
+        columns["row"] = columns["row"] + offset
+        self._writer.write(columns)
+        self.rows += len(columns["row"])
+        for name, count in reason_counts.items():
+            self.reason_counts[name] = self.reason_counts.get(name, 0) + count
+
+    def close(self):
+        self._writer.close()
+
+
+CSV_LINE_END = "\r\n"
+_CSV_SPECIAL = frozenset(',"\r\n')
+
+
+def _csv_cell(value):
+    """One value as a minimally quoted CSV cell"""
+    if value is None:
+        return ""
+    if not isinstance(value, str):
+        return repr(value) if isinstance(value, float) else str(value)
+    if _CSV_SPECIAL.isdisjoint(value):
+        return value
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _csv_cells(values):
+    """A column as CSV cells; repeated values (tip texts, options) are escaped once"""
+    kind = values.dtype.kind if isinstance(values, np.ndarray) else 'O'
+    # Plain Python values format much faster than NumPy scalars
+    values = _as_list(values)
+    if kind == 'f':
+        return list(map(repr, values))
+    if kind in 'iub':
+        return list(map(str, values))
+    cache = {}
+    cells = []
+    for value in values:
+        cell = cache.get(value)
+        if cell is None:
+            cell = cache[value] = _csv_cell(value)
+        cells.append(cell)
+    return cells
+
+
+def reject_columns(chunk, result):
+    """(REJECT_COLUMNS columns, reason counts) of a validated chunk's rejects, or None"""
+    rows = result.rejected
+    if not len(rows):
+        return None
+    codes = result.reasons[rows]
+    # Describe each distinct code once
+    unique_codes, inverse = np.unique(codes, return_inverse=True)
+    names = np.array([describe(code) for code in unique_codes.tolist()], dtype=object)
+    source_rows = chunk.get(SOURCE_ROW_COLUMN)
+    numbers = rows.astype(np.int64) if source_rows is None else source_rows[rows]
+    columns = {"row": numbers, "reason_code": codes, "reasons": names[inverse]}
+    for name in REJECT_COLUMNS[3:]:
+        raw = chunk.get(name)
+        if raw is None:
+            columns[name] = np.full(len(rows), "", dtype=object)
+        else:
+            columns[name] = np.array(["" if value is None else str(value)
+                                      for value in np.asarray(raw, dtype=object)[rows].tolist()],
+                                     dtype=object)
+    return columns, result.reason_counts()
+
+
+def _as_list(values):
+    return values.tolist() if isinstance(values, np.ndarray) else values
+
+
+def _import_parquet():
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise BatchError("Parquet support requires pyarrow (pip install pyarrow)")
+    return pq
+
+
+def _is_parquet(path):
+    return str(path).lower().endswith(('.parquet', '.pq'))
+
+
+def open_reader(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Chunk iterator for a CSV or Parquet input path"""
+    return _read_chunks(*open_source(path, chunk_size))
+
+
+def _is_store(path):
+    return str(path).lower().endswith(STORE_SUFFIX)
+
+
+def open_writer(path, columns, types=None):
+    """Result writer for a CSV, Parquet or store (.vxs) output path
+
+    types (column -> Arrow type name) gives an empty Parquet file its schema.
+    """
+    if _is_parquet(path):
+        return ParquetResultWriter(path, columns, types)
+    if _is_store(path):
+        return StoreResultWriter(path, columns)
+    return CsvResultWriter(path, columns)
+
+
+# Scoring
+
+def _to_float(values):
+    """Convert a column to float64; unparsable entries become NaN"""
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        out = np.empty(len(values), dtype=np.float64)
+        for i, value in enumerate(values):
+            try:
+                out[i] = float(value)
+            except (TypeError, ValueError):
+                out[i] = np.nan
+        return out
+
+
+def normalize_chunk(chunk):
+    """Fill in missing profile columns and convert numeric ones"""
+    n = len(next(iter(chunk.values()))) if chunk else 0
+    profile = {}
+    for name in PROFILE_COLUMNS:
+        values = chunk.get(name)
+        if values is None:
+            values = [getattr(PROFILE_DEFAULTS, name)] * n
+        if name in NUMERIC_COLUMNS:
+            values = _to_float(values)
+        else:
+            values = np.asarray(values, dtype=object)
+        profile[name] = values
+    if BODY_FAT_COLUMN in chunk:
+        profile[BODY_FAT_COLUMN] = _to_float(chunk[BODY_FAT_COLUMN])
+    return profile
+
+
+def encode_profile(profile):
+    """Compact numeric form of normalized profile columns
+
+    Numeric fields stay float64; option strings become uint8 codes (see
+    vexine_cohort.encode_options). This is what gets shipped to workers.
+    """
+    encoded = {name: profile[name] for name in NUMERIC_COLUMNS + (BODY_FAT_COLUMN,) if name in profile}
+    for name, options in ENUM_COLUMNS.items():
+        encoded[name] = encode_options(profile[name].astype(str), options, name)
+    return encoded
+
+
+def score_encoded(encoded, formula=engine.DEFAULT_BMR_FORMULA):
+    """Score encoded profile columns into compact result arrays
+
+    formula names the BMR equation (see vexine_engine.BMR_FORMULAS). Tips
+    are represented by recommendation, an index into
+    vexine_engine.RECOMMENDATION_TABLE. Rows that cannot be fully scored
+    (non-positive or missing height or weight, missing age, or a body fat
+    value the formula cannot use) have valid set to False.
+    """
+    height = encoded["height_cm"]
+    weight = encoded["weight_kg"]
+    age = encoded["age"]
+    scores = score_cohort(height, weight, age,
+                          encoded["gender"], encoded["activity_level"],
+                          formula=formula, body_fat_pct=encoded.get(BODY_FAT_COLUMN))
+    return {
+        # A finite BMR covers the formula's other inputs, body fat included
+        "valid": (height > 0) & (weight > 0) & np.isfinite(age) & np.isfinite(scores.bmr),
+        "bmi": scores.bmi,
+        "bmi_band": scores.bmi_band,
+        "bmr": scores.bmr,
+        "maintenance_calories": scores.maintenance_calories,
+        "surplus_calories": scores.surplus_calories,
+        "deficit_calories": scores.deficit_calories,
+        "recommendation": recommendation_keys(scores.bmi, encoded["goal"],
+                                              encoded["fitness_level"],
+                                              encoded["desired_body_type"])
+    }
+
+
+def _age_column(values):
+    """Ages as integers again for output (None where missing)"""
+    finite = np.isfinite(values)
+    ages = np.rint(np.where(finite, values, 0)).astype(np.int64)
+    if finite.all():
+        return ages
+    return np.where(finite, ages.astype(object), None)
+
+
+def expand_result(profile, compact, tips=DEFAULT_TIP_MODE):
+    """Output columns (profile + results + TIP_COLUMNS[tips]) from compact scores"""
+    valid = compact["valid"]
+    result = dict(profile)
+    result["age"] = _age_column(profile["age"])
+    for name in METRIC_COLUMNS:
+        result[name] = np.where(valid, compact[name], np.nan)
+    result["bmi_category"] = np.where(valid, bmi_categories(compact["bmi_band"]), "")
+    result["bmi_band"] = np.where(valid, compact["bmi_band"], INVALID_BAND)
+
+    recommendation = compact["recommendation"]
+    if tips == "key":
+        result["recommendation"] = np.where(valid, recommendation, INVALID_RECOMMENDATION).astype(np.uint16)
+    elif tips == "bitset":
+        bitsets = np.where(valid[:, None], tip_bitsets(recommendation), np.uint64(0))
+        for word, name in enumerate(TIP_COLUMNS["bitset"]):
+            result[name] = bitsets[:, word]
+    else:
+        # Join each distinct tip tuple once, then broadcast by recommendation index
+        keys, inverse, _ = group_keys(recommendation)
+        for section, name in zip(engine.TIP_SECTIONS, TIP_COLUMNS["text"]):
+            texts = np.array([TIP_SEPARATOR.join(getattr(engine.RECOMMENDATION_TABLE[key], section))
+                              for key in keys] + [""], dtype=object)
+            result[name] = texts[np.where(valid, inverse.ravel(), len(keys))]
+    return result
+
+
+def score_chunk(chunk, formula=engine.DEFAULT_BMR_FORMULA):
+    """Score one chunk of profile columns, returning profile + result columns"""
+    profile = normalize_chunk(chunk)
+    return expand_result(profile, score_encoded(encode_profile(profile), formula))
+
+
+def store_columns(encoded, compact):
+    """ProfileStore.extend_columns() input from encoded profiles and their scores"""
+    valid = compact["valid"]
+    columns = {name: values for name, values in encoded.items() if name != BODY_FAT_COLUMN}
+    for name in ("bmi", "bmr", "maintenance_calories"):
+        columns[name] = np.where(valid, compact[name], np.nan)
+    columns["bmi_band"] = np.where(valid, compact["bmi_band"], INVALID_BAND)
+    columns["recommendation"] = np.where(valid, compact["recommendation"], INVALID_RECOMMENDATION)
+    return columns
+
+
+def score_to_store(input_path, store=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                   formula=engine.DEFAULT_BMR_FORMULA):
+    """Score a profile file into a compact in-memory ProfileStore"""
+    store = ProfileStore() if store is None else store
+    for chunk in open_reader(input_path, chunk_size):
+        encoded = encode_profile(normalize_chunk(chunk))
+        store.extend_columns(store_columns(encoded, score_encoded(encoded, formula)))
+    return store
+
+
+def score_file(input_path, output_path, chunk_size=DEFAULT_CHUNK_SIZE, workers=1,
+               tips=DEFAULT_TIP_MODE, progress=None, formula=engine.DEFAULT_BMR_FORMULA,
+               rejects=None):
+    """Stream input_path through the scorer into output_path
+
+    tips selects how recommendations are written (see TIP_COLUMNS): "text"
+    joins the tip strings, "bitset" writes tip-ID bitset words (decode with
+    the vexine_engine tip catalog) and "key" writes the uint16
+    RECOMMENDATION_TABLE index. Store (.vxs) outputs always hold keys.
+    formula names the BMR equation; a body_fat_pct input column feeds the
+    lean-mass equations (blank cells are estimated from BMI).
+
+    rejects (a RejectWriter or path) turns on the validation stage (see
+    vexine_validate): units are converted, options canonicalized, and rows
+    failing the checks are written there instead of being scored, with
+    their 0-based data row numbers in the input (header not counted, blank
+    CSV lines counted).
+
+    With workers > 1 each chunk is parsed, validated, scored and formatted
+    for output in a process pool (see _score_piece): the parent only splits
+    the input into raw pieces and appends the finished output, at most a
+    few chunks per worker are in flight and results are written in input
+    order. progress, if given, is called as progress(rows_done,
+    elapsed_seconds) after every chunk. Returns (rows, elapsed_seconds).
+    """
+    if tips not in TIP_COLUMNS:
+        raise BatchError(f"Unknown tip mode: {tips}")
+    if formula not in engine.BMR_FORMULAS:
+        raise BatchError(f"Unknown BMR formula: {formula}")
+    if _is_store(output_path):
+        tips = "key"
+        columns = tuple(COLUMN_TYPECODES)
+    else:
+        columns = PROFILE_COLUMNS + RESULT_COLUMNS + TIP_COLUMNS[tips]
+    own_rejects = isinstance(rejects, (str, os.PathLike))
+    if own_rejects:
+        rejects = RejectWriter(rejects)
+    writer = open_writer(output_path, columns)
+    pieces, parse = open_source(input_path, chunk_size)
+    process = partial(_score_piece, parse=parse, formula=formula, tips=tips,
+                      validate=rejects is not None,
+                      format_output=partial(type(writer).format_chunk, columns))
+    rows = 0
+    offset = 0
+    start = time.perf_counter()
+    try:
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            processed = (outcome for _, outcome in
+                         _ordered_map(executor, process, pieces, max_pending=2 * workers))
+        else:
+            executor = None
+            processed = map(process, pieces)
+        try:
+            for piece_rows, scored, output, rejected in processed:
+                if rejected is not None:
+                    rejects.write_columns(*rejected, offset)
+                if output is not None:
+                    writer.write_formatted(output)
+                offset += piece_rows
+                rows += scored
+                if progress:
+                    progress(rows, time.perf_counter() - start)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+    finally:
+        writer.close()
+        if own_rejects:
+            rejects.close()
+    return rows, time.perf_counter() - start
+
+
+def _score_piece(piece, parse, formula, tips, validate, format_output):
+    """Worker: parse, validate, score and format one input piece
+
+    Returns (input rows, scored rows, formatted output or None,
+    reject_columns() or None); only the formatted output and the compact
+    rejects cross back to the parent.
+    """
+    chunk, piece_rows = parse(piece)
+    if chunk is None:
+        return piece_rows, 0, None, None
+    profile = normalize_chunk(chunk)
+    rejected = None
+    if validate:
+        result = validate_profile(profile, {name: chunk[name] for name in UNIT_COLUMNS if name in chunk})
+        rejected = reject_columns(chunk, result)
+        profile = result.accepted_profile()
+    scored = len(profile["height_cm"])
+    if not scored:
+        return piece_rows, 0, None, rejected
+    compact = score_encoded(encode_profile(profile), formula)
+    return piece_rows, scored, format_output(expand_result(profile, compact, tips)), rejected
+
+
+def _ordered_map(executor, fn, iterable, max_pending):
+    """Yield (item, fn(item)) in input order, never more than max_pending ahead"""
+    pending = deque()
+    for item in iterable:
+        pending.append((item, executor.submit(fn, item)))
+        if len(pending) >= max_pending:
+            item, future = pending.popleft()
+            yield item, future.result()
+    while pending:
+        item, future = pending.popleft()
+        yield item, future.result()
+
+
+# In-memory parallel scoring over shared memory
+
+@dataclass
+class ParallelScores:
+    """Compact per-row results from score_parallel"""
+    valid: np.ndarray
+    bmi: np.ndarray
+    bmi_band: np.ndarray
+    bmr: np.ndarray
+    maintenance_calories: np.ndarray
+    surplus_calories: np.ndarray
+    deficit_calories: np.ndarray
+    recommendation: np.ndarray
+
+    def __len__(self):
+        return len(self.bmi)
+
+    def recommendations(self, i):
+        """Tip tuples for row i"""
+        return engine.RECOMMENDATION_TABLE[self.recommendation[i]]
+
+
+# Result layout shared by the parent and the workers
+_SHARED_RESULT_DTYPES = {
+    "valid": np.bool_,
+    "bmi": np.float64,
+    "bmi_band": np.uint8,
+    "bmr": np.float64,
+    "maintenance_calories": np.float64,
+    "surplus_calories": np.float64,
+    "deficit_calories": np.float64,
+    "recommendation": np.uint16
+}
+
+
+class _SharedColumns:
+    """Named NumPy columns backed by multiprocessing shared memory"""
+
+    def __init__(self, specs, create=False):
+        # specs: name -> (shared memory name or None, dtype string, length)
+        self.blocks = {}
+        self.arrays = {}
+        for name, (shm_name, dtype, length) in specs.items():
+            nbytes = max(1, np.dtype(dtype).itemsize * length)
+            block = (shared_memory.SharedMemory(create=True, size=nbytes) if create
+                     else shared_memory.SharedMemory(name=shm_name))
+            self.blocks[name] = block
+            self.arrays[name] = np.ndarray(length, dtype=dtype, buffer=block.buf)
+
+    def specs(self):
+        return {name: (self.blocks[name].name, array.dtype.str, len(array))
+                for name, array in self.arrays.items()}
+
+    def close(self, unlink=False):
+        self.arrays.clear()
+        for block in self.blocks.values():
+            block.close()
+            if unlink:
+                block.unlink()
+
+
+def _score_shared_slice(input_specs, output_specs, start, stop, formula=engine.DEFAULT_BMR_FORMULA):
+    """Worker: score rows [start, stop) from shared inputs into shared outputs"""
+    inputs = _SharedColumns(input_specs)
+    outputs = _SharedColumns(output_specs)
+    try:
+        compact = score_encoded({name: array[start:stop] for name, array in inputs.arrays.items()},
+                                formula)
+        for name, array in outputs.arrays.items():
+            array[start:stop] = compact[name]
+    finally:
+        inputs.close()
+        outputs.close()
+
+
+def score_parallel(columns, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                   formula=engine.DEFAULT_BMR_FORMULA):
+    """Score in-memory profile columns across a process pool
+
+    columns maps HealthProfile field names to equal-length sequences
+    (missing fields take the defaults). The encoded inputs and all outputs
+    live in shared memory; each worker scores chunk_size-row slices in
+    place, so nothing but slice bounds is pickled and row order is kept.
+    formula names the BMR equation. Returns a ParallelScores of plain
+    NumPy arrays.
+    """
+    if formula not in engine.BMR_FORMULAS:
+        raise BatchError(f"Unknown BMR formula: {formula}")
+    workers = workers or os.cpu_count() or 1
+    encoded = encode_profile(normalize_chunk(columns))
+    n = len(encoded["height_cm"])
+
+    inputs = _SharedColumns({name: (None, array.dtype.str, n) for name, array in encoded.items()},
+                            create=True)
+    outputs = _SharedColumns({name: (None, np.dtype(dtype).str, n)
+                              for name, dtype in _SHARED_RESULT_DTYPES.items()}, create=True)
+    try:
+        for name, array in encoded.items():
+            inputs.arrays[name][:] = array
+        del encoded
+
+        bounds = [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+        if workers > 1 and len(bounds) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(bounds))) as executor:
+                futures = [executor.submit(_score_shared_slice, inputs.specs(), outputs.specs(),
+                                           start, stop, formula) for start, stop in bounds]
+                for future in futures:
+                    future.result()
+        else:
+            for start, stop in bounds:
+                compact = score_encoded({name: array[start:stop]
+                                         for name, array in inputs.arrays.items()}, formula)
+                for name, array in outputs.arrays.items():
+                    array[start:stop] = compact[name]
+
+        return ParallelScores(**{name: array.copy() for name, array in outputs.arrays.items()})
+    finally:
+        inputs.close(unlink=True)
+        outputs.close(unlink=True)
+
+
+def write_tip_catalog(path):
+    """Write the tip-ID rendering dictionary (see vexine_engine.tip_catalog)"""
+    catalog = engine.tip_catalog()
+    catalog["recommendations"] = [list(ids) for ids in engine.RECOMMENDATION_TIP_IDS]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(catalog, f, ensure_ascii=False, indent=1)
+
+
+def _rate(rows, elapsed):
+    return rows / elapsed if elapsed > 0 else float('inf')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="vexine.py batch",
+        description="Score a CSV or Parquet file of profiles"
+    )
+    parser.add_argument("input", help="input .csv or .parquet file")
+    parser.add_argument("output", help="output .csv, .parquet or .vxs (memory-mapped store) file")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"rows per chunk (default {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes for scoring (default 1, 0 = one per CPU)")
+    parser.add_argument("--tips", choices=sorted(TIP_COLUMNS), default=DEFAULT_TIP_MODE,
+                        help="write tips as text, tip-ID bitsets or recommendation keys")
+    parser.add_argument("--formula", choices=tuple(engine.BMR_FORMULAS), default=engine.DEFAULT_BMR_FORMULA,
+                        help=f"BMR equation (default {engine.DEFAULT_BMR_FORMULA})")
+    parser.add_argument("--rejects", metavar="PATH",
+                        help="validate rows first; write rejected ones (with reason codes) to this .csv/.parquet")
+    parser.add_argument("--tip-catalog", metavar="PATH",
+                        help="also write the tip-ID rendering dictionary as JSON")
+    parser.add_argument("--quiet", action="store_true", help="only print the final summary")
+    args = parser.parse_args(argv)
+
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+    if args.workers < 0:
+        parser.error("--workers must not be negative")
+    workers = args.workers or os.cpu_count() or 1
+
+    def report(rows, elapsed):
+        print(f"\r{rows:,} rows  {_rate(rows, elapsed):,.0f} rows/sec", end='', file=sys.stderr)
+
+    rejects = None
+    try:
+        if args.tip_catalog:
+            write_tip_catalog(args.tip_catalog)
+        if args.rejects:
+            rejects = RejectWriter(args.rejects)
+        rows, elapsed = score_file(args.input, args.output, args.chunk_size, workers, args.tips,
+                                   progress=None if args.quiet else report, formula=args.formula,
+                                   rejects=rejects)
+    except (BatchError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if rejects is not None:
+            rejects.close()
+
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(f"Scored {rows:,} rows in {elapsed:.2f}s ({_rate(rows, elapsed):,.0f} rows/sec)",
+          file=sys.stderr)
+    if rejects is not None:
+        reasons = ", ".join(f"{name} {count:,}" for name, count in sorted(rejects.reason_counts.items()))
+        print(f"Rejected {rejects.rows:,} rows to {rejects.path}" + (f" ({reasons})" if reasons else ""),
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,334 @@
+"""Columnar cohort scoring with NumPy.
+
+Vectorized counterparts of the formulas in vexine_engine: whole arrays of
+profiles are scored with array arithmetic instead of one Python call per
+row. Results match vexine_engine.analyze() bit for bit.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from vexine_engine import (
+    GENDERS, GOALS, FITNESS_LEVELS, DESIRED_BODY_TYPES, ACTIVITY_LEVELS,
+    ACTIVITY_MULTIPLIERS, DEFAULT_ACTIVITY_MULTIPLIER, SURPLUS_CALORIES, DEFICIT_CALORIES,
+    BMI_BAND_EDGES, BMI_CATEGORIES, NORMAL, RECOMMENDATION_KEY_DOMAINS,
+    RECOMMENDATION_TABLE, RECOMMENDATION_TIP_IDS, RECOMMENDATION_BITSETS,
+    TIP_CATALOG, HARRIS_BENEDICT_COEFFICIENTS,
+    DEFAULT_BMR_FORMULA
+)
+
+
+# Multiplier per activity code; the extra last slot is for unknown levels
+ACTIVITY_MULTIPLIER_TABLE = np.array(
+    [ACTIVITY_MULTIPLIERS[level] for level in ACTIVITY_LEVELS] + [DEFAULT_ACTIVITY_MULTIPLIER]
+)
+
+# Mifflin-St Jeor constant per gender code; anything but male uses the female term
+GENDER_BMR_OFFSET_TABLE = np.array([5.0, -161.0, -161.0])
+
+# Harris-Benedict (constant, per kg, per cm, per year) rows per gender code
+HARRIS_BENEDICT_TABLE = np.array([HARRIS_BENEDICT_COEFFICIENTS[1]] + [HARRIS_BENEDICT_COEFFICIENTS[0]] * 2)
+
+# Deurenberg sex term per gender code (1 for male)
+GENDER_SEX_TABLE = np.array([1.0, 0.0, 0.0])
+
+# Tip bitsets per recommendation key as little-endian uint64 words
+TIP_BITSET_WORDS = (len(TIP_CATALOG) + 63) // 64
+TIP_BITSET_TABLE = np.array(
+    [[bits >> (64 * word) & (2 ** 64 - 1) for word in range(TIP_BITSET_WORDS)]
+     for bits in RECOMMENDATION_BITSETS],
+    dtype=np.uint64
+)
+
+
+def _tip_membership_table():
+    table = np.zeros((len(RECOMMENDATION_TABLE), len(TIP_CATALOG)), dtype=bool)
+    for key, tip_ids in enumerate(RECOMMENDATION_TIP_IDS):
+        table[key, list(tip_ids)] = True
+    return table
+
+
+# Whether each recommendation key includes each tip, shape (keys, tips)
+TIP_MEMBERSHIP_TABLE = _tip_membership_table()
+
+_BMI_EDGES = np.array(BMI_BAND_EDGES)
+_BMI_CATEGORY_LABELS = np.array(BMI_CATEGORIES)
+
+
+@dataclass(frozen=True)
+class CohortScores:
+    """Per-row metrics for a cohort, one array per field"""
+    bmi: np.ndarray
+    bmi_band: np.ndarray
+    bmr: np.ndarray
+    maintenance_calories: np.ndarray
+    surplus_calories: np.ndarray
+    deficit_calories: np.ndarray
+
+    def __len__(self):
+        return len(self.bmi)
+
+
+def encode_options(values, options, name="option"):
+    """Map option strings to uint8 codes; unknown values get len(options)
+
+    Integer arrays are taken to be codes already and are passed through
+    after a range check (0 to len(options)); name is the column named in
+    the ValueError for an out-of-range code.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in "iu":
+        if values.size and (values.min() < 0 or values.max() > len(options)):
+            raise ValueError(f"{name} codes must be between 0 and {len(options)}")
+        return values.astype(np.uint8, copy=False)
+    # One comparison pass per option beats sorting the strings (np.unique)
+    codes = np.full(values.shape, len(options), dtype=np.uint8)
+    for code, option in enumerate(options):
+        codes[values == option] = code
+    return codes
+
+
+def decode_options(codes, options):
+    """Map uint8 codes back to option strings (unknown codes become '')"""
+    labels = np.array(list(options) + [""])
+    return labels[np.minimum(np.asarray(codes), len(options))]
+
+
+def bmi_bands(bmi):
+    """BMI band code per row (0 underweight .. 3 obese)"""
+    return np.digitize(bmi, _BMI_EDGES).astype(np.uint8)
+
+
+def bmi_categories(bands):
+    """Category labels for BMI band codes"""
+    return _BMI_CATEGORY_LABELS[bands]
+
+
+class _Cohort:
+    """Input arrays plus the intermediates shared by the BMR equations"""
+
+    def __init__(self, height_cm, weight_kg, age, gender, body_fat_pct):
+        self.height_cm = np.asarray(height_cm, dtype=np.float64)
+        self.weight_kg = np.asarray(weight_kg, dtype=np.float64)
+        self.age = np.asarray(age, dtype=np.float64)
+        self.gender_codes = encode_options(gender, GENDERS, "gender")
+        self.body_fat_pct = body_fat_pct
+        height_m = self.height_cm / 100
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # float_power calls libm pow() like Python's ** does; a plain
+            # square can differ from the engine's BMI in the last bit
+            self.bmi = self.weight_kg / np.float_power(height_m, 2)
+        self._lean_mass = None
+
+    @property
+    def lean_mass(self):
+        if self._lean_mass is None:
+            # Deurenberg estimate from BMI wherever body fat was not measured
+            body_fat = ((1.2 * self.bmi) + (0.23 * self.age)
+                        - (10.8 * GENDER_SEX_TABLE[self.gender_codes]) - 5.4)
+            if self.body_fat_pct is not None:
+                measured = np.asarray(self.body_fat_pct, dtype=np.float64)
+                body_fat = np.where(np.isnan(measured), body_fat, measured)
+            self._lean_mass = self.weight_kg * (1 - body_fat / 100)
+        return self._lean_mass
+
+
+def mifflin_st_jeor_bmr(cohort):
+    """Mifflin-St Jeor BMR per row"""
+    return ((10 * cohort.weight_kg) + (6.25 * cohort.height_cm) - (5 * cohort.age)
+            + GENDER_BMR_OFFSET_TABLE[cohort.gender_codes])
+
+
+def harris_benedict_bmr(cohort):
+    """Revised Harris-Benedict BMR per row"""
+    constant, per_kg, per_cm, per_year = HARRIS_BENEDICT_TABLE[cohort.gender_codes].T
+    return constant + (per_kg * cohort.weight_kg) + (per_cm * cohort.height_cm) - (per_year * cohort.age)
+
+
+def katch_mcardle_bmr(cohort):
+    """Katch-McArdle BMR per row"""
+    return 370 + (21.6 * cohort.lean_mass)
+
+
+def cunningham_bmr(cohort):
+    """Cunningham resting energy expenditure per row"""
+    return 500 + (22 * cohort.lean_mass)
+
+
+# Vectorized counterparts of vexine_engine.BMR_FORMULAS, same keys
+BMR_FORMULA_ARRAYS = {
+    "mifflin_st_jeor": mifflin_st_jeor_bmr,
+    "harris_benedict": harris_benedict_bmr,
+    "katch_mcardle": katch_mcardle_bmr,
+    "cunningham": cunningham_bmr
+}
+
+
+def _scores(bmi, bands, bmr, multipliers):
+    maintenance = bmr * multipliers
+    return CohortScores(
+        bmi=bmi,
+        bmi_band=bands,
+        bmr=bmr,
+        maintenance_calories=maintenance,
+        surplus_calories=maintenance + SURPLUS_CALORIES,
+        deficit_calories=maintenance - DEFICIT_CALORIES
+    )
+
+
+def _formula_arrays(formula):
+    if formula not in BMR_FORMULA_ARRAYS:
+        raise ValueError(f"Unknown BMR formula: {formula} (choose from {', '.join(BMR_FORMULA_ARRAYS)})")
+    return BMR_FORMULA_ARRAYS[formula]
+
+
+def score_cohort(height_cm, weight_kg, age, gender, activity_level,
+                 formula=DEFAULT_BMR_FORMULA, body_fat_pct=None):
+    """Score arrays of profiles
+
+    gender and activity_level may be string arrays or uint8 codes from
+    encode_options(). formula picks the BMR equation (a key of
+    BMR_FORMULA_ARRAYS); body_fat_pct is an optional array for the
+    lean-mass equations (NaN entries are estimated from BMI). Invalid rows
+    (non-positive height or weight) come back as NaN/inf rather than
+    raising; use the validation stage to filter them first.
+    """
+    calculate = _formula_arrays(formula)
+    cohort = _Cohort(height_cm, weight_kg, age, gender, body_fat_pct)
+    activity_codes = encode_options(activity_level, ACTIVITY_LEVELS, "activity_level")
+    multipliers = ACTIVITY_MULTIPLIER_TABLE[activity_codes]
+    return _scores(cohort.bmi, bmi_bands(cohort.bmi), calculate(cohort), multipliers)
+
+
+def score_formulas(height_cm, weight_kg, age, gender, activity_level,
+                   formulas=tuple(BMR_FORMULA_ARRAYS), body_fat_pct=None):
+    """Score arrays of profiles under several BMR equations at once
+
+    Inputs are encoded and BMI, bands, activity multipliers and lean mass
+    are computed once and shared. Returns {formula: CohortScores}; each
+    entry equals score_cohort(..., formula=formula).
+    """
+    calculators = [(formula, _formula_arrays(formula)) for formula in formulas]
+    cohort = _Cohort(height_cm, weight_kg, age, gender, body_fat_pct)
+    activity_codes = encode_options(activity_level, ACTIVITY_LEVELS, "activity_level")
+    multipliers = ACTIVITY_MULTIPLIER_TABLE[activity_codes]
+    bands = bmi_bands(cohort.bmi)
+    return {formula: _scores(cohort.bmi, bands, calculate(cohort), multipliers)
+            for formula, calculate in calculators}
+
+
+def tip_bmi_bands(bmi):
+    """BMI band per row as the tip rules see it (NaN counts as NORMAL)"""
+    bands = bmi_bands(bmi)
+    bands[np.isnan(bmi)] = NORMAL
+    return bands
+
+
+def recommendation_keys(bmi, goal, fitness_level, desired_body):
+    """Index into vexine_engine.RECOMMENDATION_TABLE per row
+
+    The index is the mixed-radix encoding of (tip BMI band, goal, fitness
+    level, desired body) over RECOMMENDATION_KEY_DOMAINS; option codes from
+    encode_options() already put unknown values in the OTHER slot.
+    """
+    radix = [len(domain) for domain in RECOMMENDATION_KEY_DOMAINS]
+    keys = tip_bmi_bands(np.asarray(bmi, dtype=np.float64)).astype(np.uint16)
+    for codes, options, name, size in zip(
+            (goal, fitness_level, desired_body),
+            (GOALS, FITNESS_LEVELS, DESIRED_BODY_TYPES),
+            ("goal", "fitness_level", "desired_body_type"),
+            radix[1:]):
+        keys = keys * size + encode_options(codes, options, name)
+    return keys.astype(np.uint16)
+
+
+def tip_bitsets(keys):
+    """Tip-ID bitset per row, shape (rows, TIP_BITSET_WORDS) uint64
+
+    Word w bit b is tip ID 64 * w + b; decode with
+    vexine_engine.recommendations_from_bitset(bitset_to_int(row)).
+    """
+    return TIP_BITSET_TABLE[np.asarray(keys)]
+
+
+def bitset_to_int(words):
+    """Python int bitset from one row of tip_bitsets()"""
+    return sum(int(word) << (64 * i) for i, word in enumerate(words))
+
+
+def group_keys(keys):
+    """Distinct recommendation keys, a per-row index into them, and their counts
+
+    The key space is small (len(RECOMMENDATION_TABLE)), so this is one
+    bincount pass plus a table lookup rather than a sort like np.unique.
+    """
+    keys = np.asarray(keys)
+    counts = np.bincount(keys.ravel(), minlength=len(RECOMMENDATION_TABLE))
+    unique = np.flatnonzero(counts).astype(np.uint16)
+    positions = np.zeros(len(counts), dtype=np.intp)
+    positions[unique] = np.arange(len(unique))
+    return unique, positions[keys], counts[unique]
+
+
+@dataclass(frozen=True)
+class CohortRecommendations:
+    """Recommendation keys for a cohort, grouped by distinct key
+
+    Per-group work (tip lookups, text joins, tip counts) is done once per
+    distinct key in unique_keys and broadcast back to rows with inverse,
+    so it scales with the number of distinct keys rather than rows.
+    """
+    keys: np.ndarray
+    unique_keys: np.ndarray
+    inverse: np.ndarray
+    counts: np.ndarray
+
+    @classmethod
+    def from_keys(cls, keys):
+        keys = np.asarray(keys, dtype=np.uint16)
+        return cls(keys, *group_keys(keys))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def recommendations(self, i):
+        """Recommendations for row i"""
+        return RECOMMENDATION_TABLE[self.keys[i]]
+
+    def groups(self):
+        """(Recommendations, row indices) for each distinct key"""
+        order = np.argsort(self.inverse, kind="stable")
+        bounds = np.cumsum(self.counts)[:-1]
+        for key, rows in zip(self.unique_keys.tolist(), np.split(order, bounds)):
+            yield RECOMMENDATION_TABLE[key], rows
+
+    def broadcast(self, values):
+        """Per-row array from one value per distinct key (in unique_keys order)"""
+        return np.asarray(values)[self.inverse]
+
+    def tip_bitsets(self):
+        """Tip-ID bitset words per row, like tip_bitsets(keys)"""
+        return self.broadcast(TIP_BITSET_TABLE[self.unique_keys])
+
+    def has_tip(self, tip_id):
+        """Boolean mask of the rows that receive tip_id"""
+        return self.broadcast(TIP_MEMBERSHIP_TABLE[self.unique_keys, tip_id])
+
+    def tip_counts(self):
+        """Number of rows receiving each tip, indexed by tip ID"""
+        return self.counts @ TIP_MEMBERSHIP_TABLE[self.unique_keys]
+
+    def section_text(self, section, separator):
+        """Per-row joined tip text for one section (object array)"""
+        texts = np.array([separator.join(getattr(RECOMMENDATION_TABLE[key], section))
+                          for key in self.unique_keys.tolist()], dtype=object)
+        return self.broadcast(texts)
+
+
+def recommend_cohort(bmi, goal, fitness_level, desired_body):
+    """Recommendations for arrays of profiles, grouped by decision key
+
+    The cohort counterpart of vexine_engine.recommend(): one pass computes
+    every row's key (see recommendation_keys) and groups rows by it.
+    """
+    return CohortRecommendations.from_keys(recommendation_keys(bmi, goal, fitness_level, desired_body))
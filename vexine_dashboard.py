@@ -0,0 +1,123 @@
+"""Results dashboard drawn on a single Tk Canvas.
+
+The BMI card and the three calorie cards, neon bars included, are canvas
+items created once. update() changes them with itemconfig, skipping
+options whose value is already shown, and the <Configure> handler moves
+them with coords, so resizing or toggling fullscreen never relayouts a
+tree of Frames and Labels. VexineApp uses it when canvas_dashboard is set
+(VEXINE_CANVAS_DASHBOARD=1).
+"""
+import tkinter as tk
+
+
+DASHBOARD_HEIGHT = 200
+BMI_CARD_WIDTH = 280
+# Gap after the BMI card, and padding either side of each calorie card
+BMI_CARD_GAP = 15
+METRIC_CARD_PAD = 8
+BMI_BAR_HEIGHT = 4
+METRIC_BAR_HEIGHT = 3
+
+# Calorie cards, left to right: (title, subtitle, color name)
+METRIC_CARDS = (
+    ("MAINTENANCE", "CALORIES/DAY", 'secondary'),
+    ("SURPLUS", "BULK PHASE", 'success'),
+    ("DEFICIT", "CUT PHASE", 'danger'),
+)
+
+
+def _stack(top, rows):
+    """Top y of each (name, font, pad_above, pad_below) row stacked like pack()"""
+    offsets = {}
+    y = top
+    for name, font, pad_above, pad_below in rows:
+        y += pad_above
+        offsets[name] = y
+        y += font.metrics('linespace') + pad_below
+    return offsets
+
+
+class CanvasDashboard:
+    """BMI and calorie cards as items on one Canvas"""
+
+    def __init__(self, parent, colors, font):
+        self.canvas = tk.Canvas(parent, bg=colors['bg'], height=DASHBOARD_HEIGHT,
+                                highlightthickness=0, bd=0)
+        self.width = None
+        self._shown = {}
+        canvas = self.canvas
+
+        def card(bar_color=''):
+            return {
+                'card': canvas.create_rectangle(0, 0, 0, 0, fill=colors['card'], width=0),
+                'bar': canvas.create_rectangle(0, 0, 0, 0, fill=bar_color, width=0)
+            }
+
+        def text(font_, fill, value=""):
+            return canvas.create_text(0, 0, anchor=tk.N, text=value, font=font_, fill=fill)
+
+        # Same fonts and paddings as create_large_bmi_card / create_compact_metric_card
+        bmi_rows = (("title", font(11, 'bold'), 20, 5), ("value", font(56, 'bold'), 10, 10),
+                    ("category", font(13, 'bold'), 0, 0), ("range", font(8), 5, 15))
+        self.bmi_offsets = _stack(BMI_BAR_HEIGHT, bmi_rows)
+        self.bmi_items = card()
+        self.bmi_items.update(
+            title=text(bmi_rows[0][1], colors['text_dim'], "BMI INDEX"),
+            value=text(bmi_rows[1][1], colors['text']),
+            category=text(bmi_rows[2][1], colors['text']),
+            range=text(bmi_rows[3][1], colors['text_dim'])
+        )
+
+        metric_rows = (("title", font(8, 'bold'), 10, 3), ("value", font(22, 'bold'), 3, 3),
+                       ("subtitle", font(7), 0, 8))
+        self.metric_offsets = _stack(METRIC_BAR_HEIGHT, metric_rows)
+        self.metric_items = []
+        for title, subtitle, color_name in METRIC_CARDS:
+            items = card(colors[color_name])
+            items.update(
+                title=text(metric_rows[0][1], colors['text_dim'], title),
+                value=text(metric_rows[1][1], colors[color_name]),
+                subtitle=text(metric_rows[2][1], colors['text_dim'], subtitle)
+            )
+            self.metric_items.append(items)
+
+        canvas.bind('<Configure>', lambda event: self.layout(event.width))
+
+    def layout(self, width):
+        """Move the items to fit width (no-op if the width is unchanged)"""
+        if width == self.width:
+            return
+        self.width = width
+        self._place(self.bmi_items, self.bmi_offsets, 0, BMI_CARD_WIDTH, BMI_BAR_HEIGHT)
+        left = BMI_CARD_WIDTH + BMI_CARD_GAP
+        slot = max(width - left, 0) / len(self.metric_items)
+        for i, items in enumerate(self.metric_items):
+            x0 = left + i * slot + METRIC_CARD_PAD
+            x1 = max(x0, left + (i + 1) * slot - METRIC_CARD_PAD)
+            self._place(items, self.metric_offsets, x0, x1, METRIC_BAR_HEIGHT)
+
+    def _place(self, items, offsets, x0, x1, bar_height):
+        canvas = self.canvas
+        canvas.coords(items['card'], x0, 0, x1, DASHBOARD_HEIGHT)
+        canvas.coords(items['bar'], x0, 0, x1, bar_height)
+        center = (x0 + x1) / 2
+        for name, y in offsets.items():
+            canvas.coords(items[name], center, y)
+
+    def _set(self, item, **options):
+        """itemconfig only the options that changed"""
+        changed = {key: value for key, value in options.items() if self._shown.get((item, key)) != value}
+        if changed:
+            self.canvas.itemconfig(item, **changed)
+            for key, value in changed.items():
+                self._shown[item, key] = value
+
+    def update(self, bmi_text, bmi_color, category, range_text, metric_texts):
+        """Show new values; metric_texts are the calorie card values, left to right"""
+        items = self.bmi_items
+        self._set(items['bar'], fill=bmi_color)
+        self._set(items['value'], text=bmi_text, fill=bmi_color)
+        self._set(items['category'], text=category)
+        self._set(items['range'], text=range_text)
+        for items, value in zip(self.metric_items, metric_texts):
+            self._set(items['value'], text=value)
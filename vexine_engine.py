@@ -0,0 +1,716 @@
+"""Headless Vexine computation engine.
+
+BMI, BMR (Mifflin-St Jeor by default; see BMR_FORMULAS), calorie targets
+and recommendation tips as plain Python. Nothing here imports tkinter, so
+the same code drives the GUI and display-less batch workers.
+"""
+import math
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from itertools import product
+
+from vexine_trace import traced
+
+
+# Input options (the GUI dropdowns are built from these)
+GENDERS = ("male", "female")
+CURRENT_BODY_TYPES = ("underweight", "average", "athletic", "overweight", "obese")
+DESIRED_BODY_TYPES = ("lean", "athletic", "muscular", "maintain")
+GOALS = ("lose weight", "gain muscle", "maintain", "improve fitness")
+FITNESS_LEVELS = ("beginner", "intermediate", "advanced")
+ACTIVITY_LEVELS = ("sedentary", "light", "moderate", "active", "very active")
+
+# Spinbox domains as (from, to, increment)
+AGE_RANGE = (10, 100, 1)
+HEIGHT_RANGE = (100, 250, 0.5)
+WEIGHT_RANGE = (30, 200, 0.5)
+
+# Activity multipliers applied to BMR
+ACTIVITY_MULTIPLIERS = {
+    "sedentary": 1.2,
+    "light": 1.375,
+    "moderate": 1.55,
+    "active": 1.725,
+    "very active": 1.9
+}
+DEFAULT_ACTIVITY_MULTIPLIER = 1.55
+
+# Revised Harris-Benedict (Roza & Shizgal) as (constant, per kg, per cm, per year),
+# indexed by gender == "male"
+HARRIS_BENEDICT_COEFFICIENTS = (
+    (447.593, 9.247, 3.098, 4.330),
+    (88.362, 13.397, 4.799, 5.677)
+)
+
+# Calorie offsets from maintenance
+SURPLUS_CALORIES = 300
+DEFICIT_CALORIES = 500
+
+# BMI bands (WHO): underweight, normal, overweight, obese
+UNDERWEIGHT, NORMAL, OVERWEIGHT, OBESE = range(4)
+BMI_BAND_EDGES = (18.5, 25.0, 30.0)
+BMI_CATEGORIES = ("UNDERWEIGHT", "NORMAL", "OVERWEIGHT", "OBESE")
+BMI_RANGE_TEXTS = ("< 18.5 Range", "18.5 - 24.9 Range", "25.0 - 29.9 Range", "≥ 30.0 Range")
+
+
+class InvalidProfileError(ValueError):
+    """Raised when a profile cannot be scored"""
+
+
+@dataclass(frozen=True)
+class HealthProfile:
+    """User inputs for one analysis"""
+    age: int = 25
+    gender: str = "male"
+    height_cm: float = 170.0
+    weight_kg: float = 70.0
+    current_body_type: str = "average"
+    desired_body_type: str = "athletic"
+    fitness_level: str = "beginner"
+    goal: str = "maintain"
+    activity_level: str = "moderate"
+
+
+@dataclass(frozen=True)
+class HealthResult:
+    """Computed metrics and recommendations for one profile"""
+    profile: HealthProfile
+    bmi: float
+    bmr: float
+    maintenance_calories: float
+    surplus_calories: float
+    deficit_calories: float
+    nutrition_tips: tuple
+    exercise_tips: tuple
+    lifestyle_tips: tuple
+
+    @property
+    def bmi_band(self):
+        return bmi_band(self.bmi)
+
+    @property
+    def bmi_category(self):
+        return bmi_category(self.bmi)
+
+    @property
+    def bmi_range_text(self):
+        return bmi_range_text(self.bmi)
+
+
+@dataclass(frozen=True)
+class Recommendations:
+    """Tip tuples for the three recommendation sections"""
+    nutrition: tuple
+    exercise: tuple
+    lifestyle: tuple
+
+
+def bmi_band(bmi):
+    """Get BMI band index (UNDERWEIGHT .. OBESE)"""
+    if bmi < 18.5:
+        return UNDERWEIGHT
+    elif bmi < 25:
+        return NORMAL
+    elif bmi < 30:
+        return OVERWEIGHT
+    else:
+        return OBESE
+
+
+def bmi_category(bmi):
+    """Get BMI category"""
+    return BMI_CATEGORIES[bmi_band(bmi)]
+
+
+def bmi_range_text(bmi):
+    """Get BMI range information"""
+    return BMI_RANGE_TEXTS[bmi_band(bmi)]
+
+
+def calculate_bmi(height_cm, weight_kg):
+    """Body mass index from height in cm and weight in kg"""
+    height_m = height_cm / 100
+    return weight_kg / (height_m ** 2)
+
+
+def calculate_bmr(weight_kg, height_cm, age, gender, body_fat_pct=None):
+    """Basal metabolic rate using the Mifflin-St Jeor equation"""
+    if gender == "male":
+        return (10 * weight_kg) + (6.25 * height_cm) - (5 * age) + 5
+    else:
+        return (10 * weight_kg) + (6.25 * height_cm) - (5 * age) - 161
+
+
+def harris_benedict_bmr(weight_kg, height_cm, age, gender, body_fat_pct=None):
+    """Basal metabolic rate using the revised Harris-Benedict equation"""
+    constant, per_kg, per_cm, per_year = HARRIS_BENEDICT_COEFFICIENTS[gender == "male"]
+    return constant + (per_kg * weight_kg) + (per_cm * height_cm) - (per_year * age)
+
+
+def estimate_body_fat(bmi, age, gender):
+    """Body fat percentage from BMI (Deurenberg et al.)"""
+    sex = 1 if gender == "male" else 0
+    return (1.2 * bmi) + (0.23 * age) - (10.8 * sex) - 5.4
+
+
+def lean_body_mass(weight_kg, height_cm, age, gender, body_fat_pct=None):
+    """Fat-free mass in kg; body fat is estimated from BMI when not given"""
+    if body_fat_pct is None:
+        body_fat_pct = estimate_body_fat(calculate_bmi(height_cm, weight_kg), age, gender)
+    return weight_kg * (1 - body_fat_pct / 100)
+
+
+def katch_mcardle_bmr(weight_kg, height_cm, age, gender, body_fat_pct=None):
+    """Basal metabolic rate from lean body mass (Katch-McArdle)"""
+    return 370 + (21.6 * lean_body_mass(weight_kg, height_cm, age, gender, body_fat_pct))
+
+
+def cunningham_bmr(weight_kg, height_cm, age, gender, body_fat_pct=None):
+    """Resting energy expenditure from lean body mass (Cunningham)"""
+    return 500 + (22 * lean_body_mass(weight_kg, height_cm, age, gender, body_fat_pct))
+
+
+# BMR equations by name; all take (weight_kg, height_cm, age, gender, body_fat_pct=None)
+BMR_FORMULAS = {
+    "mifflin_st_jeor": calculate_bmr,
+    "harris_benedict": harris_benedict_bmr,
+    "katch_mcardle": katch_mcardle_bmr,
+    "cunningham": cunningham_bmr
+}
+DEFAULT_BMR_FORMULA = "mifflin_st_jeor"
+
+
+def bmr_formula(name):
+    """Look up a BMR equation by name"""
+    try:
+        return BMR_FORMULAS[name]
+    except KeyError:
+        raise ValueError(f"Unknown BMR formula: {name} (choose from {', '.join(BMR_FORMULAS)})") from None
+
+
+def activity_multiplier(activity_level):
+    """Get BMR multiplier for an activity level"""
+    return ACTIVITY_MULTIPLIERS.get(activity_level, DEFAULT_ACTIVITY_MULTIPLIER)
+
+
+@traced("engine.analyze")
+def analyze(profile, formula=DEFAULT_BMR_FORMULA, body_fat_pct=None):
+    """Calculate BMI, calories and recommendations for a profile
+
+    formula names the BMR equation (see BMR_FORMULAS); body_fat_pct is
+    only used by the lean-mass equations.
+    """
+    calculate = bmr_formula(formula)
+    if profile.height_cm <= 0 or profile.weight_kg <= 0:
+        raise InvalidProfileError("Invalid height or weight values!")
+
+    bmi = calculate_bmi(profile.height_cm, profile.weight_kg)
+    bmr = calculate(profile.weight_kg, profile.height_cm, profile.age, profile.gender, body_fat_pct)
+    maintenance = bmr * activity_multiplier(profile.activity_level)
+    recommendations = recommend(bmi, profile.goal, profile.fitness_level,
+                                profile.desired_body_type)
+
+    return HealthResult(
+        profile=profile,
+        bmi=bmi,
+        bmr=bmr,
+        maintenance_calories=maintenance,
+        surplus_calories=maintenance + SURPLUS_CALORIES,
+        deficit_calories=maintenance - DEFICIT_CALORIES,
+        nutrition_tips=recommendations.nutrition,
+        exercise_tips=recommendations.exercise,
+        lifestyle_tips=recommendations.lifestyle
+    )
+
+
+class AnalysisCache:
+    """Bounded LRU cache in front of analyze()
+
+    Profiles are normalized before lookup: height and weight are rounded
+    to the spinbox increment, so nearly identical inputs share one entry
+    and the cached result is the analysis of the rounded profile.
+    """
+
+    def __init__(self, maxsize=256, quantum=HEIGHT_RANGE[2]):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.quantum = quantum
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results = OrderedDict()
+
+    def __len__(self):
+        return len(self._results)
+
+    def normalize(self, profile):
+        """Round height and weight to the cache quantum"""
+        return replace(
+            profile,
+            height_cm=self._quantize(profile.height_cm),
+            weight_kg=self._quantize(profile.weight_kg)
+        )
+
+    def _quantize(self, value):
+        if not math.isfinite(value):
+            return value
+        return round(value / self.quantum) * self.quantum
+
+    def analyze(self, profile, formula=DEFAULT_BMR_FORMULA, body_fat_pct=None):
+        """Cached equivalent of analyze(profile, formula, body_fat_pct)"""
+        # A plain tuple key is much cheaper to build than a normalized profile
+        key = (
+            self._quantize(profile.height_cm), self._quantize(profile.weight_kg),
+            profile.age, profile.gender, profile.current_body_type,
+            profile.desired_body_type, profile.fitness_level, profile.goal,
+            profile.activity_level, formula, body_fat_pct
+        )
+        result = self._results.get(key)
+        if result is not None:
+            self.hits += 1
+            self._results.move_to_end(key)
+            return result
+
+        self.misses += 1
+        result = analyze(self.normalize(profile), formula, body_fat_pct)
+        self._results[key] = result
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def stats(self):
+        """Counters for sizing the cache"""
+        return {
+            "size": len(self._results),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        self._results.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+# Profile fields each live output depends on
+_BMI_INPUTS = frozenset({"height_cm", "weight_kg"})
+_BMR_INPUTS = _BMI_INPUTS | {"age", "gender"}
+_CALORIE_INPUTS = _BMR_INPUTS | {"activity_level"}
+_TIP_INPUTS = frozenset({"tip_band", "goal", "fitness_level", "desired_body_type"})
+_ALL_INPUTS = _CALORIE_INPUTS | _TIP_INPUTS
+
+
+class LiveAnalysis:
+    """analyze() kept current while single inputs change
+
+    update() recomputes only what the changed fields feed into: BMI from
+    height and weight, BMR from those plus age and gender, calories from
+    BMR and activity level, and tips only when the tip BMI band or a tip
+    field changes. It returns the set of outputs that changed, out of
+    "valid", "bmi", "bmi_band", "bmr", "calories" and "tips".
+
+    calorie_grid, if given, is a vexine_grid.CalorieGrid that replaces the
+    closed form: maintenance calories are looked up directly, and BMR is
+    only computed when result() asks for it.
+    """
+
+    def __init__(self, profile=HealthProfile(), calorie_grid=None):
+        self.profile = profile
+        self.calorie_grid = calorie_grid
+        self.valid = False
+        self.bmi = self.bmr = self.maintenance_calories = math.nan
+        self.bmi_band = self.tip_band = None
+        self.recommendations = None
+        self._recompute(_ALL_INPUTS)
+
+    def update(self, **changes):
+        """Apply changed profile fields and recompute what depends on them"""
+        changed = {name for name, value in changes.items() if getattr(self.profile, name) != value}
+        if not changed:
+            return set()
+        self.profile = replace(self.profile, **{name: changes[name] for name in changed})
+        return self._recompute(changed)
+
+    def _recompute(self, changed):
+        profile = self.profile
+        outputs = set()
+        valid = profile.height_cm > 0 and profile.weight_kg > 0
+        if valid != self.valid:
+            self.valid = valid
+            outputs.add("valid")
+            changed = _ALL_INPUTS
+        if not valid:
+            return outputs
+
+        if changed & _BMI_INPUTS:
+            self.bmi = calculate_bmi(profile.height_cm, profile.weight_kg)
+            outputs.add("bmi")
+            band = bmi_band(self.bmi)
+            if band != self.bmi_band:
+                self.bmi_band = band
+                outputs.add("bmi_band")
+            band = tip_bmi_band(self.bmi)
+            if band != self.tip_band:
+                self.tip_band = band
+                changed = changed | {"tip_band"}
+        if changed & _BMR_INPUTS and self.calorie_grid is None:
+            self.bmr = calculate_bmr(profile.weight_kg, profile.height_cm, profile.age, profile.gender)
+            outputs.add("bmr")
+        if changed & _CALORIE_INPUTS:
+            if self.calorie_grid is not None:
+                self.maintenance_calories = self.calorie_grid.maintenance(
+                    profile.age, profile.gender, profile.height_cm, profile.weight_kg,
+                    profile.activity_level)
+            else:
+                self.maintenance_calories = self.bmr * activity_multiplier(profile.activity_level)
+            outputs.add("calories")
+        if changed & _TIP_INPUTS:
+            recommendations = recommend(self.bmi, profile.goal, profile.fitness_level,
+                                        profile.desired_body_type)
+            if recommendations is not self.recommendations:
+                self.recommendations = recommendations
+                outputs.add("tips")
+        return outputs
+
+    @property
+    def surplus_calories(self):
+        return self.maintenance_calories + SURPLUS_CALORIES
+
+    @property
+    def deficit_calories(self):
+        return self.maintenance_calories - DEFICIT_CALORIES
+
+    def result(self):
+        """The current state as a HealthResult (same as analyze(self.profile))"""
+        if not self.valid:
+            raise InvalidProfileError("Invalid height or weight values!")
+        profile = self.profile
+        bmr = self.bmr
+        if self.calorie_grid is not None:
+            bmr = calculate_bmr(profile.weight_kg, profile.height_cm, profile.age, profile.gender)
+        return HealthResult(
+            profile=profile,
+            bmi=self.bmi,
+            bmr=bmr,
+            maintenance_calories=self.maintenance_calories,
+            surplus_calories=self.surplus_calories,
+            deficit_calories=self.deficit_calories,
+            nutrition_tips=self.recommendations.nutrition,
+            exercise_tips=self.recommendations.exercise,
+            lifestyle_tips=self.recommendations.lifestyle
+        )
+
+
+# Recommendation rules
+#
+# Each section is an ordered list of (field, values, tips). A rule's tips are
+# emitted when the profile's field is one of values; field None means the
+# rule always applies. OTHER matches any value outside the option lists.
+# The tables are compiled once at import (see _compile_recommendations).
+OTHER = None
+
+NUTRITION_RULES = (
+    (None, None, (
+        "Hydration: 3-4 liters of water daily minimum",
+        "Meal frequency: 5-6 small meals for optimal metabolism",
+    )),
+    ("bmi_band", (UNDERWEIGHT,), (
+        "Caloric surplus: +300-500 calories above maintenance",
+        "Protein: 1.8-2.2g per kg bodyweight daily",
+        "Healthy fats: Nuts, avocados, olive oil, fatty fish",
+        "Dense carbs: Oats, rice, pasta, sweet potatoes",
+    )),
+    ("bmi_band", (OBESE,), (
+        "Caloric deficit: -500-750 calories below maintenance",
+        "Protein: 1.6-2.0g per kg to preserve muscle mass",
+        "Eliminate: Sugary drinks, processed foods, refined carbs",
+        "High volume: Fill 50% of plate with vegetables",
+        "Meal timing: Stop eating 3 hours before bed",
+    )),
+    ("bmi_band", (OVERWEIGHT,), (
+        "Moderate deficit: -300-500 calories daily",
+        "Protein: 1.4-1.8g per kg bodyweight",
+        "Complex carbs: Switch to whole grains, reduce refined carbs",
+        "Smart snacking: Greek yogurt, nuts (portioned), fruits",
+    )),
+    ("bmi_band", (NORMAL,), (
+        "Balanced macros: 40% carbs / 30% protein / 30% fats",
+        "Protein: 1.2-1.6g per kg for maintenance",
+        "Food variety: Include all food groups in moderation",
+    )),
+    ("goal", ("gain muscle",), (
+        "Post-workout: 30g protein within 30 mins",
+        "Pre-workout carbs: Oats, banana, rice for energy",
+        "Protein boost: Increase to 2.0-2.2g per kg",
+    )),
+    ("goal", ("lose weight",), (
+        "Tracking: Use MyFitnessPal or similar app",
+        "Fiber: 30g+ daily from vegetables and fruits",
+        "Sodium: Limit to reduce water retention",
+    )),
+    ("fitness_level", ("advanced",), (
+        "Nutrient timing: Carb cycling on training days",
+        "Supplements: Consider creatine, protein powder, BCAAs",
+    )),
+)
+
+EXERCISE_RULES = (
+    ("fitness_level", ("beginner",), (
+        "Frequency: 3-4 sessions per week, 30-45 mins each",
+        "Cardio foundation: Walking/jogging 20-30 mins, 3x weekly",
+        "Bodyweight basics: Squats, push-ups, planks (2x10 reps)",
+        "Form first: Master technique before adding weight",
+        "Recovery: 48 hours rest between training same muscles",
+    )),
+    ("fitness_level", ("intermediate",), (
+        "Frequency: 4-5 sessions weekly, 45-60 mins each",
+        "Split training: Upper/lower or push/pull/legs",
+        "Cardio: 30-40 mins, 3x weekly (running, cycling, swimming)",
+        "Progressive overload: Increase weight 2.5-5% weekly",
+    )),
+    ("fitness_level", ("advanced", OTHER), (
+        "Frequency: 5-6 sessions weekly, varied intensity",
+        "Advanced splits: PPL or bro-split with periodization",
+        "Intensity techniques: Drop sets, supersets, rest-pause",
+        "Deload week: Every 4-6 weeks reduce volume by 50%",
+    )),
+    ("bmi_band", (UNDERWEIGHT,), (
+        "Strength focus: 70% resistance, 30% cardio",
+        "Compounds: Deadlifts, squats, bench press, rows (4x6-8)",
+        "Cardio limit: 2x weekly maximum, 20 mins sessions",
+    )),
+    ("bmi_band", (OBESE,), (
+        "Low-impact cardio: Swimming, cycling, elliptical",
+        "Duration: Start 15-20 mins, progress to 45 mins",
+        "Resistance: 2x weekly to preserve muscle mass",
+        "Flexibility: Daily stretching or yoga for mobility",
+    )),
+    ("bmi_band", (OVERWEIGHT,), (
+        "HIIT training: 20-30 mins, 3-4x weekly",
+        "Resistance: 3x weekly full-body or split routine",
+        "Active recovery: Walking, swimming on rest days",
+    )),
+    ("desired_body_type", ("muscular",), (
+        "Heavy compounds: 4-6 reps, 4-5 sets, 80-85% 1RM",
+        "Core lifts: Deadlift, squat, bench, OHP, rows",
+        "Time under tension: Control eccentric phase (3 secs)",
+    )),
+    ("desired_body_type", ("lean",), (
+        "Circuit training: 12-15 reps, minimal rest (30s)",
+        "Metabolic conditioning: Burpees, kettlebell swings",
+        "HIIT: 30s work / 30s rest intervals, 20 mins",
+    )),
+    ("desired_body_type", ("athletic",), (
+        "Functional training: TRX, kettlebells, battle ropes",
+        "Plyometrics: Box jumps, jump squats, burpees",
+        "Agility: Ladder drills, cone drills, sprint intervals",
+    )),
+    ("goal", ("lose weight",), (
+        "Calorie burn target: 300-500 per session",
+        "Daily steps: Aim for 10,000+ via pedometer",
+    )),
+    ("goal", ("gain muscle",), (
+        "Cardio minimal: 2x weekly max to preserve mass",
+        "Progressive overload: Track and beat lifts weekly",
+    )),
+)
+
+LIFESTYLE_RULES = (
+    (None, None, (
+        "Sleep priority: 7-9 hours nightly for recovery and hormones",
+        "Stress management: 10 mins daily meditation or breathing",
+        "Progress tracking: Weekly photos, measurements, weight log",
+        "Consistency: Results visible after 8-12 weeks minimum",
+        "Accountability: Training partner or coach recommended",
+        "Meal prep: Prepare 3 days in advance to avoid bad choices",
+        "Listen to body: Rest when fatigued to prevent injury",
+        "Supplementation: Multivitamin, Vitamin D, Omega-3 basics",
+    )),
+    ("fitness_level", ("beginner",), (
+        "Habit formation: Start small, build gradually",
+        "No comparison: Focus on personal progress only",
+        "Learning phase: Watch form videos, ask for help",
+    )),
+    ("fitness_level", ("advanced",), (
+        "Coaching: Consider hiring specialist for optimization",
+        "Periodization: Plan mesocycles to avoid plateaus",
+        "Recovery tools: Foam rolling, massage, ice baths",
+        "Advanced metrics: Track HRV, sleep quality, readiness",
+    )),
+)
+
+# Decision key domains, in key order: (bmi_band, goal, fitness_level, desired_body_type)
+RECOMMENDATION_KEY_FIELDS = ("bmi_band", "goal", "fitness_level", "desired_body_type")
+RECOMMENDATION_KEY_DOMAINS = (
+    (UNDERWEIGHT, NORMAL, OVERWEIGHT, OBESE),
+    GOALS + (OTHER,),
+    FITNESS_LEVELS + (OTHER,),
+    DESIRED_BODY_TYPES + (OTHER,),
+)
+
+
+def _compile_section(rules, key, shared):
+    """Tips a section emits for one decision key"""
+    fields = dict(zip(RECOMMENDATION_KEY_FIELDS, key))
+    tips = tuple(
+        sys.intern(tip)
+        for field, values, rule_tips in rules
+        if field is None or fields[field] in values
+        for tip in rule_tips
+    )
+    # Identical tip tuples are shared between keys
+    return shared.setdefault(tips, tips)
+
+
+def _compile_recommendations():
+    """Evaluate every rule table once for every decision key"""
+    shared = {}
+    table = {}
+    for key in product(*RECOMMENDATION_KEY_DOMAINS):
+        table[key] = Recommendations(
+            nutrition=_compile_section(NUTRITION_RULES, key, shared),
+            exercise=_compile_section(EXERCISE_RULES, key, shared),
+            lifestyle=_compile_section(LIFESTYLE_RULES, key, shared)
+        )
+    return table
+
+
+_RECOMMENDATIONS = _compile_recommendations()
+
+# The same table as a tuple in product(*RECOMMENDATION_KEY_DOMAINS) order, so a
+# key can be stored as one mixed-radix index (see vexine_cohort.recommendation_keys)
+RECOMMENDATION_TABLE = tuple(_RECOMMENDATIONS[key] for key in product(*RECOMMENDATION_KEY_DOMAINS))
+RECOMMENDATION_KEY_INDEX = {key: i for i, key in enumerate(product(*RECOMMENDATION_KEY_DOMAINS))}
+
+
+# Tip IDs
+#
+# Every tip has a small integer ID: its position in TIP_CATALOG, which lists
+# the rule tables' tips in declaration order (nutrition, then exercise, then
+# lifestyle). Within a section, emitted tips therefore have ascending IDs, so
+# a set of IDs (or a bitset) restores the exact display order. Bump
+# TIP_CATALOG_VERSION whenever editing the rules changes any ID.
+TIP_CATALOG_VERSION = 1
+TIP_SECTIONS = ("nutrition", "exercise", "lifestyle")
+
+
+def _build_tip_catalog():
+    catalog = []
+    section_ranges = {}
+    for section, rules in zip(TIP_SECTIONS, (NUTRITION_RULES, EXERCISE_RULES, LIFESTYLE_RULES)):
+        start = len(catalog)
+        catalog.extend(sys.intern(tip) for _, _, tips in rules for tip in tips)
+        section_ranges[section] = range(start, len(catalog))
+    if len(set(catalog)) != len(catalog):
+        raise ValueError("Tip texts must be unique for tip IDs to be stable")
+    return tuple(catalog), section_ranges
+
+
+TIP_CATALOG, TIP_SECTION_RANGES = _build_tip_catalog()
+TIP_IDS = {tip: tip_id for tip_id, tip in enumerate(TIP_CATALOG)}
+
+
+def tip_bitset(tip_ids):
+    """Pack tip IDs into an int bitset (bit n set for tip n)"""
+    bits = 0
+    for tip_id in tip_ids:
+        bits |= 1 << tip_id
+    return bits
+
+
+def tip_ids_from_bitset(bits):
+    """Tip IDs in a bitset, ascending"""
+    return tuple(tip_id for tip_id in range(bits.bit_length()) if bits >> tip_id & 1)
+
+
+def recommendations_from_bitset(bits):
+    """Rebuild the three tip sections from a bitset"""
+    return Recommendations(**{
+        section: tuple(TIP_CATALOG[tip_id] for tip_id in id_range if bits >> tip_id & 1)
+        for section, id_range in TIP_SECTION_RANGES.items()
+    })
+
+
+def tip_catalog():
+    """Rendering dictionary for tip IDs, suitable for JSON"""
+    return {
+        "version": TIP_CATALOG_VERSION,
+        "sections": {section: [r.start, r.stop] for section, r in TIP_SECTION_RANGES.items()},
+        "tips": list(TIP_CATALOG)
+    }
+
+
+# Tip IDs and bitset per RECOMMENDATION_TABLE entry
+RECOMMENDATION_TIP_IDS = tuple(
+    tuple(TIP_IDS[tip] for section in TIP_SECTIONS for tip in getattr(recommendations, section))
+    for recommendations in RECOMMENDATION_TABLE
+)
+RECOMMENDATION_BITSETS = tuple(tip_bitset(ids) for ids in RECOMMENDATION_TIP_IDS)
+_GOAL_SET = frozenset(GOALS)
+_FITNESS_SET = frozenset(FITNESS_LEVELS)
+_DESIRED_SET = frozenset(DESIRED_BODY_TYPES)
+
+
+def tip_bmi_band(bmi):
+    """BMI band as the tip rules see it
+
+    Same as bmi_band() except that NaN falls into NORMAL, matching the
+    order of the original threshold checks.
+    """
+    if bmi < 18.5:
+        return UNDERWEIGHT
+    elif bmi >= 30:
+        return OBESE
+    elif bmi >= 25:
+        return OVERWEIGHT
+    else:
+        return NORMAL
+
+
+def recommendation_key(bmi, goal, fitness_level, desired_body):
+    """Normalized decision key for the compiled recommendation table"""
+    return (
+        tip_bmi_band(bmi),
+        goal if goal in _GOAL_SET else OTHER,
+        fitness_level if fitness_level in _FITNESS_SET else OTHER,
+        desired_body if desired_body in _DESIRED_SET else OTHER
+    )
+
+
+def recommend(bmi, goal, fitness_level, desired_body):
+    """Look up all three tip sections for a profile"""
+    recommendations = _RECOMMENDATIONS.get((tip_bmi_band(bmi), goal, fitness_level, desired_body))
+    if recommendations is None:
+        recommendations = _RECOMMENDATIONS[recommendation_key(bmi, goal, fitness_level, desired_body)]
+    return recommendations
+
+
+@traced("engine.get_nutrition_tips")
+def get_nutrition_tips(bmi, goal, fitness_level):
+    """Generate nutrition tips"""
+    return recommend(bmi, goal, fitness_level, OTHER).nutrition
+
+
+@traced("engine.get_exercise_tips")
+def get_exercise_tips(bmi, goal, fitness_level, desired_body):
+    """Generate exercise tips"""
+    return recommend(bmi, goal, fitness_level, desired_body).exercise
+
+
+@traced("engine.get_lifestyle_tips")
+def get_lifestyle_tips(fitness_level):
+    """Generate lifestyle tips"""
+    # Lifestyle rules only read the fitness level, so any band, goal and body key will do
+    key = (NORMAL, OTHER, fitness_level if fitness_level in _FITNESS_SET else OTHER, OTHER)
+    return _RECOMMENDATIONS[key].lifestyle
+
+
+def recommend_tip_ids(bmi, goal, fitness_level, desired_body):
+    """Like recommend(), but as a bitset of tip IDs"""
+    return RECOMMENDATION_BITSETS[RECOMMENDATION_KEY_INDEX[
+        recommendation_key(bmi, goal, fitness_level, desired_body)]]
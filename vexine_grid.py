@@ -0,0 +1,208 @@
+"""Precomputed calorie lookup tables over the GUI's input domains.
+
+Maintenance calories are (10w + 6.25h - 5a + g) * m over the spinbox
+domains (AGE_RANGE, HEIGHT_RANGE, WEIGHT_RANGE, 2 genders, 5 activity
+levels). A full table is FULL_GRID_CELLS (~93M) cells, so the BMR term is
+split into a height x weight table and an age x gender table instead:
+
+    maintenance = (BODY[h, w] + OFFSET[a, g]) * MULTIPLIER[activity]
+
+On grid points every term is exact, so lookups match analyze() bit for
+bit; validate() checks this. Off-grid or out-of-range inputs use the
+closed form unless interpolate=True is passed.
+
+    grid = CalorieGrid.cached()          # built once, then loaded from disk
+    grid.calories(30, "female", 165.0, 60.5, "light")
+"""
+import json
+import os
+import random
+import struct
+import sys
+from array import array
+
+import vexine_engine as engine
+from vexine_engine import (
+    GENDERS, ACTIVITY_LEVELS, ACTIVITY_MULTIPLIERS, DEFAULT_ACTIVITY_MULTIPLIER,
+    AGE_RANGE, HEIGHT_RANGE, WEIGHT_RANGE, SURPLUS_CALORIES, DEFICIT_CALORIES
+)
+
+
+DEFAULT_GRID_PATH = os.path.join(os.path.expanduser("~"), ".vexine", "calorie_grid.bin")
+GRID_MAGIC = b"VXGRID01"
+DEFAULT_VALIDATION_SAMPLES = 100000
+
+
+def _axis(domain):
+    lo, hi, step = domain
+    return lo, step, int(round((hi - lo) / step)) + 1
+
+
+_AGE_LO, _AGE_STEP, AGE_POINTS = _axis(AGE_RANGE)
+_HEIGHT_LO, _HEIGHT_STEP, HEIGHT_POINTS = _axis(HEIGHT_RANGE)
+_WEIGHT_LO, _WEIGHT_STEP, WEIGHT_POINTS = _axis(WEIGHT_RANGE)
+
+_AGE_MAX, _HEIGHT_MAX, _WEIGHT_MAX = AGE_POINTS - 1, HEIGHT_POINTS - 1, WEIGHT_POINTS - 1
+
+FULL_GRID_CELLS = AGE_POINTS * HEIGHT_POINTS * WEIGHT_POINTS * len(GENDERS) * len(ACTIVITY_LEVELS)
+
+# BMR constant per gender slot: male, then everything else (Mifflin-St Jeor)
+_GENDER_OFFSETS = (5, -161)
+# Multiplier per activity slot; the last slot is for unknown levels
+_MULTIPLIERS = tuple(ACTIVITY_MULTIPLIERS[level] for level in ACTIVITY_LEVELS) + (DEFAULT_ACTIVITY_MULTIPLIER,)
+_ACTIVITY_SLOTS = {level: slot for slot, level in enumerate(ACTIVITY_LEVELS)}
+
+# Everything the tables depend on; a cached grid is rebuilt if this changes
+_GRID_PARAMS = {
+    "age": AGE_RANGE,
+    "height": HEIGHT_RANGE,
+    "weight": WEIGHT_RANGE,
+    "gender_offsets": _GENDER_OFFSETS,
+    "multipliers": _MULTIPLIERS,
+    "byteorder": sys.byteorder
+}
+
+
+class CalorieGrid:
+    """Maintenance/surplus/deficit calories by table lookup"""
+
+    def __init__(self, body, offsets):
+        if len(body) != HEIGHT_POINTS * WEIGHT_POINTS or len(offsets) != AGE_POINTS * 2:
+            raise ValueError("Grid tables do not match the input domains")
+        self.body = body
+        self.offsets = offsets
+
+    @classmethod
+    def build(cls):
+        """Compute the tables from the closed form"""
+        body = array('d', (
+            (10 * (_WEIGHT_LO + _WEIGHT_STEP * w)) + (6.25 * (_HEIGHT_LO + _HEIGHT_STEP * h))
+            for h in range(HEIGHT_POINTS) for w in range(WEIGHT_POINTS)
+        ))
+        offsets = array('d', (
+            offset - 5 * (_AGE_LO + _AGE_STEP * a)
+            for a in range(AGE_POINTS) for offset in _GENDER_OFFSETS
+        ))
+        return cls(body, offsets)
+
+    def save(self, path):
+        """Write the tables to path"""
+        params = json.dumps(_GRID_PARAMS).encode('utf-8')
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(GRID_MAGIC + struct.pack("<I", len(params)) + params)
+            self.body.tofile(f)
+            self.offsets.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        """Read tables written by save(); None if missing or stale"""
+        try:
+            with open(path, 'rb') as f:
+                if f.read(len(GRID_MAGIC)) != GRID_MAGIC:
+                    return None
+                size, = struct.unpack("<I", f.read(4))
+                if json.loads(f.read(size).decode('utf-8')) != json.loads(json.dumps(_GRID_PARAMS)):
+                    return None
+                body, offsets = array('d'), array('d')
+                body.fromfile(f, HEIGHT_POINTS * WEIGHT_POINTS)
+                offsets.fromfile(f, AGE_POINTS * 2)
+        except (OSError, EOFError, ValueError, struct.error):
+            return None
+        return cls(body, offsets)
+
+    @classmethod
+    def cached(cls, path=DEFAULT_GRID_PATH):
+        """Load the grid from path, building and saving it if needed"""
+        grid = cls.load(path)
+        if grid is None:
+            grid = cls.build()
+            try:
+                grid.save(path)
+            except OSError:
+                pass
+        return grid
+
+    @property
+    def nbytes(self):
+        return (len(self.body) + len(self.offsets)) * self.body.itemsize
+
+    def maintenance(self, age, gender, height_cm, weight_kg, activity_level, interpolate=False):
+        """Maintenance calories; exact on grid points
+
+        Off-grid heights, weights and ages are interpolated linearly when
+        interpolate is set (the function is linear in each, so only
+        rounding differs); otherwise, and outside the domains, the closed
+        form is used.
+        """
+        h = (height_cm - _HEIGHT_LO) / _HEIGHT_STEP
+        w = (weight_kg - _WEIGHT_LO) / _WEIGHT_STEP
+        a = (age - _AGE_LO) / _AGE_STEP
+        if 0 <= h <= _HEIGHT_MAX and 0 <= w <= _WEIGHT_MAX and 0 <= a <= _AGE_MAX:
+            hi, wi, ai = int(h), int(w), int(a)
+            multiplier = _MULTIPLIERS[_ACTIVITY_SLOTS.get(activity_level, -1)]
+            g = gender != "male"
+            if hi == h and wi == w and ai == a:
+                return (self.body[hi * WEIGHT_POINTS + wi] + self.offsets[ai * 2 + g]) * multiplier
+            if interpolate:
+                return (self._body_at(hi, h - hi, wi, w - wi)
+                        + self._offset_at(ai, a - ai, g)) * multiplier
+        bmr = engine.calculate_bmr(weight_kg, height_cm, age, gender)
+        return bmr * engine.activity_multiplier(activity_level)
+
+    def _body_at(self, hi, hf, wi, wf):
+        body = self.body
+        row = hi * WEIGHT_POINTS + wi
+        h1 = WEIGHT_POINTS if hf else 0
+        w1 = 1 if wf else 0
+        top = body[row] * (1 - wf) + body[row + w1] * wf
+        bottom = body[row + h1] * (1 - wf) + body[row + h1 + w1] * wf
+        return top * (1 - hf) + bottom * hf
+
+    def _offset_at(self, ai, af, g):
+        a1 = 2 if af else 0
+        return self.offsets[ai * 2 + g] * (1 - af) + self.offsets[ai * 2 + a1 + g] * af
+
+    def calories(self, age, gender, height_cm, weight_kg, activity_level, interpolate=False):
+        """(maintenance, surplus, deficit) calories"""
+        maintenance = self.maintenance(age, gender, height_cm, weight_kg, activity_level, interpolate)
+        return maintenance, maintenance + SURPLUS_CALORIES, maintenance - DEFICIT_CALORIES
+
+    def validate(self, samples=DEFAULT_VALIDATION_SAMPLES, seed=0):
+        """Largest difference from the closed form over grid points
+
+        Checks a random sample of grid points, or every one of the
+        FULL_GRID_CELLS points when samples is None (needs NumPy).
+        """
+        if samples is None:
+            return self._validate_all()
+        rng = random.Random(seed)
+        genders = GENDERS + ("other",)
+        levels = ACTIVITY_LEVELS + ("unknown",)
+        worst = 0.0
+        for _ in range(samples):
+            age = _AGE_LO + _AGE_STEP * rng.randrange(AGE_POINTS)
+            height = _HEIGHT_LO + _HEIGHT_STEP * rng.randrange(HEIGHT_POINTS)
+            weight = _WEIGHT_LO + _WEIGHT_STEP * rng.randrange(WEIGHT_POINTS)
+            gender, level = rng.choice(genders), rng.choice(levels)
+            exact = engine.calculate_bmr(weight, height, age, gender) * engine.activity_multiplier(level)
+            worst = max(worst, abs(self.maintenance(age, gender, height, weight, level) - exact))
+        return worst
+
+    def _validate_all(self):
+        import numpy as np
+        heights = _HEIGHT_LO + _HEIGHT_STEP * np.arange(HEIGHT_POINTS)
+        weights = _WEIGHT_LO + _WEIGHT_STEP * np.arange(WEIGHT_POINTS)
+        h, w = np.meshgrid(heights, weights, indexing="ij")
+        body = np.frombuffer(self.body, dtype=np.float64).reshape(HEIGHT_POINTS, WEIGHT_POINTS)
+        offsets = np.frombuffer(self.offsets, dtype=np.float64).reshape(AGE_POINTS, 2)
+        worst = 0.0
+        for a in range(AGE_POINTS):
+            age = _AGE_LO + _AGE_STEP * a
+            for g, offset in enumerate(_GENDER_OFFSETS):
+                exact_bmr = (10 * w) + (6.25 * h) - (5 * age) + offset
+                table_bmr = body + offsets[a, g]
+                for multiplier in _MULTIPLIERS:
+                    difference = np.abs(table_bmr * multiplier - exact_bmr * multiplier).max()
+                    worst = max(worst, float(difference))
+        return worst
@@ -0,0 +1,176 @@
+"""Persistent per-user analysis history in SQLite.
+
+Every analysis is one row keyed by (user, ts); an index on that pair keeps
+latest, range and rolling-average queries proportional to the rows they
+return rather than to the size of the history. The database runs in WAL
+mode and inserts are buffered and written with executemany in a single
+transaction.
+
+    history = HistoryStore("history.db")
+    history.record(analyze(profile), user="sam")
+    history.latest("sam")
+    history.rolling_average("sam", "bmi", window=7)
+"""
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+
+
+DEFAULT_USER = "default"
+DEFAULT_HISTORY_PATH = os.path.join(os.path.expanduser("~"), ".vexine", "history.db")
+DEFAULT_BATCH_SIZE = 500
+SCHEMA_VERSION = 1
+
+# Columns that can be averaged or trended
+TREND_COLUMNS = ("bmi", "bmr", "maintenance_calories", "weight_kg")
+
+_PROFILE_COLUMNS = (
+    "age", "gender", "height_cm", "weight_kg", "current_body_type",
+    "desired_body_type", "fitness_level", "goal", "activity_level"
+)
+_RESULT_COLUMNS = ("bmi", "bmr", "maintenance_calories")
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS analyses (
+    id INTEGER PRIMARY KEY,
+    user TEXT NOT NULL,
+    ts REAL NOT NULL,
+    age REAL,
+    gender TEXT,
+    height_cm REAL,
+    weight_kg REAL,
+    current_body_type TEXT,
+    desired_body_type TEXT,
+    fitness_level TEXT,
+    goal TEXT,
+    activity_level TEXT,
+    bmi REAL,
+    bmr REAL,
+    maintenance_calories REAL
+);
+CREATE INDEX IF NOT EXISTS analyses_user_ts ON analyses (user, ts);
+PRAGMA user_version = {SCHEMA_VERSION};
+"""
+
+_INSERT = (f"INSERT INTO analyses (user, ts, {', '.join(_PROFILE_COLUMNS + _RESULT_COLUMNS)}) "
+           f"VALUES ({', '.join('?' * (2 + len(_PROFILE_COLUMNS) + len(_RESULT_COLUMNS)))})")
+
+
+@dataclass(frozen=True)
+class HistoryEntry:
+    """One stored analysis"""
+    ts: float
+    weight_kg: float
+    bmi: float
+    bmr: float
+    maintenance_calories: float
+
+
+@dataclass(frozen=True)
+class TrendPoint:
+    """A value and its rolling average at one point in time"""
+    ts: float
+    value: float
+    average: float
+
+
+class HistoryStore:
+    """SQLite-backed analysis history"""
+
+    def __init__(self, path=":memory:", batch_size=DEFAULT_BATCH_SIZE):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        self._pending = []
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def record(self, result, user=DEFAULT_USER, ts=None):
+        """Queue one HealthResult; written once batch_size rows are queued"""
+        profile = result.profile
+        self._pending.append(
+            (user, time.time() if ts is None else ts)
+            + tuple(getattr(profile, name) for name in _PROFILE_COLUMNS)
+            + tuple(getattr(result, name) for name in _RESULT_COLUMNS)
+        )
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write queued rows in one transaction"""
+        if not self._pending:
+            return
+        with self._db:
+            self._db.executemany(_INSERT, self._pending)
+        self._pending.clear()
+
+    def close(self):
+        """Flush and close the database"""
+        self.flush()
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Queries (each flushes queued rows first)
+
+    def _query(self, sql, params):
+        self.flush()
+        return self._db.execute(sql, params).fetchall()
+
+    def latest(self, user=DEFAULT_USER, limit=1):
+        """The newest entries, newest first"""
+        rows = self._query(
+            "SELECT ts, weight_kg, bmi, bmr, maintenance_calories FROM analyses "
+            "WHERE user = ? ORDER BY ts DESC LIMIT ?", (user, limit))
+        return [HistoryEntry(*row) for row in rows]
+
+    def range(self, user=DEFAULT_USER, start=None, end=None):
+        """Entries with start <= ts < end, oldest first"""
+        rows = self._query(
+            "SELECT ts, weight_kg, bmi, bmr, maintenance_calories FROM analyses "
+            "WHERE user = ? AND ts >= ? AND ts < ? ORDER BY ts",
+            (user, float("-inf") if start is None else start, float("inf") if end is None else end))
+        return [HistoryEntry(*row) for row in rows]
+
+    def rolling_average(self, user=DEFAULT_USER, column="bmi", window=7, limit=30):
+        """The last limit values of column with their window-entry moving average
+
+        Only the limit + window - 1 newest rows are read, via the (user, ts)
+        index, so the cost does not depend on the size of the history.
+        Returns TrendPoints oldest first.
+        """
+        if column not in TREND_COLUMNS:
+            raise ValueError(f"Unknown trend column: {column}")
+        if window < 1 or limit < 1:
+            raise ValueError("window and limit must be positive")
+        rows = self._query(
+            f"SELECT ts, value, average FROM ("
+            f"  SELECT ts, value, AVG(value) OVER ("
+            f"    ORDER BY ts ROWS BETWEEN {window - 1} PRECEDING AND CURRENT ROW) AS average,"
+            f"    ROW_NUMBER() OVER (ORDER BY ts DESC) AS age"
+            f"  FROM (SELECT ts, {column} AS value FROM analyses"
+            f"        WHERE user = ? ORDER BY ts DESC LIMIT ?)"
+            f") WHERE age <= ? ORDER BY ts",
+            (user, limit + window - 1, limit))
+        return [TrendPoint(*row) for row in rows]
+
+    def average(self, user=DEFAULT_USER, column="bmi", start=None, end=None):
+        """Mean of column over start <= ts < end (None if there are no rows)"""
+        if column not in TREND_COLUMNS:
+            raise ValueError(f"Unknown trend column: {column}")
+        (value,), = self._query(
+            f"SELECT AVG({column}) FROM analyses WHERE user = ? AND ts >= ? AND ts < ?",
+            (user, float("-inf") if start is None else start, float("inf") if end is None else end))
+        return value
+
+    def users(self):
+        """Distinct users with history"""
+        return [user for user, in self._query("SELECT DISTINCT user FROM analyses ORDER BY user", ())]
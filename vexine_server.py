@@ -0,0 +1,490 @@
+"""Asyncio HTTP/JSON scoring service.
+
+Serves the Vexine analysis over plain HTTP/1.1 (keep-alive supported)
+using only the standard library and NumPy. Concurrent requests are
+micro-batched: they are queued and scored together in one vectorized
+evaluation once max_batch_size requests are waiting or max_wait has
+passed since the first one arrived.
+
+    python vexine.py serve --port 8080 --max-batch 256 --max-wait-ms 2
+
+POST /analyze with a JSON profile object (HealthProfile field names,
+missing fields take the defaults) or an array of them; add ?tips=bitset to
+get a compact tip-ID bitset instead of the tip text, rendered with the
+dictionary from GET /tips, and ?formula=harris_benedict (or any other
+vexine_engine.BMR_FORMULAS name) to pick the BMR equation. ?locale=es (or
+any other vexine_tips.LOCALES entry) returns the tips translated and
+personalized with the profile's protein and calorie numbers; GET
+/tips?locale=es serves the translated dictionary. GET /health and GET
+/stats return service status.
+"""
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+from dataclasses import fields, replace
+from urllib.parse import parse_qs
+
+import numpy as np
+
+import vexine_engine as engine
+from vexine_engine import HealthProfile
+from vexine_cohort import score_formulas, bmi_categories, recommendation_keys
+from vexine_tips import TipRenderer, LOCALES, tip_catalog
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+DEFAULT_MAX_BATCH_SIZE = 256
+DEFAULT_MAX_WAIT = 0.002
+MAX_BODY_BYTES = 1 << 20
+# Header lines per request; longer lines hit the 64 KiB stream limit
+MAX_HEADERS = 100
+
+PROFILE_FIELDS = {f.name: f.type for f in fields(HealthProfile)}
+TIP_MODES = ("text", "bitset")
+# Numeric fields and their accepted (low, high), the GUI spinbox ranges
+NUMERIC_RANGES = {
+    "age": engine.AGE_RANGE[:2],
+    "height_cm": engine.HEIGHT_RANGE[:2],
+    "weight_kg": engine.WEIGHT_RANGE[:2]
+}
+NUMERIC_FIELDS = tuple(NUMERIC_RANGES)
+
+STATUS_TEXT = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    422: "Unprocessable Entity",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error"
+}
+
+
+class RequestError(Exception):
+    """Client error carrying an HTTP status"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_profile(data):
+    """Build a HealthProfile from a decoded JSON object
+
+    Numbers outside NUMERIC_RANGES (NaN and Infinity included) are a 422,
+    so nothing unscorable ever reaches the batcher.
+    """
+    if not isinstance(data, dict):
+        raise RequestError(400, "Profile must be a JSON object")
+    unknown = set(data) - set(PROFILE_FIELDS)
+    if unknown:
+        raise RequestError(400, f"Unknown profile fields: {', '.join(sorted(unknown))}")
+    for name in NUMERIC_FIELDS:
+        value = data.get(name)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            raise RequestError(400, f"{name} must be a number")
+        low, high = NUMERIC_RANGES[name]
+        if value is not None and not (math.isfinite(value) and low <= value <= high):
+            raise RequestError(422, f"{name} must be between {low} and {high}")
+    for name, value in data.items():
+        if name not in NUMERIC_FIELDS and not isinstance(value, str):
+            raise RequestError(400, f"{name} must be a string")
+    return HealthProfile(**data)
+
+
+_TIP_CATALOG_JSON = json.dumps(engine.tip_catalog())
+_LOCALE_CATALOG_JSON = {}
+
+# Localized tips are rendered on the event loop thread only
+_TIP_RENDERER = TipRenderer()
+
+# Pre-serialized tip lists per recommendation key, e.g. '"nutrition_tips": [...], ...'
+_TIPS_JSON = {}
+
+
+def _tips_json(key):
+    fragment = _TIPS_JSON.get(key)
+    if fragment is None:
+        recommendations = engine.RECOMMENDATION_TABLE[key]
+        fragment = _TIPS_JSON[key] = ", ".join(
+            f'"{section}_tips": {json.dumps(getattr(recommendations, section))}'
+            for section in ("nutrition", "exercise", "lifestyle"))
+    return fragment
+
+
+def _localized_tips_json(key, locale, weight_kg, maintenance):
+    recommendations = engine.RECOMMENDATION_TABLE[key]
+    return ", ".join(
+        f'"{section}_tips": ' + json.dumps(_TIP_RENDERER.render_tips(
+            (engine.TIP_IDS[tip] for tip in getattr(recommendations, section)),
+            locale, weight_kg, maintenance))
+        for section in ("nutrition", "exercise", "lifestyle"))
+
+
+def _catalog_json(locale):
+    if locale is None:
+        return _TIP_CATALOG_JSON
+    catalog = _LOCALE_CATALOG_JSON.get(locale)
+    if catalog is None:
+        catalog = _LOCALE_CATALOG_JSON[locale] = json.dumps(tip_catalog(locale))
+    return catalog
+
+
+_FORMULA_COLUMNS = ("bmr", "maintenance_calories", "surplus_calories", "deficit_calories")
+
+
+def analyze_batch(profiles, formulas=None):
+    """Score a list of HealthProfiles in one vectorized pass
+
+    formulas optionally gives the BMR equation per profile (default
+    DEFAULT_BMR_FORMULA); every equation in the batch is evaluated in the
+    same pass. Returns one (metrics JSON without its closing brace,
+    recommendation key, weight_kg, maintenance calories) tuple per profile;
+    format_result() finishes the response body.
+    """
+    if formulas is None:
+        formulas = [engine.DEFAULT_BMR_FORMULA] * len(profiles)
+    names = sorted(set(formulas))
+    by_formula = score_formulas(
+        [p.height_cm for p in profiles],
+        [p.weight_kg for p in profiles],
+        [p.age for p in profiles],
+        [p.gender for p in profiles],
+        [p.activity_level for p in profiles],
+        formulas=names
+    )
+    scores = by_formula[names[0]]
+    if len(names) > 1:
+        # Pick each row's equation out of the per-formula results
+        choice = np.array([names.index(f) for f in formulas])
+        scores = replace(scores, **{
+            name: np.choose(choice, [getattr(by_formula[f], name) for f in names])
+            for name in _FORMULA_COLUMNS
+        })
+    keys = recommendation_keys(
+        scores.bmi,
+        [p.goal for p in profiles],
+        [p.fitness_level for p in profiles],
+        [p.desired_body_type for p in profiles]
+    ).tolist()
+    categories = bmi_categories(scores.bmi_band).tolist()
+    columns = zip(scores.bmi.tolist(), categories, scores.bmr.tolist(),
+                  scores.maintenance_calories.tolist(), scores.surplus_calories.tolist(),
+                  scores.deficit_calories.tolist(), keys, [p.weight_kg for p in profiles])
+    return [
+        (json.dumps({
+            "bmi": bmi,
+            "bmi_category": category,
+            "bmr": bmr,
+            "maintenance_calories": maintenance,
+            "surplus_calories": surplus,
+            "deficit_calories": deficit
+        })[:-1], key, weight_kg, maintenance)
+        for bmi, category, bmr, maintenance, surplus, deficit, key, weight_kg in columns
+    ]
+
+
+def analyze_requests(requests):
+    """analyze_batch() over (profile, formula) pairs, as queued by the server"""
+    profiles, formulas = zip(*requests)
+    return analyze_batch(profiles, formulas)
+
+
+def format_result(scored, tips="text", locale=None):
+    """Response JSON for one analyze_batch() entry
+
+    tips="text" includes the three tip lists, in locale and personalized
+    if a locale is given; tips="bitset" sends only "tip_bitset", a hex
+    string of tip IDs to render with GET /tips.
+    """
+    metrics, key, weight_kg, maintenance = scored
+    if tips == "bitset":
+        return f'{metrics}, "tip_bitset": "{engine.RECOMMENDATION_BITSETS[key]:x}"}}'
+    if locale is None:
+        return f"{metrics}, {_tips_json(key)}}}"
+    return f"{metrics}, {_localized_tips_json(key, locale, weight_kg, maintenance)}}}"
+
+
+class MicroBatcher:
+    """Coalesce concurrent submissions into batched evaluations
+
+    evaluate(items) must return one result per item, in order.
+    """
+
+    def __init__(self, evaluate, max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_wait=DEFAULT_MAX_WAIT):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.evaluate = evaluate
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.batches = 0
+        self.items = 0
+        self.largest_batch = 0
+        self._queue = None
+        self._task = None
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(self, item):
+        """Queue one item and wait for its result"""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                if self._queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(self._queue.get_nowait())
+            self._dispatch(batch)
+
+    def _dispatch(self, batch):
+        # Requests whose client went away have cancelled futures
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if not batch:
+            return
+        self.batches += 1
+        self.items += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+        try:
+            results = self.evaluate([item for item, _ in batch])
+        except Exception:
+            # Score the items one by one so only the failing request errors
+            for item, future in batch:
+                try:
+                    future.set_result(self.evaluate([item])[0])
+                except Exception as e:
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+    def stats(self):
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "largest_batch": self.largest_batch,
+            "mean_batch": self.items / self.batches if self.batches else 0.0,
+            "queued": self._queue.qsize() if self._queue is not None else 0
+        }
+
+
+class ScoringServer:
+    """HTTP front end over a MicroBatcher running analyze_requests"""
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT,
+                 max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_wait=DEFAULT_MAX_WAIT):
+        self.host = host
+        self.port = port
+        self.batcher = MicroBatcher(analyze_requests, max_batch_size, max_wait)
+        self.requests = 0
+        self.started = None
+        self._server = None
+
+    async def start(self):
+        """Start listening; port 0 picks a free port (see self.port)"""
+        self.batcher.start()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.started = time.time()
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.batcher.stop()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request_line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    # readline() raises ValueError once a line overruns the stream limit
+                    await self._respond(writer, 400, _error_json("Request line too long"), False)
+                    break
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, 400, _error_json("Malformed request line"), False)
+                    break
+
+                try:
+                    headers = await self._read_headers(reader)
+                except (ValueError, asyncio.LimitOverrunError):
+                    await self._respond(writer, 431, _error_json("Request headers too large"), False)
+                    break
+
+                keep_alive = (version == "HTTP/1.1"
+                              and headers.get("connection", "").lower() != "close")
+                try:
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    length = -1
+                if length < 0 or length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413 if length > 0 else 400,
+                                        _error_json("Bad Content-Length"), False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                self.requests += 1
+                status, payload = await self._dispatch(method, target, body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_headers(reader):
+        """Header lines up to the blank line, lower-cased names; ValueError past MAX_HEADERS"""
+        headers = {}
+        for _ in range(MAX_HEADERS + 1):
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                return headers
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        raise ValueError("Too many headers")
+
+    async def _dispatch(self, method, target, body):
+        path, _, query = target.partition('?')
+        try:
+            if path == "/analyze":
+                if method != "POST":
+                    raise RequestError(405, "Use POST")
+                params = parse_qs(query)
+                tips = params.get("tips", ["text"])[-1]
+                if tips not in TIP_MODES:
+                    raise RequestError(400, f"tips must be one of: {', '.join(TIP_MODES)}")
+                formula = params.get("formula", [engine.DEFAULT_BMR_FORMULA])[-1]
+                if formula not in engine.BMR_FORMULAS:
+                    raise RequestError(400, f"formula must be one of: {', '.join(engine.BMR_FORMULAS)}")
+                return 200, await self._analyze(body, tips, formula, self._locale(query))
+            if path == "/tips":
+                if method != "GET":
+                    raise RequestError(405, "Use GET")
+                return 200, _catalog_json(self._locale(query))
+            if path in ("/health", "/stats"):
+                if method != "GET":
+                    raise RequestError(405, "Use GET")
+                if path == "/health":
+                    return 200, '{"status": "ok"}'
+                return 200, json.dumps({
+                    "requests": self.requests,
+                    "uptime": time.time() - self.started,
+                    "batcher": self.batcher.stats()
+                })
+            raise RequestError(404, "Not found")
+        except RequestError as e:
+            return e.status, _error_json(str(e))
+        except Exception as e:
+            return 500, _error_json(f"Calculation failed: {e}")
+
+    @staticmethod
+    def _locale(query):
+        locale = parse_qs(query).get("locale", [None])[-1]
+        if locale is not None and locale not in LOCALES:
+            raise RequestError(400, f"locale must be one of: {', '.join(LOCALES)}")
+        return locale
+
+    async def _analyze(self, body, tips, formula, locale):
+        try:
+            data = json.loads(body)
+        except (ValueError, UnicodeDecodeError):
+            raise RequestError(400, "Body must be JSON")
+        if isinstance(data, list):
+            profiles = [parse_profile(item) for item in data]
+            results = await asyncio.gather(*(self.batcher.submit((p, formula)) for p in profiles))
+            return "[" + ", ".join(format_result(r, tips, locale) for r in results) + "]"
+        return format_result(await self.batcher.submit((parse_profile(data), formula)), tips, locale)
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        body = payload.encode('utf-8')
+        head = (f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+
+def _error_json(message):
+    return json.dumps({"error": message})
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT,
+                max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_wait=DEFAULT_MAX_WAIT):
+    """Run a ScoringServer until cancelled"""
+    server = ScoringServer(host, port, max_batch_size, max_wait)
+    await server.start()
+    print(f"Vexine scoring service on http://{server.host}:{server.port}", file=sys.stderr)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="vexine.py serve",
+        description="Serve the Vexine analysis over HTTP/JSON"
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH_SIZE,
+                        help=f"largest micro-batch (default {DEFAULT_MAX_BATCH_SIZE})")
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT * 1000,
+                        help=f"longest wait to fill a batch (default {DEFAULT_MAX_WAIT * 1000:g} ms)")
+    args = parser.parse_args(argv)
+
+    if args.max_batch < 1:
+        parser.error("--max-batch must be positive")
+    if args.max_wait_ms < 0:
+        parser.error("--max-wait-ms must not be negative")
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_batch, args.max_wait_ms / 1000))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,437 @@
+"""Compact columnar storage for profiles and their results.
+
+A ProfileStore keeps one typed stdlib array per field instead of one
+Python object per profile: float32 for the numeric inputs and metrics,
+uint8 codes for the option fields and a uint16 recommendation key, 33
+bytes a row. Columns export the buffer protocol, so slices are
+zero-copy memoryviews and NumPy can wrap them without copying.
+
+    store = ProfileStore()
+    store.append(profile, analyze(profile))
+    with store.slice(1000, 2000) as rows:
+        heights = rows["height_cm"]          # memoryview, format 'f'
+
+A column cannot grow while a view of it is alive, so release views (or
+use them in a with block) before appending again.
+
+Stores persist to a versioned binary file (.vxs) that open_store()
+memory-maps, so reopening costs the same for any size and columns are
+paged in only when touched:
+
+    offset 0   magic b"VEXSTORE", uint32 version, uint32 header length
+    offset 16  JSON header: row count, byte order, column table
+               (name, typecode, offset, nbytes) and the option lists
+    aligned    one fixed-width block per column, each 64-byte aligned
+"""
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from dataclasses import fields
+
+import vexine_engine as engine
+from vexine_engine import HealthProfile, HealthResult
+
+
+PROFILE_FIELDS = tuple(f.name for f in fields(HealthProfile))
+
+# Option fields stored as uint8 codes; values outside the lists get len(options)
+ENUM_FIELDS = {
+    "gender": engine.GENDERS,
+    "current_body_type": engine.CURRENT_BODY_TYPES,
+    "desired_body_type": engine.DESIRED_BODY_TYPES,
+    "fitness_level": engine.FITNESS_LEVELS,
+    "goal": engine.GOALS,
+    "activity_level": engine.ACTIVITY_LEVELS
+}
+
+# Array typecode per column: 'f' float32, 'B' uint8, 'H' uint16
+PROFILE_TYPECODES = {name: 'B' if name in ENUM_FIELDS else 'f' for name in PROFILE_FIELDS}
+RESULT_TYPECODES = {
+    "bmi": 'f',
+    "bmi_band": 'B',
+    "bmr": 'f',
+    "maintenance_calories": 'f',
+    "recommendation": 'H'
+}
+COLUMN_TYPECODES = {**PROFILE_TYPECODES, **RESULT_TYPECODES}
+
+# Result columns of rows without a valid result
+INVALID_BAND = 0xFF
+INVALID_RECOMMENDATION = 0xFFFF
+_MISSING_RESULT = {
+    "bmi": math.nan,
+    "bmi_band": INVALID_BAND,
+    "bmr": math.nan,
+    "maintenance_calories": math.nan,
+    "recommendation": INVALID_RECOMMENDATION
+}
+
+# Store file layout
+STORE_MAGIC = b"VEXSTORE"
+STORE_VERSION = 1
+STORE_SUFFIX = ".vxs"
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGNMENT = 64
+
+_ENUM_CODES = {name: {option: code for code, option in enumerate(options)}
+               for name, options in ENUM_FIELDS.items()}
+_PROFILE_DEFAULTS = HealthProfile()
+
+
+def encode_option(name, value):
+    """uint8 code of an option value (len(options) if unknown)"""
+    return _ENUM_CODES[name].get(value, len(ENUM_FIELDS[name]))
+
+
+def decode_option(name, code):
+    """Option value for a code ('' if unknown)"""
+    options = ENUM_FIELDS[name]
+    return options[code] if code < len(options) else ""
+
+
+def _to_array(name, values):
+    """Typed array for one column from a list or NumPy array"""
+    typecode = COLUMN_TYPECODES[name]
+    dtype = getattr(values, "dtype", None)
+    if name in ENUM_FIELDS and (dtype is None or dtype.kind not in "iu"):
+        values = [value if isinstance(value, int) else encode_option(name, value)
+                  for value in values]
+    elif dtype is not None:
+        # NumPy: convert once and copy the raw bytes
+        out = array(typecode)
+        out.frombytes(values.astype(typecode).tobytes())
+        return out
+    return array(typecode, values)
+
+
+def _align(offset):
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _jsonable(value):
+    return json.loads(json.dumps(value))
+
+
+class StoreFormatError(ValueError):
+    """Raised for files that are not readable store files"""
+
+
+class StoreSlice:
+    """Zero-copy window onto a ProfileStore: column name -> memoryview"""
+    __slots__ = ("_views",)
+
+    def __init__(self, columns, start, stop):
+        self._views = {name: memoryview(column)[start:stop] for name, column in columns.items()}
+
+    def __getitem__(self, name):
+        return self._views[name]
+
+    def __len__(self):
+        return len(self._views["height_cm"])
+
+    def keys(self):
+        return self._views.keys()
+
+    def release(self):
+        """Release the views so the store can grow again"""
+        for view in self._views.values():
+            view.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class _StoreReader:
+    """Row access shared by ProfileStore and MappedStore
+
+    Subclasses provide _columns (name -> array or memoryview), enums
+    (the option lists codes refer to) and _keys_current (whether
+    recommendation keys index the current RECOMMENDATION_TABLE).
+    """
+    __slots__ = ()
+
+    def __len__(self):
+        return len(self._columns["height_cm"])
+
+    @property
+    def nbytes(self):
+        """Bytes held by the columns"""
+        return sum(len(column) * column.itemsize for column in self._columns.values())
+
+    def column(self, name):
+        """Zero-copy memoryview of a whole column"""
+        return memoryview(self._columns[name])
+
+    def slice(self, start=0, stop=None):
+        """Zero-copy StoreSlice of rows [start, stop)"""
+        return StoreSlice(self._columns, start, len(self) if stop is None else stop)
+
+    def to_numpy(self, names=None):
+        """Zero-copy NumPy arrays per column (requires NumPy)"""
+        import numpy as np
+        return {name: np.frombuffer(self._columns[name], dtype=COLUMN_TYPECODES[name])
+                for name in names or COLUMN_TYPECODES}
+
+    def profile(self, i):
+        """HealthProfile of row i (numbers at float32 precision)"""
+        columns = self._columns
+        values = {}
+        for name in PROFILE_FIELDS:
+            value = columns[name][i]
+            if name in ENUM_FIELDS:
+                options = self.enums[name]
+                value = options[value] if value < len(options) else ""
+            elif name == "age" and value.is_integer():
+                value = int(value)
+            values[name] = value
+        return HealthProfile(**values)
+
+    def result(self, i):
+        """HealthResult of row i, or None if the row was not scored"""
+        columns = self._columns
+        key = columns["recommendation"][i]
+        if key == INVALID_RECOMMENDATION:
+            return None
+        if not self._keys_current:
+            raise StoreFormatError("Recommendation keys were written for a different tip table")
+        maintenance = columns["maintenance_calories"][i]
+        recommendations = engine.RECOMMENDATION_TABLE[key]
+        return HealthResult(
+            profile=self.profile(i),
+            bmi=columns["bmi"][i],
+            bmr=columns["bmr"][i],
+            maintenance_calories=maintenance,
+            surplus_calories=maintenance + engine.SURPLUS_CALORIES,
+            deficit_calories=maintenance - engine.DEFICIT_CALORIES,
+            nutrition_tips=recommendations.nutrition,
+            exercise_tips=recommendations.exercise,
+            lifestyle_tips=recommendations.lifestyle
+        )
+
+
+class ProfileStore(_StoreReader):
+    """Append-only columnar store of profiles and their metrics"""
+    __slots__ = ("_columns",)
+    enums = ENUM_FIELDS
+    _keys_current = True
+
+    def __init__(self):
+        self._columns = {name: array(typecode) for name, typecode in COLUMN_TYPECODES.items()}
+
+    def append(self, profile, result=None):
+        """Add one profile and its HealthResult (None if it could not be scored)"""
+        columns = self._columns
+        for name in PROFILE_FIELDS:
+            value = getattr(profile, name)
+            columns[name].append(encode_option(name, value) if name in ENUM_FIELDS else value)
+
+        if result is None:
+            for name, value in _MISSING_RESULT.items():
+                columns[name].append(value)
+            return
+        columns["bmi"].append(result.bmi)
+        columns["bmi_band"].append(result.bmi_band)
+        columns["bmr"].append(result.bmr)
+        columns["maintenance_calories"].append(result.maintenance_calories)
+        columns["recommendation"].append(engine.RECOMMENDATION_KEY_INDEX[engine.recommendation_key(
+            result.bmi, profile.goal, profile.fitness_level, profile.desired_body_type)])
+
+    def extend_columns(self, columns):
+        """Append whole columns (lists or NumPy arrays)
+
+        Option columns may hold strings or codes. Missing profile columns
+        take the HealthProfile defaults and missing result columns mark
+        the rows as unscored.
+        """
+        if not columns:
+            return
+        n = len(next(iter(columns.values())))
+        new = {}
+        for name in COLUMN_TYPECODES:
+            values = columns.get(name)
+            if values is None:
+                default = _MISSING_RESULT[name] if name in RESULT_TYPECODES else getattr(_PROFILE_DEFAULTS, name)
+                values = [default] * n
+            elif len(values) != n:
+                raise ValueError(f"Column {name} has {len(values)} rows, expected {n}")
+            new[name] = _to_array(name, values)
+        for name, values in new.items():
+            self._columns[name].extend(values)
+
+    def save(self, path):
+        """Write the store to a .vxs file (see open_store)"""
+        with StoreWriter(path) as writer:
+            writer.write(self)
+
+
+class StoreWriter:
+    """Write a store file chunk by chunk without holding it in memory
+
+    Column blocks are spooled to temporary files beside path and copied
+    behind the header by close().
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.rows = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        self._spools = {name: tempfile.TemporaryFile(dir=directory) for name in COLUMN_TYPECODES}
+
+    def write(self, store):
+        """Append all rows of a ProfileStore"""
+        for name, column in store._columns.items():
+            column.tofile(self._spools[name])
+        self.rows += len(store)
+
+    def extend_columns(self, columns):
+        """Append whole columns, as ProfileStore.extend_columns()"""
+        chunk = ProfileStore()
+        chunk.extend_columns(columns)
+        self.write(chunk)
+
+    def close(self):
+        """Write the header and column blocks, then drop the spools"""
+        if self._spools is None:
+            return
+        table, offset = [], 0
+        for name, typecode in COLUMN_TYPECODES.items():
+            nbytes = self._spools[name].tell()
+            table.append({"name": name, "typecode": typecode, "offset": offset, "nbytes": nbytes})
+            offset = _align(offset + nbytes)
+        header = json.dumps({
+            "version": STORE_VERSION,
+            "rows": self.rows,
+            "byteorder": sys.byteorder,
+            "columns": table,
+            "enums": ENUM_FIELDS,
+            "recommendation_domains": engine.RECOMMENDATION_KEY_DOMAINS,
+            "tip_catalog_version": engine.TIP_CATALOG_VERSION
+        }).encode('utf-8')
+
+        try:
+            with open(self.path, 'wb') as f:
+                f.write(_PREAMBLE.pack(STORE_MAGIC, STORE_VERSION, len(header)))
+                f.write(header)
+                data_start = _align(f.tell())
+                for entry in table:
+                    f.seek(data_start + entry["offset"])
+                    spool = self._spools[entry["name"]]
+                    spool.seek(0)
+                    while True:
+                        block = spool.read(1 << 20)
+                        if not block:
+                            break
+                        f.write(block)
+                f.truncate(max(f.tell(), data_start))
+        finally:
+            self.discard()
+
+    def discard(self):
+        """Drop the spooled rows without writing the file"""
+        if self._spools is not None:
+            for spool in self._spools.values():
+                spool.close()
+            self._spools = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+class MappedStore(_StoreReader):
+    """Read-only store backed by a memory-mapped .vxs file
+
+    Opening reads only the header; column blocks are memoryviews into the
+    mapping and are paged in by the OS as they are touched. Codes decode
+    with the option lists saved in the file. close() fails while views
+    or NumPy arrays of the columns are still alive.
+    """
+    __slots__ = ("path", "header", "enums", "_keys_current", "_file", "_mmap", "_view", "_columns")
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = self._view = None
+        self._columns = {}
+        try:
+            self._map()
+        except Exception:
+            self.close()
+            raise
+
+    def _map(self):
+        preamble = self._file.read(_PREAMBLE.size)
+        if len(preamble) < _PREAMBLE.size:
+            raise StoreFormatError(f"{self.path}: not a store file")
+        magic, version, header_size = _PREAMBLE.unpack(preamble)
+        if magic != STORE_MAGIC:
+            raise StoreFormatError(f"{self.path}: not a store file")
+        if version > STORE_VERSION:
+            raise StoreFormatError(f"{self.path}: store version {version} is newer than {STORE_VERSION}")
+        try:
+            self.header = json.loads(self._file.read(header_size).decode('utf-8'))
+        except ValueError as e:
+            raise StoreFormatError(f"{self.path}: corrupt header ({e})")
+        self.enums = {name: tuple(options) for name, options in self.header["enums"].items()}
+        self._keys_current = (self.header["recommendation_domains"]
+                              == _jsonable(engine.RECOMMENDATION_KEY_DOMAINS))
+
+        size = os.fstat(self._file.fileno()).st_size
+        data_start = _align(_PREAMBLE.size + header_size)
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        swap = self.header["byteorder"] != sys.byteorder
+        for entry in self.header["columns"]:
+            start = data_start + entry["offset"]
+            stop = start + entry["nbytes"]
+            if stop > size:
+                raise StoreFormatError(f"{self.path}: column {entry['name']} is truncated")
+            block = self._view[start:stop]
+            if swap and array(entry["typecode"]).itemsize > 1:
+                # Foreign byte order: this column is copied and swapped
+                column = array(entry["typecode"], block)
+                column.byteswap()
+                block.release()
+            else:
+                column = block.cast(entry["typecode"])
+            self._columns[entry["name"]] = column
+        if any(len(column) != self.header["rows"] for column in self._columns.values()):
+            raise StoreFormatError(f"{self.path}: column lengths do not match the row count")
+
+    def close(self):
+        """Unmap the file"""
+        for column in self._columns.values():
+            if isinstance(column, memoryview):
+                column.release()
+        self._columns = {}
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_store(path):
+    """Memory-map a store file written by ProfileStore.save() or StoreWriter"""
+    return MappedStore(path)
@@ -0,0 +1,675 @@
+"""Tip translations for vexine_tips, keyed by tip ID (see vexine_engine.TIP_CATALOG).
+
+TIP_TRANSLATIONS holds the plain text of every tip per locale; English is
+TIP_CATALOG itself. PERSONAL_TIP_TEMPLATES holds the personalized form of
+the tips listed in vexine_tips.TIP_PARAMETERS, with {low} and {high}
+fields for the computed grams or calories. Written against
+TIP_CATALOG_VERSION; bump it together with the engine's.
+"""
+
+TIP_CATALOG_VERSION = 1
+
+# Thousands separator per locale for personalized numbers
+NUMBER_SEPARATORS = {
+    "en": ",", "es": ".", "fr": "\u202f", "de": ".", "it": ".", "pt": ".", "nl": ".", "hi": ","
+}
+
+PERSONAL_TIP_TEMPLATES = {
+    "en": {
+        2: "Caloric surplus: {low}-{high} calories daily (+300-500 above maintenance)",
+        3: "Protein: {low}-{high}g daily (1.8-2.2g per kg bodyweight)",
+        6: "Caloric deficit: {low}-{high} calories daily (500-750 below maintenance)",
+        7: "Protein: {low}-{high}g daily to preserve muscle mass (1.6-2.0g per kg)",
+        11: "Moderate deficit: {low}-{high} calories daily (300-500 below maintenance)",
+        12: "Protein: {low}-{high}g daily (1.4-1.8g per kg bodyweight)",
+        16: "Protein: {low}-{high}g daily for maintenance (1.2-1.6g per kg)",
+        20: "Protein boost: Increase to {low}-{high}g daily (2.0-2.2g per kg)",
+    },
+    "es": {
+        2: "Superávit calórico: {low}-{high} calorías al día (+300-500 sobre mantenimiento)",
+        3: "Proteína: {low}-{high} g al día (1,8-2,2 g por kg de peso corporal)",
+        6: "Déficit calórico: {low}-{high} calorías al día (500-750 por debajo del mantenimiento)",
+        7: "Proteína: {low}-{high} g al día para preservar la masa muscular (1,6-2,0 g por kg)",
+        11: "Déficit moderado: {low}-{high} calorías al día (300-500 por debajo del mantenimiento)",
+        12: "Proteína: {low}-{high} g al día (1,4-1,8 g por kg de peso corporal)",
+        16: "Proteína: {low}-{high} g al día para mantenimiento (1,2-1,6 g por kg)",
+        20: "Más proteína: aumenta a {low}-{high} g al día (2,0-2,2 g por kg)",
+    },
+    "fr": {
+        2: "Surplus calorique : {low}-{high} calories par jour (+300-500 au-dessus de l'entretien)",
+        3: "Protéines : {low}-{high} g par jour (1,8-2,2 g par kg de poids corporel)",
+        6: "Déficit calorique : {low}-{high} calories par jour (500-750 sous l'entretien)",
+        7: "Protéines : {low}-{high} g par jour pour préserver la masse musculaire (1,6-2,0 g par kg)",
+        11: "Déficit modéré : {low}-{high} calories par jour (300-500 sous l'entretien)",
+        12: "Protéines : {low}-{high} g par jour (1,4-1,8 g par kg de poids corporel)",
+        16: "Protéines : {low}-{high} g par jour pour l'entretien (1,2-1,6 g par kg)",
+        20: "Apport protéique : passer à {low}-{high} g par jour (2,0-2,2 g par kg)",
+    },
+    "de": {
+        2: "Kalorienüberschuss: {low}-{high} Kalorien täglich (+300-500 über dem Erhaltungsbedarf)",
+        3: "Protein: {low}-{high} g täglich (1,8-2,2 g pro kg Körpergewicht)",
+        6: "Kaloriendefizit: {low}-{high} Kalorien täglich (500-750 unter dem Erhaltungsbedarf)",
+        7: "Protein: {low}-{high} g täglich zum Erhalt der Muskelmasse (1,6-2,0 g pro kg)",
+        11: "Moderates Defizit: {low}-{high} Kalorien täglich (300-500 unter dem Erhaltungsbedarf)",
+        12: "Protein: {low}-{high} g täglich (1,4-1,8 g pro kg Körpergewicht)",
+        16: "Protein: {low}-{high} g täglich zum Erhalt (1,2-1,6 g pro kg)",
+        20: "Mehr Protein: Auf {low}-{high} g täglich erhöhen (2,0-2,2 g pro kg)",
+    },
+    "it": {
+        2: "Surplus calorico: {low}-{high} calorie al giorno (+300-500 sopra il mantenimento)",
+        3: "Proteine: {low}-{high} g al giorno (1,8-2,2 g per kg di peso corporeo)",
+        6: "Deficit calorico: {low}-{high} calorie al giorno (500-750 sotto il mantenimento)",
+        7: "Proteine: {low}-{high} g al giorno per preservare la massa muscolare (1,6-2,0 g per kg)",
+        11: "Deficit moderato: {low}-{high} calorie al giorno (300-500 sotto il mantenimento)",
+        12: "Proteine: {low}-{high} g al giorno (1,4-1,8 g per kg di peso corporeo)",
+        16: "Proteine: {low}-{high} g al giorno per il mantenimento (1,2-1,6 g per kg)",
+        20: "Più proteine: aumenta a {low}-{high} g al giorno (2,0-2,2 g per kg)",
+    },
+    "pt": {
+        2: "Superávit calórico: {low}-{high} calorias por dia (+300-500 acima da manutenção)",
+        3: "Proteína: {low}-{high} g por dia (1,8-2,2 g por kg de peso corporal)",
+        6: "Déficit calórico: {low}-{high} calorias por dia (500-750 abaixo da manutenção)",
+        7: "Proteína: {low}-{high} g por dia para preservar a massa muscular (1,6-2,0 g por kg)",
+        11: "Déficit moderado: {low}-{high} calorias por dia (300-500 abaixo da manutenção)",
+        12: "Proteína: {low}-{high} g por dia (1,4-1,8 g por kg de peso corporal)",
+        16: "Proteína: {low}-{high} g por dia para manutenção (1,2-1,6 g por kg)",
+        20: "Reforço de proteína: aumente para {low}-{high} g por dia (2,0-2,2 g por kg)",
+    },
+    "nl": {
+        2: "Calorie-overschot: {low}-{high} calorieën per dag (+300-500 boven onderhoud)",
+        3: "Eiwit: {low}-{high} g per dag (1,8-2,2 g per kg lichaamsgewicht)",
+        6: "Calorietekort: {low}-{high} calorieën per dag (500-750 onder onderhoud)",
+        7: "Eiwit: {low}-{high} g per dag om spiermassa te behouden (1,6-2,0 g per kg)",
+        11: "Matig tekort: {low}-{high} calorieën per dag (300-500 onder onderhoud)",
+        12: "Eiwit: {low}-{high} g per dag (1,4-1,8 g per kg lichaamsgewicht)",
+        16: "Eiwit: {low}-{high} g per dag voor onderhoud (1,2-1,6 g per kg)",
+        20: "Extra eiwit: verhoog naar {low}-{high} g per dag (2,0-2,2 g per kg)",
+    },
+    "hi": {
+        2: "कैलोरी अधिशेष: रोज़ {low}-{high} कैलोरी (मेंटेनेंस से +300-500 अधिक)",
+        3: "प्रोटीन: रोज़ {low}-{high} ग्राम (1.8-2.2 ग्राम प्रति किलो शरीर भार)",
+        6: "कैलोरी घाटा: रोज़ {low}-{high} कैलोरी (मेंटेनेंस से 500-750 कम)",
+        7: "प्रोटीन: मांसपेशियाँ बचाने के लिए रोज़ {low}-{high} ग्राम (1.6-2.0 ग्राम प्रति किलो)",
+        11: "मध्यम घाटा: रोज़ {low}-{high} कैलोरी (मेंटेनेंस से 300-500 कम)",
+        12: "प्रोटीन: रोज़ {low}-{high} ग्राम (1.4-1.8 ग्राम प्रति किलो शरीर भार)",
+        16: "प्रोटीन: मेंटेनेंस के लिए रोज़ {low}-{high} ग्राम (1.2-1.6 ग्राम प्रति किलो)",
+        20: "प्रोटीन बढ़ाएँ: रोज़ {low}-{high} ग्राम तक (2.0-2.2 ग्राम प्रति किलो)",
+    },
+}
+
+TIP_TRANSLATIONS = {
+    "es": {
+        # Nutrition
+        0: "Hidratación: mínimo 3-4 litros de agua al día",
+        1: "Frecuencia de comidas: 5-6 comidas pequeñas para un metabolismo óptimo",
+        2: "Superávit calórico: +300-500 calorías sobre el mantenimiento",
+        3: "Proteína: 1,8-2,2 g por kg de peso corporal al día",
+        4: "Grasas saludables: frutos secos, aguacate, aceite de oliva, pescado azul",
+        5: "Carbohidratos densos: avena, arroz, pasta, boniato",
+        6: "Déficit calórico: 500-750 calorías por debajo del mantenimiento",
+        7: "Proteína: 1,6-2,0 g por kg para preservar la masa muscular",
+        8: "Elimina: bebidas azucaradas, ultraprocesados, carbohidratos refinados",
+        9: "Gran volumen: llena el 50% del plato con verduras",
+        10: "Horario de comidas: deja de comer 3 horas antes de dormir",
+        11: "Déficit moderado: 300-500 calorías menos al día",
+        12: "Proteína: 1,4-1,8 g por kg de peso corporal",
+        13: "Carbohidratos complejos: cambia a integrales, reduce los refinados",
+        14: "Picoteo inteligente: yogur griego, frutos secos (en porciones), fruta",
+        15: "Macros equilibrados: 40% carbohidratos / 30% proteína / 30% grasas",
+        16: "Proteína: 1,2-1,6 g por kg para mantenimiento",
+        17: "Variedad: incluye todos los grupos de alimentos con moderación",
+        18: "Post-entreno: 30 g de proteína en los 30 minutos siguientes",
+        19: "Carbohidratos pre-entreno: avena, plátano, arroz para tener energía",
+        20: "Más proteína: aumenta a 2,0-2,2 g por kg",
+        21: "Registro: usa MyFitnessPal o una app similar",
+        22: "Fibra: 30 g o más al día de verduras y frutas",
+        23: "Sodio: limítalo para reducir la retención de líquidos",
+        24: "Timing de nutrientes: ciclado de carbohidratos en días de entreno",
+        25: "Suplementos: considera creatina, proteína en polvo, BCAA",
+        # Exercise
+        26: "Frecuencia: 3-4 sesiones por semana, de 30-45 minutos",
+        27: "Base de cardio: caminar/trotar 20-30 minutos, 3 veces por semana",
+        28: "Básicos con peso corporal: sentadillas, flexiones, planchas (2x10 repeticiones)",
+        29: "La técnica primero: domínala antes de añadir peso",
+        30: "Recuperación: 48 horas de descanso antes de entrenar los mismos músculos",
+        31: "Frecuencia: 4-5 sesiones semanales, de 45-60 minutos",
+        32: "Entrenamiento dividido: torso/pierna o empuje/tirón/pierna",
+        33: "Cardio: 30-40 minutos, 3 veces por semana (correr, bici, natación)",
+        34: "Sobrecarga progresiva: aumenta el peso un 2,5-5% cada semana",
+        35: "Frecuencia: 5-6 sesiones semanales, con intensidad variada",
+        36: "Divisiones avanzadas: PPL o rutina por grupos musculares con periodización",
+        37: "Técnicas de intensidad: series descendentes, superseries, rest-pause",
+        38: "Semana de descarga: cada 4-6 semanas reduce el volumen un 50%",
+        39: "Prioridad a la fuerza: 70% pesas, 30% cardio",
+        40: "Ejercicios compuestos: peso muerto, sentadilla, press de banca, remo (4x6-8)",
+        41: "Límite de cardio: máximo 2 veces por semana, sesiones de 20 minutos",
+        42: "Cardio de bajo impacto: natación, bici, elíptica",
+        43: "Duración: empieza con 15-20 minutos y progresa hasta 45",
+        44: "Pesas: 2 veces por semana para preservar la masa muscular",
+        45: "Flexibilidad: estiramientos o yoga a diario para ganar movilidad",
+        46: "Entrenamiento HIIT: 20-30 minutos, 3-4 veces por semana",
+        47: "Pesas: 3 veces por semana, cuerpo completo o rutina dividida",
+        48: "Recuperación activa: caminar o nadar en los días de descanso",
+        49: "Compuestos pesados: 4-6 repeticiones, 4-5 series, 80-85% de 1RM",
+        50: "Levantamientos básicos: peso muerto, sentadilla, banca, press militar, remo",
+        51: "Tiempo bajo tensión: controla la fase excéntrica (3 segundos)",
+        52: "Entrenamiento en circuito: 12-15 repeticiones, descanso mínimo (30 s)",
+        53: "Acondicionamiento metabólico: burpees, swings con kettlebell",
+        54: "HIIT: intervalos de 30 s de trabajo / 30 s de descanso, 20 minutos",
+        55: "Entrenamiento funcional: TRX, kettlebells, cuerdas de batalla",
+        56: "Pliometría: saltos al cajón, sentadillas con salto, burpees",
+        57: "Agilidad: escalera de coordinación, conos, sprints por intervalos",
+        58: "Objetivo de gasto: 300-500 calorías por sesión",
+        59: "Pasos diarios: apunta a 10.000 o más con un podómetro",
+        60: "Cardio mínimo: 2 veces por semana como máximo para preservar masa",
+        61: "Sobrecarga progresiva: registra y supera tus marcas cada semana",
+        # Lifestyle
+        62: "El sueño es prioritario: 7-9 horas cada noche para la recuperación y las hormonas",
+        63: "Gestión del estrés: 10 minutos diarios de meditación o respiración",
+        64: "Seguimiento del progreso: fotos, medidas y registro de peso semanales",
+        65: "Constancia: los resultados se ven tras 8-12 semanas como mínimo",
+        66: "Compromiso: se recomienda un compañero de entreno o un entrenador",
+        67: "Preparación de comidas: cocina con 3 días de antelación para evitar malas elecciones",
+        68: "Escucha a tu cuerpo: descansa cuando estés fatigado para evitar lesiones",
+        69: "Suplementación: lo básico es multivitamínico, vitamina D y omega-3",
+        70: "Crear hábitos: empieza poco a poco y avanza gradualmente",
+        71: "Sin comparaciones: céntrate solo en tu propio progreso",
+        72: "Fase de aprendizaje: mira vídeos de técnica y pide ayuda",
+        73: "Coaching: considera contratar a un especialista para optimizar",
+        74: "Periodización: planifica mesociclos para evitar estancamientos",
+        75: "Herramientas de recuperación: rodillo de espuma, masajes, baños de hielo",
+        76: "Métricas avanzadas: controla la VFC, la calidad del sueño y tu disposición",
+    },
+    "fr": {
+        # Nutrition
+        0: "Hydratation : 3 à 4 litres d'eau par jour au minimum",
+        1: "Fréquence des repas : 5 à 6 petits repas pour un métabolisme optimal",
+        2: "Surplus calorique : +300 à 500 calories au-dessus de l'entretien",
+        3: "Protéines : 1,8-2,2 g par kg de poids corporel par jour",
+        4: "Bonnes graisses : noix, avocats, huile d'olive, poissons gras",
+        5: "Glucides denses : avoine, riz, pâtes, patates douces",
+        6: "Déficit calorique : 500 à 750 calories sous l'entretien",
+        7: "Protéines : 1,6-2,0 g par kg pour préserver la masse musculaire",
+        8: "À éliminer : boissons sucrées, aliments transformés, glucides raffinés",
+        9: "Volume élevé : remplissez la moitié de l'assiette de légumes",
+        10: "Horaires des repas : arrêtez de manger 3 heures avant le coucher",
+        11: "Déficit modéré : 300 à 500 calories de moins par jour",
+        12: "Protéines : 1,4-1,8 g par kg de poids corporel",
+        13: "Glucides complexes : passez aux céréales complètes, réduisez les raffinés",
+        14: "Collations malines : yaourt grec, noix (en portions), fruits",
+        15: "Macros équilibrées : 40 % glucides / 30 % protéines / 30 % lipides",
+        16: "Protéines : 1,2-1,6 g par kg pour l'entretien",
+        17: "Variété : incluez tous les groupes d'aliments avec modération",
+        18: "Après l'entraînement : 30 g de protéines dans les 30 minutes",
+        19: "Glucides avant l'entraînement : avoine, banane, riz pour l'énergie",
+        20: "Apport protéique : passez à 2,0-2,2 g par kg",
+        21: "Suivi : utilisez MyFitnessPal ou une application similaire",
+        22: "Fibres : 30 g ou plus par jour grâce aux légumes et aux fruits",
+        23: "Sodium : limitez-le pour réduire la rétention d'eau",
+        24: "Timing nutritionnel : cyclage des glucides les jours d'entraînement",
+        25: "Compléments : pensez à la créatine, la protéine en poudre, les BCAA",
+        # Exercise
+        26: "Fréquence : 3 à 4 séances par semaine, de 30 à 45 minutes",
+        27: "Base cardio : marche/jogging 20 à 30 minutes, 3 fois par semaine",
+        28: "Bases au poids du corps : squats, pompes, gainage (2x10 répétitions)",
+        29: "La technique d'abord : maîtrisez le mouvement avant d'ajouter du poids",
+        30: "Récupération : 48 heures de repos avant de retravailler les mêmes muscles",
+        31: "Fréquence : 4 à 5 séances par semaine, de 45 à 60 minutes",
+        32: "Programme divisé : haut/bas du corps ou poussée/tirage/jambes",
+        33: "Cardio : 30 à 40 minutes, 3 fois par semaine (course, vélo, natation)",
+        34: "Surcharge progressive : augmentez la charge de 2,5 à 5 % par semaine",
+        35: "Fréquence : 5 à 6 séances par semaine, intensité variée",
+        36: "Programmes avancés : PPL ou split par muscle avec périodisation",
+        37: "Techniques d'intensité : séries dégressives, supersets, rest-pause",
+        38: "Semaine de décharge : toutes les 4 à 6 semaines, réduisez le volume de 50 %",
+        39: "Priorité à la force : 70 % musculation, 30 % cardio",
+        40: "Polyarticulaires : soulevé de terre, squat, développé couché, rowing (4x6-8)",
+        41: "Cardio limité : 2 fois par semaine maximum, séances de 20 minutes",
+        42: "Cardio à faible impact : natation, vélo, elliptique",
+        43: "Durée : commencez par 15 à 20 minutes, progressez jusqu'à 45 minutes",
+        44: "Musculation : 2 fois par semaine pour préserver la masse musculaire",
+        45: "Souplesse : étirements ou yoga quotidiens pour la mobilité",
+        46: "Entraînement HIIT : 20 à 30 minutes, 3 à 4 fois par semaine",
+        47: "Musculation : 3 fois par semaine en full-body ou en programme divisé",
+        48: "Récupération active : marche ou natation les jours de repos",
+        49: "Polyarticulaires lourds : 4-6 répétitions, 4-5 séries, 80-85 % du 1RM",
+        50: "Mouvements de base : soulevé de terre, squat, développé couché, développé militaire, rowing",
+        51: "Temps sous tension : contrôlez la phase excentrique (3 secondes)",
+        52: "Circuit training : 12 à 15 répétitions, repos minimal (30 s)",
+        53: "Conditionnement métabolique : burpees, swings au kettlebell",
+        54: "HIIT : intervalles de 30 s d'effort / 30 s de repos, 20 minutes",
+        55: "Entraînement fonctionnel : TRX, kettlebells, cordes ondulatoires",
+        56: "Pliométrie : sauts sur box, squats sautés, burpees",
+        57: "Agilité : échelle de rythme, plots, sprints fractionnés",
+        58: "Objectif de dépense : 300 à 500 calories par séance",
+        59: "Pas quotidiens : visez 10 000 ou plus avec un podomètre",
+        60: "Cardio minimal : 2 fois par semaine maximum pour préserver la masse",
+        61: "Surcharge progressive : notez et battez vos charges chaque semaine",
+        # Lifestyle
+        62: "Priorité au sommeil : 7 à 9 heures par nuit pour la récupération et les hormones",
+        63: "Gestion du stress : 10 minutes de méditation ou de respiration par jour",
+        64: "Suivi des progrès : photos, mensurations et pesée chaque semaine",
+        65: "Régularité : des résultats visibles après 8 à 12 semaines au minimum",
+        66: "Motivation : un partenaire d'entraînement ou un coach est recommandé",
+        67: "Préparation des repas : cuisinez 3 jours à l'avance pour éviter les écarts",
+        68: "Écoutez votre corps : reposez-vous en cas de fatigue pour éviter les blessures",
+        69: "Compléments de base : multivitamines, vitamine D, oméga-3",
+        70: "Création d'habitudes : commencez petit, progressez graduellement",
+        71: "Pas de comparaison : concentrez-vous sur vos propres progrès",
+        72: "Phase d'apprentissage : regardez des vidéos de technique, demandez de l'aide",
+        73: "Coaching : envisagez un spécialiste pour optimiser",
+        74: "Périodisation : planifiez des mésocycles pour éviter les plateaux",
+        75: "Outils de récupération : rouleau de massage, massages, bains glacés",
+        76: "Indicateurs avancés : suivez la VFC, la qualité du sommeil, la forme du jour",
+    },
+    "de": {
+        # Nutrition
+        0: "Flüssigkeit: mindestens 3-4 Liter Wasser täglich",
+        1: "Mahlzeitenfrequenz: 5-6 kleine Mahlzeiten für einen optimalen Stoffwechsel",
+        2: "Kalorienüberschuss: +300-500 Kalorien über dem Erhaltungsbedarf",
+        3: "Protein: 1,8-2,2 g pro kg Körpergewicht täglich",
+        4: "Gesunde Fette: Nüsse, Avocados, Olivenöl, fetter Fisch",
+        5: "Energiedichte Kohlenhydrate: Hafer, Reis, Nudeln, Süßkartoffeln",
+        6: "Kaloriendefizit: 500-750 Kalorien unter dem Erhaltungsbedarf",
+        7: "Protein: 1,6-2,0 g pro kg zum Erhalt der Muskelmasse",
+        8: "Weglassen: Zuckerhaltige Getränke, Fertigprodukte, raffinierte Kohlenhydrate",
+        9: "Viel Volumen: Den halben Teller mit Gemüse füllen",
+        10: "Essenszeiten: 3 Stunden vor dem Schlafen nichts mehr essen",
+        11: "Moderates Defizit: 300-500 Kalorien weniger pro Tag",
+        12: "Protein: 1,4-1,8 g pro kg Körpergewicht",
+        13: "Komplexe Kohlenhydrate: Auf Vollkorn umsteigen, raffinierte reduzieren",
+        14: "Clevere Snacks: Griechischer Joghurt, Nüsse (portioniert), Obst",
+        15: "Ausgewogene Makros: 40 % Kohlenhydrate / 30 % Protein / 30 % Fett",
+        16: "Protein: 1,2-1,6 g pro kg zum Erhalt",
+        17: "Vielfalt: Alle Lebensmittelgruppen in Maßen einbeziehen",
+        18: "Nach dem Training: 30 g Protein innerhalb von 30 Minuten",
+        19: "Kohlenhydrate vor dem Training: Hafer, Banane, Reis für Energie",
+        20: "Mehr Protein: Auf 2,0-2,2 g pro kg erhöhen",
+        21: "Tracking: MyFitnessPal oder eine ähnliche App nutzen",
+        22: "Ballaststoffe: Täglich 30 g+ aus Gemüse und Obst",
+        23: "Natrium: Begrenzen, um Wassereinlagerungen zu reduzieren",
+        24: "Nährstoff-Timing: Carb Cycling an Trainingstagen",
+        25: "Supplemente: Kreatin, Proteinpulver, BCAAs in Betracht ziehen",
+        # Exercise
+        26: "Häufigkeit: 3-4 Einheiten pro Woche, je 30-45 Minuten",
+        27: "Cardio-Grundlage: Gehen/Joggen 20-30 Minuten, 3x wöchentlich",
+        28: "Grundübungen mit Körpergewicht: Kniebeugen, Liegestütze, Planks (2x10 Wdh.)",
+        29: "Technik zuerst: Die Ausführung beherrschen, bevor Gewicht dazukommt",
+        30: "Erholung: 48 Stunden Pause, bevor dieselben Muskeln wieder trainiert werden",
+        31: "Häufigkeit: 4-5 Einheiten wöchentlich, je 45-60 Minuten",
+        32: "Split-Training: Oberkörper/Unterkörper oder Push/Pull/Beine",
+        33: "Cardio: 30-40 Minuten, 3x wöchentlich (Laufen, Radfahren, Schwimmen)",
+        34: "Progressive Überlastung: Gewicht wöchentlich um 2,5-5 % steigern",
+        35: "Häufigkeit: 5-6 Einheiten wöchentlich, wechselnde Intensität",
+        36: "Fortgeschrittene Splits: PPL oder Bro-Split mit Periodisierung",
+        37: "Intensitätstechniken: Drop-Sets, Supersätze, Rest-Pause",
+        38: "Deload-Woche: Alle 4-6 Wochen das Volumen um 50 % reduzieren",
+        39: "Kraftfokus: 70 % Krafttraining, 30 % Cardio",
+        40: "Grundübungen: Kreuzheben, Kniebeugen, Bankdrücken, Rudern (4x6-8)",
+        41: "Cardio begrenzen: Höchstens 2x wöchentlich, Einheiten von 20 Minuten",
+        42: "Gelenkschonendes Cardio: Schwimmen, Radfahren, Crosstrainer",
+        43: "Dauer: Mit 15-20 Minuten beginnen, auf 45 Minuten steigern",
+        44: "Krafttraining: 2x wöchentlich zum Erhalt der Muskelmasse",
+        45: "Beweglichkeit: Tägliches Dehnen oder Yoga für mehr Mobilität",
+        46: "HIIT-Training: 20-30 Minuten, 3-4x wöchentlich",
+        47: "Krafttraining: 3x wöchentlich als Ganzkörper- oder Split-Training",
+        48: "Aktive Erholung: Gehen oder Schwimmen an Ruhetagen",
+        49: "Schwere Grundübungen: 4-6 Wdh., 4-5 Sätze, 80-85 % des 1RM",
+        50: "Hauptübungen: Kreuzheben, Kniebeugen, Bankdrücken, Schulterdrücken, Rudern",
+        51: "Zeit unter Spannung: Die exzentrische Phase kontrollieren (3 Sekunden)",
+        52: "Zirkeltraining: 12-15 Wdh., minimale Pause (30 s)",
+        53: "Metabolische Konditionierung: Burpees, Kettlebell Swings",
+        54: "HIIT: 30 s Belastung / 30 s Pause, 20 Minuten",
+        55: "Funktionelles Training: TRX, Kettlebells, Battle Ropes",
+        56: "Plyometrie: Box Jumps, Sprungkniebeugen, Burpees",
+        57: "Agilität: Koordinationsleiter, Hütchenläufe, Sprintintervalle",
+        58: "Kalorienverbrauch: 300-500 pro Einheit anstreben",
+        59: "Tägliche Schritte: 10.000+ per Schrittzähler anstreben",
+        60: "Wenig Cardio: Höchstens 2x wöchentlich, um Masse zu erhalten",
+        61: "Progressive Überlastung: Gewichte notieren und wöchentlich übertreffen",
+        # Lifestyle
+        62: "Schlaf hat Vorrang: 7-9 Stunden pro Nacht für Erholung und Hormone",
+        63: "Stressbewältigung: Täglich 10 Minuten Meditation oder Atemübungen",
+        64: "Fortschritt festhalten: Wöchentlich Fotos, Maße und Gewicht notieren",
+        65: "Beständigkeit: Ergebnisse zeigen sich frühestens nach 8-12 Wochen",
+        66: "Verbindlichkeit: Trainingspartner oder Coach empfohlen",
+        67: "Meal Prep: 3 Tage im Voraus vorkochen, um schlechte Entscheidungen zu vermeiden",
+        68: "Auf den Körper hören: Bei Erschöpfung ruhen, um Verletzungen vorzubeugen",
+        69: "Nahrungsergänzung: Multivitamin, Vitamin D, Omega-3 als Basis",
+        70: "Gewohnheiten aufbauen: Klein anfangen, schrittweise steigern",
+        71: "Keine Vergleiche: Nur auf den eigenen Fortschritt achten",
+        72: "Lernphase: Technikvideos ansehen, um Hilfe bitten",
+        73: "Coaching: Einen Spezialisten für die Optimierung in Betracht ziehen",
+        74: "Periodisierung: Mesozyklen planen, um Plateaus zu vermeiden",
+        75: "Erholungshilfen: Faszienrolle, Massage, Eisbäder",
+        76: "Fortgeschrittene Werte: HRV, Schlafqualität und Tagesform verfolgen",
+    },
+    "it": {
+        # Nutrition
+        0: "Idratazione: almeno 3-4 litri d'acqua al giorno",
+        1: "Frequenza dei pasti: 5-6 piccoli pasti per un metabolismo ottimale",
+        2: "Surplus calorico: +300-500 calorie sopra il mantenimento",
+        3: "Proteine: 1,8-2,2 g per kg di peso corporeo al giorno",
+        4: "Grassi sani: frutta secca, avocado, olio d'oliva, pesce grasso",
+        5: "Carboidrati densi: avena, riso, pasta, patate dolci",
+        6: "Deficit calorico: 500-750 calorie sotto il mantenimento",
+        7: "Proteine: 1,6-2,0 g per kg per preservare la massa muscolare",
+        8: "Elimina: bevande zuccherate, cibi processati, carboidrati raffinati",
+        9: "Molto volume: riempi metà del piatto di verdure",
+        10: "Orari dei pasti: smetti di mangiare 3 ore prima di dormire",
+        11: "Deficit moderato: 300-500 calorie in meno al giorno",
+        12: "Proteine: 1,4-1,8 g per kg di peso corporeo",
+        13: "Carboidrati complessi: passa ai cereali integrali, riduci quelli raffinati",
+        14: "Spuntini intelligenti: yogurt greco, frutta secca (in porzioni), frutta",
+        15: "Macro bilanciati: 40% carboidrati / 30% proteine / 30% grassi",
+        16: "Proteine: 1,2-1,6 g per kg per il mantenimento",
+        17: "Varietà: includi tutti i gruppi alimentari con moderazione",
+        18: "Post-allenamento: 30 g di proteine entro 30 minuti",
+        19: "Carboidrati pre-allenamento: avena, banana, riso per l'energia",
+        20: "Più proteine: aumenta a 2,0-2,2 g per kg",
+        21: "Monitoraggio: usa MyFitnessPal o un'app simile",
+        22: "Fibre: 30 g o più al giorno da verdura e frutta",
+        23: "Sodio: limitalo per ridurre la ritenzione idrica",
+        24: "Timing dei nutrienti: carb cycling nei giorni di allenamento",
+        25: "Integratori: valuta creatina, proteine in polvere, BCAA",
+        # Exercise
+        26: "Frequenza: 3-4 sedute a settimana, da 30-45 minuti",
+        27: "Base cardio: camminata/corsa leggera 20-30 minuti, 3 volte a settimana",
+        28: "Esercizi a corpo libero: squat, piegamenti, plank (2x10 ripetizioni)",
+        29: "Prima la tecnica: padroneggiala prima di aggiungere peso",
+        30: "Recupero: 48 ore di riposo prima di allenare gli stessi muscoli",
+        31: "Frequenza: 4-5 sedute settimanali, da 45-60 minuti",
+        32: "Allenamento diviso: parte alta/bassa o spinta/tirata/gambe",
+        33: "Cardio: 30-40 minuti, 3 volte a settimana (corsa, bici, nuoto)",
+        34: "Sovraccarico progressivo: aumenta il peso del 2,5-5% a settimana",
+        35: "Frequenza: 5-6 sedute settimanali, intensità variabile",
+        36: "Split avanzati: PPL o split per gruppo muscolare con periodizzazione",
+        37: "Tecniche di intensità: drop set, superserie, rest-pause",
+        38: "Settimana di scarico: ogni 4-6 settimane riduci il volume del 50%",
+        39: "Focus sulla forza: 70% pesi, 30% cardio",
+        40: "Multiarticolari: stacchi, squat, panca piana, rematore (4x6-8)",
+        41: "Limite di cardio: massimo 2 volte a settimana, sedute da 20 minuti",
+        42: "Cardio a basso impatto: nuoto, bici, ellittica",
+        43: "Durata: inizia con 15-20 minuti, arriva a 45 minuti",
+        44: "Pesi: 2 volte a settimana per preservare la massa muscolare",
+        45: "Flessibilità: stretching o yoga ogni giorno per la mobilità",
+        46: "Allenamento HIIT: 20-30 minuti, 3-4 volte a settimana",
+        47: "Pesi: 3 volte a settimana, full body o scheda divisa",
+        48: "Recupero attivo: camminata o nuoto nei giorni di riposo",
+        49: "Multiarticolari pesanti: 4-6 ripetizioni, 4-5 serie, 80-85% dell'1RM",
+        50: "Alzate fondamentali: stacco, squat, panca, lento avanti, rematore",
+        51: "Tempo sotto tensione: controlla la fase eccentrica (3 secondi)",
+        52: "Circuito: 12-15 ripetizioni, recupero minimo (30 s)",
+        53: "Condizionamento metabolico: burpees, swing con kettlebell",
+        54: "HIIT: intervalli di 30 s di lavoro / 30 s di recupero, 20 minuti",
+        55: "Allenamento funzionale: TRX, kettlebell, battle rope",
+        56: "Pliometria: box jump, squat jump, burpees",
+        57: "Agilità: scaletta, esercizi con i coni, sprint a intervalli",
+        58: "Obiettivo di consumo: 300-500 calorie per seduta",
+        59: "Passi giornalieri: punta a 10.000 o più con un contapassi",
+        60: "Cardio minimo: massimo 2 volte a settimana per preservare la massa",
+        61: "Sovraccarico progressivo: annota e migliora i carichi ogni settimana",
+        # Lifestyle
+        62: "Priorità al sonno: 7-9 ore a notte per recupero e ormoni",
+        63: "Gestione dello stress: 10 minuti al giorno di meditazione o respirazione",
+        64: "Monitoraggio dei progressi: foto, misure e peso ogni settimana",
+        65: "Costanza: risultati visibili dopo almeno 8-12 settimane",
+        66: "Responsabilità: consigliato un compagno di allenamento o un coach",
+        67: "Meal prep: prepara i pasti con 3 giorni di anticipo per evitare scelte sbagliate",
+        68: "Ascolta il corpo: riposa quando sei affaticato per evitare infortuni",
+        69: "Integrazione di base: multivitaminico, vitamina D, omega-3",
+        70: "Creare abitudini: inizia in piccolo, cresci gradualmente",
+        71: "Niente confronti: concentrati solo sui tuoi progressi",
+        72: "Fase di apprendimento: guarda video sulla tecnica, chiedi aiuto",
+        73: "Coaching: valuta uno specialista per ottimizzare",
+        74: "Periodizzazione: pianifica i mesocicli per evitare stalli",
+        75: "Strumenti di recupero: foam roller, massaggi, bagni nel ghiaccio",
+        76: "Metriche avanzate: monitora HRV, qualità del sonno, prontezza",
+    },
+    "pt": {
+        # Nutrition
+        0: "Hidratação: mínimo de 3-4 litros de água por dia",
+        1: "Frequência das refeições: 5-6 pequenas refeições para um metabolismo ideal",
+        2: "Superávit calórico: +300-500 calorias acima da manutenção",
+        3: "Proteína: 1,8-2,2 g por kg de peso corporal por dia",
+        4: "Gorduras saudáveis: oleaginosas, abacate, azeite, peixes gordos",
+        5: "Carboidratos densos: aveia, arroz, massa, batata-doce",
+        6: "Déficit calórico: 500-750 calorias abaixo da manutenção",
+        7: "Proteína: 1,6-2,0 g por kg para preservar a massa muscular",
+        8: "Elimine: bebidas açucaradas, alimentos processados, carboidratos refinados",
+        9: "Muito volume: preencha metade do prato com vegetais",
+        10: "Horário das refeições: pare de comer 3 horas antes de dormir",
+        11: "Déficit moderado: 300-500 calorias a menos por dia",
+        12: "Proteína: 1,4-1,8 g por kg de peso corporal",
+        13: "Carboidratos complexos: troque por integrais, reduza os refinados",
+        14: "Lanches inteligentes: iogurte grego, oleaginosas (porcionadas), frutas",
+        15: "Macros equilibrados: 40% carboidratos / 30% proteína / 30% gorduras",
+        16: "Proteína: 1,2-1,6 g por kg para manutenção",
+        17: "Variedade: inclua todos os grupos alimentares com moderação",
+        18: "Pós-treino: 30 g de proteína em até 30 minutos",
+        19: "Carboidratos pré-treino: aveia, banana, arroz para energia",
+        20: "Reforço de proteína: aumente para 2,0-2,2 g por kg",
+        21: "Registro: use o MyFitnessPal ou um app parecido",
+        22: "Fibras: 30 g ou mais por dia de vegetais e frutas",
+        23: "Sódio: limite para reduzir a retenção de líquidos",
+        24: "Timing de nutrientes: ciclo de carboidratos nos dias de treino",
+        25: "Suplementos: considere creatina, proteína em pó, BCAAs",
+        # Exercise
+        26: "Frequência: 3-4 sessões por semana, de 30-45 minutos",
+        27: "Base de cardio: caminhada/corrida leve 20-30 minutos, 3x por semana",
+        28: "Básicos com peso corporal: agachamentos, flexões, pranchas (2x10 repetições)",
+        29: "Técnica primeiro: domine o movimento antes de adicionar peso",
+        30: "Recuperação: 48 horas de descanso antes de treinar os mesmos músculos",
+        31: "Frequência: 4-5 sessões semanais, de 45-60 minutos",
+        32: "Treino dividido: superior/inferior ou empurrar/puxar/pernas",
+        33: "Cardio: 30-40 minutos, 3x por semana (corrida, bicicleta, natação)",
+        34: "Sobrecarga progressiva: aumente o peso 2,5-5% por semana",
+        35: "Frequência: 5-6 sessões semanais, intensidade variada",
+        36: "Divisões avançadas: PPL ou divisão por grupo muscular com periodização",
+        37: "Técnicas de intensidade: drop sets, supersets, rest-pause",
+        38: "Semana de deload: a cada 4-6 semanas reduza o volume em 50%",
+        39: "Foco em força: 70% musculação, 30% cardio",
+        40: "Compostos: levantamento terra, agachamento, supino, remada (4x6-8)",
+        41: "Limite de cardio: no máximo 2x por semana, sessões de 20 minutos",
+        42: "Cardio de baixo impacto: natação, bicicleta, elíptico",
+        43: "Duração: comece com 15-20 minutos e progrida até 45 minutos",
+        44: "Musculação: 2x por semana para preservar a massa muscular",
+        45: "Flexibilidade: alongamento ou ioga diários para a mobilidade",
+        46: "Treino HIIT: 20-30 minutos, 3-4x por semana",
+        47: "Musculação: 3x por semana, corpo inteiro ou treino dividido",
+        48: "Recuperação ativa: caminhada ou natação nos dias de descanso",
+        49: "Compostos pesados: 4-6 repetições, 4-5 séries, 80-85% de 1RM",
+        50: "Levantamentos básicos: terra, agachamento, supino, desenvolvimento, remada",
+        51: "Tempo sob tensão: controle a fase excêntrica (3 segundos)",
+        52: "Treino em circuito: 12-15 repetições, descanso mínimo (30 s)",
+        53: "Condicionamento metabólico: burpees, swings com kettlebell",
+        54: "HIIT: intervalos de 30 s de esforço / 30 s de descanso, 20 minutos",
+        55: "Treino funcional: TRX, kettlebells, cordas navais",
+        56: "Pliometria: saltos na caixa, agachamentos com salto, burpees",
+        57: "Agilidade: escada de agilidade, cones, tiros intervalados",
+        58: "Meta de gasto: 300-500 calorias por sessão",
+        59: "Passos diários: busque 10.000 ou mais com um pedômetro",
+        60: "Cardio mínimo: no máximo 2x por semana para preservar massa",
+        61: "Sobrecarga progressiva: registre e supere suas cargas toda semana",
+        # Lifestyle
+        62: "Sono em primeiro lugar: 7-9 horas por noite para recuperação e hormônios",
+        63: "Controle do estresse: 10 minutos diários de meditação ou respiração",
+        64: "Acompanhamento: fotos, medidas e registro de peso semanais",
+        65: "Consistência: resultados visíveis após no mínimo 8-12 semanas",
+        66: "Compromisso: parceiro de treino ou treinador recomendado",
+        67: "Preparo de refeições: prepare com 3 dias de antecedência para evitar más escolhas",
+        68: "Ouça seu corpo: descanse quando estiver cansado para evitar lesões",
+        69: "Suplementação básica: multivitamínico, vitamina D, ômega-3",
+        70: "Criação de hábitos: comece pequeno, evolua aos poucos",
+        71: "Sem comparações: foque apenas no seu próprio progresso",
+        72: "Fase de aprendizado: assista a vídeos de técnica, peça ajuda",
+        73: "Acompanhamento profissional: considere um especialista para otimizar",
+        74: "Periodização: planeje mesociclos para evitar platôs",
+        75: "Ferramentas de recuperação: rolo de espuma, massagem, banhos de gelo",
+        76: "Métricas avançadas: acompanhe VFC, qualidade do sono, prontidão",
+    },
+    "nl": {
+        # Nutrition
+        0: "Hydratatie: minimaal 3-4 liter water per dag",
+        1: "Maaltijdfrequentie: 5-6 kleine maaltijden voor een optimale stofwisseling",
+        2: "Calorie-overschot: +300-500 calorieën boven onderhoud",
+        3: "Eiwit: 1,8-2,2 g per kg lichaamsgewicht per dag",
+        4: "Gezonde vetten: noten, avocado's, olijfolie, vette vis",
+        5: "Energierijke koolhydraten: havermout, rijst, pasta, zoete aardappel",
+        6: "Calorietekort: 500-750 calorieën onder onderhoud",
+        7: "Eiwit: 1,6-2,0 g per kg om spiermassa te behouden",
+        8: "Schrappen: suikerhoudende dranken, bewerkt voedsel, geraffineerde koolhydraten",
+        9: "Veel volume: vul de helft van je bord met groenten",
+        10: "Eettijden: stop 3 uur voor het slapengaan met eten",
+        11: "Matig tekort: 300-500 calorieën minder per dag",
+        12: "Eiwit: 1,4-1,8 g per kg lichaamsgewicht",
+        13: "Complexe koolhydraten: kies volkoren, minder geraffineerde koolhydraten",
+        14: "Slim snacken: Griekse yoghurt, noten (afgemeten), fruit",
+        15: "Gebalanceerde macro's: 40% koolhydraten / 30% eiwit / 30% vet",
+        16: "Eiwit: 1,2-1,6 g per kg voor onderhoud",
+        17: "Variatie: eet met mate uit alle voedselgroepen",
+        18: "Na de training: 30 g eiwit binnen 30 minuten",
+        19: "Koolhydraten voor de training: havermout, banaan, rijst voor energie",
+        20: "Extra eiwit: verhoog naar 2,0-2,2 g per kg",
+        21: "Bijhouden: gebruik MyFitnessPal of een vergelijkbare app",
+        22: "Vezels: dagelijks 30 g+ uit groenten en fruit",
+        23: "Natrium: beperken om vochtvasthouden te verminderen",
+        24: "Nutriënttiming: koolhydraatcycli op trainingsdagen",
+        25: "Supplementen: overweeg creatine, eiwitpoeder, BCAA's",
+        # Exercise
+        26: "Frequentie: 3-4 trainingen per week, elk 30-45 minuten",
+        27: "Cardiobasis: wandelen/joggen 20-30 minuten, 3x per week",
+        28: "Basis met lichaamsgewicht: squats, push-ups, planken (2x10 herhalingen)",
+        29: "Techniek eerst: beheers de uitvoering voordat je gewicht toevoegt",
+        30: "Herstel: 48 uur rust voordat je dezelfde spieren weer traint",
+        31: "Frequentie: 4-5 trainingen per week, elk 45-60 minuten",
+        32: "Splitschema: boven-/onderlichaam of push/pull/benen",
+        33: "Cardio: 30-40 minuten, 3x per week (hardlopen, fietsen, zwemmen)",
+        34: "Progressieve overbelasting: verhoog het gewicht wekelijks met 2,5-5%",
+        35: "Frequentie: 5-6 trainingen per week, wisselende intensiteit",
+        36: "Gevorderde schema's: PPL of bro-split met periodisering",
+        37: "Intensiteitstechnieken: dropsets, supersets, rest-pause",
+        38: "Deloadweek: verlaag elke 4-6 weken het volume met 50%",
+        39: "Focus op kracht: 70% krachttraining, 30% cardio",
+        40: "Basisoefeningen: deadlifts, squats, bankdrukken, roeien (4x6-8)",
+        41: "Cardio beperken: maximaal 2x per week, sessies van 20 minuten",
+        42: "Cardio met lage impact: zwemmen, fietsen, crosstrainer",
+        43: "Duur: begin met 15-20 minuten, bouw op naar 45 minuten",
+        44: "Krachttraining: 2x per week om spiermassa te behouden",
+        45: "Flexibiliteit: dagelijks stretchen of yoga voor mobiliteit",
+        46: "HIIT-training: 20-30 minuten, 3-4x per week",
+        47: "Krachttraining: 3x per week, full-body of splitschema",
+        48: "Actief herstel: wandelen of zwemmen op rustdagen",
+        49: "Zware basisoefeningen: 4-6 herhalingen, 4-5 sets, 80-85% van 1RM",
+        50: "Kernoefeningen: deadlift, squat, bankdrukken, overhead press, roeien",
+        51: "Time under tension: beheers de excentrische fase (3 seconden)",
+        52: "Circuittraining: 12-15 herhalingen, minimale rust (30 s)",
+        53: "Metabole conditionering: burpees, kettlebell swings",
+        54: "HIIT: intervallen van 30 s werk / 30 s rust, 20 minuten",
+        55: "Functionele training: TRX, kettlebells, battle ropes",
+        56: "Plyometrie: box jumps, jump squats, burpees",
+        57: "Wendbaarheid: ladderoefeningen, pionnenoefeningen, sprintintervallen",
+        58: "Verbrandingsdoel: 300-500 calorieën per training",
+        59: "Dagelijkse stappen: mik op 10.000+ met een stappenteller",
+        60: "Minimale cardio: maximaal 2x per week om massa te behouden",
+        61: "Progressieve overbelasting: noteer en verbeter je gewichten elke week",
+        # Lifestyle
+        62: "Slaap voorop: 7-9 uur per nacht voor herstel en hormonen",
+        63: "Stressbeheersing: dagelijks 10 minuten meditatie of ademhaling",
+        64: "Voortgang bijhouden: wekelijkse foto's, metingen en gewichtslog",
+        65: "Consistentie: resultaten zichtbaar na minimaal 8-12 weken",
+        66: "Stok achter de deur: trainingsmaatje of coach aanbevolen",
+        67: "Maaltijden voorbereiden: 3 dagen vooruit koken om slechte keuzes te voorkomen",
+        68: "Luister naar je lichaam: rust bij vermoeidheid om blessures te voorkomen",
+        69: "Basissupplementen: multivitamine, vitamine D, omega-3",
+        70: "Gewoontes vormen: begin klein, bouw geleidelijk op",
+        71: "Niet vergelijken: focus alleen op je eigen vooruitgang",
+        72: "Leerfase: bekijk techniekvideo's, vraag om hulp",
+        73: "Coaching: overweeg een specialist voor optimalisatie",
+        74: "Periodisering: plan mesocycli om plateaus te voorkomen",
+        75: "Hersteltools: foamrollen, massage, ijsbaden",
+        76: "Geavanceerde metingen: volg HRV, slaapkwaliteit, paraatheid",
+    },
+    "hi": {
+        # Nutrition
+        0: "जल सेवन: रोज़ कम से कम 3-4 लीटर पानी",
+        1: "भोजन की आवृत्ति: बेहतर मेटाबॉलिज़्म के लिए 5-6 छोटे भोजन",
+        2: "कैलोरी अधिशेष: मेंटेनेंस से +300-500 कैलोरी अधिक",
+        3: "प्रोटीन: रोज़ 1.8-2.2 ग्राम प्रति किलो शरीर भार",
+        4: "स्वस्थ वसा: मेवे, एवोकाडो, जैतून का तेल, वसायुक्त मछली",
+        5: "ऊर्जा-सघन कार्ब्स: ओट्स, चावल, पास्ता, शकरकंद",
+        6: "कैलोरी घाटा: मेंटेनेंस से 500-750 कैलोरी कम",
+        7: "प्रोटीन: मांसपेशियाँ बचाने के लिए 1.6-2.0 ग्राम प्रति किलो",
+        8: "छोड़ें: मीठे पेय, प्रोसेस्ड फ़ूड, रिफ़ाइंड कार्ब्स",
+        9: "अधिक मात्रा: आधी थाली सब्ज़ियों से भरें",
+        10: "भोजन का समय: सोने से 3 घंटे पहले खाना बंद करें",
+        11: "मध्यम घाटा: रोज़ 300-500 कैलोरी कम",
+        12: "प्रोटीन: 1.4-1.8 ग्राम प्रति किलो शरीर भार",
+        13: "जटिल कार्ब्स: साबुत अनाज अपनाएँ, रिफ़ाइंड कार्ब्स घटाएँ",
+        14: "समझदारी से स्नैक्स: ग्रीक योगर्ट, मेवे (सीमित मात्रा), फल",
+        15: "संतुलित मैक्रो: 40% कार्ब्स / 30% प्रोटीन / 30% वसा",
+        16: "प्रोटीन: मेंटेनेंस के लिए 1.2-1.6 ग्राम प्रति किलो",
+        17: "विविधता: सभी खाद्य समूह संतुलित मात्रा में लें",
+        18: "वर्कआउट के बाद: 30 मिनट के भीतर 30 ग्राम प्रोटीन",
+        19: "वर्कआउट से पहले कार्ब्स: ऊर्जा के लिए ओट्स, केला, चावल",
+        20: "प्रोटीन बढ़ाएँ: 2.0-2.2 ग्राम प्रति किलो तक",
+        21: "ट्रैकिंग: MyFitnessPal या ऐसा ही कोई ऐप इस्तेमाल करें",
+        22: "फ़ाइबर: सब्ज़ियों और फलों से रोज़ 30 ग्राम+",
+        23: "सोडियम: पानी रुकने से बचने के लिए सीमित करें",
+        24: "पोषक तत्वों का समय: ट्रेनिंग वाले दिनों में कार्ब साइक्लिंग",
+        25: "सप्लीमेंट: क्रिएटिन, प्रोटीन पाउडर, BCAA पर विचार करें",
+        # Exercise
+        26: "आवृत्ति: हफ़्ते में 3-4 सत्र, हर एक 30-45 मिनट",
+        27: "कार्डियो की नींव: 20-30 मिनट पैदल चलना/जॉगिंग, हफ़्ते में 3 बार",
+        28: "बॉडीवेट बेसिक्स: स्क्वैट, पुश-अप, प्लैंक (2x10 रेप्स)",
+        29: "पहले फ़ॉर्म: वज़न बढ़ाने से पहले तकनीक सीखें",
+        30: "रिकवरी: एक ही मांसपेशियों की ट्रेनिंग के बीच 48 घंटे आराम",
+        31: "आवृत्ति: हफ़्ते में 4-5 सत्र, हर एक 45-60 मिनट",
+        32: "स्प्लिट ट्रेनिंग: अपर/लोअर या पुश/पुल/लेग्स",
+        33: "कार्डियो: 30-40 मिनट, हफ़्ते में 3 बार (दौड़, साइकिल, तैराकी)",
+        34: "प्रोग्रेसिव ओवरलोड: हर हफ़्ते वज़न 2.5-5% बढ़ाएँ",
+        35: "आवृत्ति: हफ़्ते में 5-6 सत्र, अलग-अलग तीव्रता",
+        36: "एडवांस्ड स्प्लिट: पीरियडाइज़ेशन के साथ PPL या ब्रो-स्प्लिट",
+        37: "तीव्रता तकनीकें: ड्रॉप सेट, सुपरसेट, रेस्ट-पॉज़",
+        38: "डीलोड सप्ताह: हर 4-6 हफ़्ते में वॉल्यूम 50% घटाएँ",
+        39: "ताकत पर ध्यान: 70% रेज़िस्टेंस, 30% कार्डियो",
+        40: "कंपाउंड: डेडलिफ़्ट, स्क्वैट, बेंच प्रेस, रो (4x6-8)",
+        41: "कार्डियो सीमा: हफ़्ते में अधिकतम 2 बार, 20 मिनट के सत्र",
+        42: "कम प्रभाव वाला कार्डियो: तैराकी, साइकिल, एलिप्टिकल",
+        43: "अवधि: 15-20 मिनट से शुरू करें, 45 मिनट तक बढ़ाएँ",
+        44: "रेज़िस्टेंस: मांसपेशियाँ बचाने के लिए हफ़्ते में 2 बार",
+        45: "लचीलापन: गतिशीलता के लिए रोज़ स्ट्रेचिंग या योग",
+        46: "HIIT ट्रेनिंग: 20-30 मिनट, हफ़्ते में 3-4 बार",
+        47: "रेज़िस्टेंस: हफ़्ते में 3 बार फ़ुल-बॉडी या स्प्लिट रूटीन",
+        48: "सक्रिय रिकवरी: आराम के दिनों में पैदल चलना, तैराकी",
+        49: "भारी कंपाउंड: 4-6 रेप्स, 4-5 सेट, 1RM का 80-85%",
+        50: "मुख्य लिफ़्ट: डेडलिफ़्ट, स्क्वैट, बेंच, OHP, रो",
+        51: "टाइम अंडर टेंशन: एक्सेंट्रिक चरण नियंत्रित करें (3 सेकंड)",
+        52: "सर्किट ट्रेनिंग: 12-15 रेप्स, न्यूनतम आराम (30 सेकंड)",
+        53: "मेटाबॉलिक कंडीशनिंग: बर्पी, केटलबेल स्विंग",
+        54: "HIIT: 30 सेकंड काम / 30 सेकंड आराम के अंतराल, 20 मिनट",
+        55: "फ़ंक्शनल ट्रेनिंग: TRX, केटलबेल, बैटल रोप",
+        56: "प्लायोमेट्रिक्स: बॉक्स जंप, जंप स्क्वैट, बर्पी",
+        57: "फुर्ती: लैडर ड्रिल, कोन ड्रिल, स्प्रिंट इंटरवल",
+        58: "कैलोरी बर्न लक्ष्य: प्रति सत्र 300-500",
+        59: "रोज़ के कदम: पेडोमीटर से 10,000+ का लक्ष्य रखें",
+        60: "न्यूनतम कार्डियो: मसल बचाने के लिए हफ़्ते में अधिकतम 2 बार",
+        61: "प्रोग्रेसिव ओवरलोड: हर हफ़्ते अपनी लिफ़्ट ट्रैक करें और बेहतर करें",
+        # Lifestyle
+        62: "नींद सबसे पहले: रिकवरी और हार्मोन के लिए हर रात 7-9 घंटे",
+        63: "तनाव प्रबंधन: रोज़ 10 मिनट ध्यान या श्वास अभ्यास",
+        64: "प्रगति ट्रैकिंग: साप्ताहिक फ़ोटो, माप और वज़न लॉग",
+        65: "निरंतरता: नतीजे कम से कम 8-12 हफ़्तों बाद दिखते हैं",
+        66: "जवाबदेही: ट्रेनिंग पार्टनर या कोच की सलाह दी जाती है",
+        67: "मील प्रेप: गलत विकल्पों से बचने के लिए 3 दिन पहले तैयारी करें",
+        68: "शरीर की सुनें: चोट से बचने के लिए थकान होने पर आराम करें",
+        69: "सप्लीमेंट: मल्टीविटामिन, विटामिन D, ओमेगा-3 बुनियादी",
+        70: "आदत बनाना: छोटे से शुरू करें, धीरे-धीरे बढ़ाएँ",
+        71: "तुलना नहीं: केवल अपनी प्रगति पर ध्यान दें",
+        72: "सीखने का चरण: फ़ॉर्म वीडियो देखें, मदद माँगें",
+        73: "कोचिंग: बेहतर नतीजों के लिए विशेषज्ञ रखने पर विचार करें",
+        74: "पीरियडाइज़ेशन: ठहराव से बचने के लिए मेसोसाइकिल की योजना बनाएँ",
+        75: "रिकवरी साधन: फ़ोम रोलिंग, मालिश, आइस बाथ",
+        76: "एडवांस्ड मेट्रिक्स: HRV, नींद की गुणवत्ता, तैयारी ट्रैक करें",
+    },
+}
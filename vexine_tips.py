@@ -0,0 +1,237 @@
+"""Localized, personalized tip rendering.
+
+Tips are addressed by tip ID (see vexine_engine.TIP_CATALOG). Each locale's
+catalog (vexine_tip_locales) is compiled once, on first use, into plain
+strings for fixed tips and %-format strings for the personalized ones,
+whose {low} / {high} fields are filled from the profile: grams of protein
+from weight_kg, calorie targets from the maintenance calories. Parameters
+are quantized (PROTEIN_QUANTUM, CALORIE_QUANTUM) and rendered strings are
+kept in a bounded LRU keyed by (locale, tip ID, low, high), so repeated
+renders are a dict lookup.
+
+    renderer = TipRenderer()
+    tips = renderer.render_result(result, "es")
+    tips.nutrition        # ("Hidratación: ...", "Proteína: 115-140 g al día ...", ...)
+"""
+import math
+import string
+from collections import OrderedDict
+
+import vexine_engine as engine
+from vexine_engine import Recommendations, TIP_CATALOG, TIP_IDS
+from vexine_tip_locales import (
+    TIP_TRANSLATIONS, PERSONAL_TIP_TEMPLATES, NUMBER_SEPARATORS, TIP_CATALOG_VERSION
+)
+
+
+LOCALES = ("en", "es", "fr", "de", "it", "pt", "nl", "hi")
+DEFAULT_LOCALE = "en"
+
+# Personalized values are rounded to these steps (grams, calories)
+PROTEIN_QUANTUM = 5
+CALORIE_QUANTUM = 50
+
+PROTEIN = "protein"     # low/high = weight_kg * g per kg
+CALORIES = "calories"   # low/high = maintenance calories + offset
+
+# Personalized tips: tip -> (kind, low, high)
+TIP_PARAMETERS = {
+    TIP_IDS[tip]: parameters for tip, parameters in {
+        "Caloric surplus: +300-500 calories above maintenance": (CALORIES, 300, 500),
+        "Protein: 1.8-2.2g per kg bodyweight daily": (PROTEIN, 1.8, 2.2),
+        "Caloric deficit: -500-750 calories below maintenance": (CALORIES, -750, -500),
+        "Protein: 1.6-2.0g per kg to preserve muscle mass": (PROTEIN, 1.6, 2.0),
+        "Moderate deficit: -300-500 calories daily": (CALORIES, -500, -300),
+        "Protein: 1.4-1.8g per kg bodyweight": (PROTEIN, 1.4, 1.8),
+        "Protein: 1.2-1.6g per kg for maintenance": (PROTEIN, 1.2, 1.6),
+        "Protein boost: Increase to 2.0-2.2g per kg": (PROTEIN, 2.0, 2.2),
+    }.items()
+}
+TEMPLATE_FIELDS = ("low", "high")
+
+if TIP_CATALOG_VERSION != engine.TIP_CATALOG_VERSION:
+    raise ValueError(f"Tip translations are for catalog version {TIP_CATALOG_VERSION}, "
+                     f"not {engine.TIP_CATALOG_VERSION}")
+
+_FORMATTER = string.Formatter()
+
+
+def match_locale(tag):
+    """Supported locale for a tag such as "pt_BR.UTF-8" or "de-AT", else None"""
+    if not tag:
+        return None
+    language = tag.replace("-", "_").split(".")[0].split("_")[0].lower()
+    return language if language in LOCALES else None
+
+
+def check_locale(locale):
+    """Raise ValueError unless locale is one of LOCALES"""
+    if locale not in LOCALES:
+        raise ValueError(f"Unknown locale {locale!r}; choose from {', '.join(LOCALES)}")
+    return locale
+
+
+def compile_template(template):
+    """Turn a "{low}-{high}" template into a %-format string and its field order"""
+    parts = []
+    order = []
+    for literal, field, spec, conversion in _FORMATTER.parse(template):
+        parts.append(literal.replace("%", "%%"))
+        if field is None:
+            continue
+        if field not in TEMPLATE_FIELDS or spec or conversion:
+            raise ValueError(f"Unsupported template field {{{field}}} in {template!r}")
+        parts.append("%s")
+        order.append(TEMPLATE_FIELDS.index(field))
+    return "".join(parts), tuple(order)
+
+
+class CompiledLocale:
+    """One locale's tips: plain texts plus compiled personalized templates"""
+
+    def __init__(self, locale):
+        check_locale(locale)
+        self.locale = locale
+        translations = TIP_TRANSLATIONS.get(locale, {})
+        # Untranslated tips fall back to English
+        self.texts = tuple(translations.get(tip_id, tip) for tip_id, tip in enumerate(TIP_CATALOG))
+        self.templates = {tip_id: compile_template(template)
+                          for tip_id, template in PERSONAL_TIP_TEMPLATES.get(locale, {}).items()}
+        self.separator = NUMBER_SEPARATORS.get(locale, ",")
+
+    def number(self, value):
+        """Integer with the locale's thousands separator"""
+        text = f"{value:,}"
+        return text if self.separator == "," else text.replace(",", self.separator)
+
+    def format(self, tip_id, low, high):
+        """Personalized text of tip_id (no caching)"""
+        pattern, order = self.templates[tip_id]
+        values = (self.number(low), self.number(high))
+        return pattern % tuple(values[i] for i in order)
+
+
+def _quantize(value, quantum):
+    return int(round(value / quantum)) * quantum
+
+
+def tip_parameters(tip_id, weight_kg=None, maintenance_calories=None):
+    """Quantized (low, high) for a personalized tip, or None if not personalized
+
+    None is also returned when the value the tip needs is missing or not finite.
+    """
+    parameters = TIP_PARAMETERS.get(tip_id)
+    if parameters is None:
+        return None
+    kind, low, high = parameters
+    if kind == PROTEIN:
+        if weight_kg is None or not math.isfinite(weight_kg):
+            return None
+        return _quantize(weight_kg * low, PROTEIN_QUANTUM), _quantize(weight_kg * high, PROTEIN_QUANTUM)
+    if maintenance_calories is None or not math.isfinite(maintenance_calories):
+        return None
+    return (_quantize(maintenance_calories + low, CALORIE_QUANTUM),
+            _quantize(maintenance_calories + high, CALORIE_QUANTUM))
+
+
+class TipRenderer:
+    """Renders tip IDs per locale with a bounded LRU of personalized strings
+
+    Fixed tips come straight from the compiled locale; only personalized
+    ones go through the cache. Not thread-safe: use one per thread.
+    """
+
+    def __init__(self, maxsize=4096):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._locales = {}
+        self._rendered = OrderedDict()
+
+    def __len__(self):
+        return len(self._rendered)
+
+    def compiled(self, locale):
+        """CompiledLocale for locale, compiled on first use"""
+        compiled = self._locales.get(locale)
+        if compiled is None:
+            compiled = self._locales[locale] = CompiledLocale(locale)
+        return compiled
+
+    def render(self, tip_id, locale=DEFAULT_LOCALE, weight_kg=None, maintenance_calories=None):
+        """Text of one tip; personalized when it has parameters and the values are given"""
+        compiled = self.compiled(locale)
+        if tip_id not in compiled.templates:
+            return compiled.texts[tip_id]
+        return self._render_personal(compiled, tip_id, weight_kg, maintenance_calories)
+
+    def _render_personal(self, compiled, tip_id, weight_kg, maintenance_calories):
+        parameters = tip_parameters(tip_id, weight_kg, maintenance_calories)
+        if parameters is None:
+            return compiled.texts[tip_id]
+
+        key = (compiled.locale, tip_id) + parameters
+        text = self._rendered.get(key)
+        if text is not None:
+            self.hits += 1
+            self._rendered.move_to_end(key)
+            return text
+
+        self.misses += 1
+        text = self._rendered[key] = compiled.format(tip_id, *parameters)
+        if len(self._rendered) > self.maxsize:
+            self._rendered.popitem(last=False)
+            self.evictions += 1
+        return text
+
+    def render_tips(self, tip_ids, locale=DEFAULT_LOCALE, weight_kg=None, maintenance_calories=None):
+        """Tuple of rendered texts for tip_ids"""
+        compiled = self.compiled(locale)
+        texts = compiled.texts
+        templates = compiled.templates
+        # Fixed tips, the large majority, skip the cache entirely
+        return tuple(
+            self._render_personal(compiled, tip_id, weight_kg, maintenance_calories)
+            if tip_id in templates else texts[tip_id]
+            for tip_id in tip_ids
+        )
+
+    def render_result(self, result, locale=DEFAULT_LOCALE):
+        """A HealthResult's three tip sections, localized and personalized"""
+        weight_kg = result.profile.weight_kg
+        maintenance = result.maintenance_calories
+        return Recommendations(
+            nutrition=self.render_tips(map(TIP_IDS.__getitem__, result.nutrition_tips),
+                                       locale, weight_kg, maintenance),
+            exercise=self.render_tips(map(TIP_IDS.__getitem__, result.exercise_tips),
+                                      locale, weight_kg, maintenance),
+            lifestyle=self.render_tips(map(TIP_IDS.__getitem__, result.lifestyle_tips),
+                                       locale, weight_kg, maintenance)
+        )
+
+    def stats(self):
+        """Counters for sizing the cache"""
+        return {
+            "size": len(self._rendered),
+            "maxsize": self.maxsize,
+            "locales": sorted(self._locales),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+    def clear(self):
+        """Drop rendered strings and reset the counters (compiled locales are kept)"""
+        self._rendered.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+def tip_catalog(locale=DEFAULT_LOCALE):
+    """Like vexine_engine.tip_catalog(), with the tip texts in locale"""
+    catalog = engine.tip_catalog()
+    catalog["locale"] = locale
+    catalog["tips"] = list(CompiledLocale(locale).texts)
+    return catalog
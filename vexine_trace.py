@@ -0,0 +1,270 @@
+"""Opt-in timing spans and profiling hooks.
+
+Tracing is configured from the environment when this module is imported:
+
+    VEXINE_TRACE=hist                  per-span histograms, p50/p95/p99 table on exit
+    VEXINE_TRACE=hist:spans.json       ... written as JSON instead
+    VEXINE_TRACE=jsonl:spans.jsonl     one JSON line per finished span
+    VEXINE_TRACE=hist,jsonl:spans.jsonl   several sinks at once
+
+    VEXINE_PROFILE=cprofile:vexine.prof    cProfile the whole run
+    VEXINE_PROFILE=tracemalloc:memory.txt  tracemalloc top allocations
+
+Profiles are dumped at exit, or on demand with dump() (F9 in the GUI). A
+malformed variable only prints a warning to stderr and leaves that part off.
+
+Functions opt in with the @traced("name") decorator. When VEXINE_TRACE is
+unset the decorator returns the function unchanged, so disabled tracing
+costs nothing; configure() must therefore run before the instrumented
+modules are imported.
+"""
+import atexit
+import functools
+import json
+import math
+import os
+import sys
+import threading
+import time
+
+
+# Histogram buckets grow by 2%, so reported percentiles are within ~1%
+_BUCKET_GROWTH = 1.02
+_LOG_GROWTH = math.log(_BUCKET_GROWTH)
+DEFAULT_QUANTILES = (50, 95, 99)
+
+_sinks = []
+_profiler = None
+_profile_path = None
+_shutdown_registered = False
+_local = threading.local()
+
+
+class HistogramSink:
+    """In-memory log-bucketed duration histogram per span name"""
+
+    def __init__(self, report_path=None):
+        self.report_path = report_path
+        self._lock = threading.Lock()
+        self._spans = {}
+
+    def record(self, name, start_ns, duration_ns, depth):
+        bucket = int(math.log(duration_ns) / _LOG_GROWTH) if duration_ns > 0 else 0
+        with self._lock:
+            span = self._spans.get(name)
+            if span is None:
+                span = self._spans[name] = {"count": 0, "total": 0, "max": 0, "buckets": {}}
+            span["count"] += 1
+            span["total"] += duration_ns
+            span["max"] = max(span["max"], duration_ns)
+            span["buckets"][bucket] = span["buckets"].get(bucket, 0) + 1
+
+    def percentiles(self, quantiles=DEFAULT_QUANTILES):
+        """{span: {"count", "mean_ms", "max_ms", "p50_ms", ...}}"""
+        with self._lock:
+            spans = {name: (span["count"], span["total"], span["max"], sorted(span["buckets"].items()))
+                     for name, span in self._spans.items()}
+        report = {}
+        for name, (count, total, largest, buckets) in sorted(spans.items()):
+            entry = {"count": count, "mean_ms": total / count / 1e6, "max_ms": largest / 1e6}
+            for q in quantiles:
+                entry[f"p{q:g}_ms"] = min(_bucket_value(buckets, count, q), largest) / 1e6
+            report[name] = entry
+        return report
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+
+    def close(self):
+        report = self.percentiles()
+        if self.report_path:
+            with open(self.report_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        elif report:
+            print_report(report, sys.stderr)
+
+
+def _bucket_value(buckets, count, quantile):
+    """Upper edge (ns) of the bucket holding the given percentile"""
+    rank = max(1, math.ceil(count * quantile / 100))
+    seen = 0
+    for bucket, n in buckets:
+        seen += n
+        if seen >= rank:
+            return _BUCKET_GROWTH ** (bucket + 1)
+    return 0.0
+
+
+class JsonLinesSink:
+    """Append one JSON object per finished span to a file"""
+
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def record(self, name, start_ns, duration_ns, depth):
+        line = json.dumps({
+            "span": name,
+            "start_ns": start_ns,
+            "duration_ms": duration_ns / 1e6,
+            "depth": depth,
+            "thread": threading.current_thread().name
+        })
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+def print_report(report, file=None):
+    """Print a percentiles() report as a table"""
+    file = file or sys.stdout
+    print(f"{'span':32} {'count':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}", file=file)
+    for name, entry in report.items():
+        print(f"{name:32} {entry['count']:8} {entry.get('p50_ms', 0):9.3f} {entry.get('p95_ms', 0):9.3f} "
+              f"{entry.get('p99_ms', 0):9.3f} {entry['max_ms']:9.3f}", file=file)
+
+
+# Configuration
+
+def configure(spec):
+    """Install sinks from a VEXINE_TRACE-style spec ("hist", "jsonl:path", ...)
+
+    Raises ValueError (or OSError for an unwritable path) without
+    installing any sink if part of the spec is unusable.
+    """
+    parts = [part.partition(':') for part in filter(None, (p.strip() for p in spec.split(',')))]
+    for kind, _, _ in parts:
+        if kind not in ("hist", "jsonl"):
+            raise ValueError(f"Unknown trace sink: {kind}")
+    sinks = []
+    try:
+        for kind, _, arg in parts:
+            if kind == "hist":
+                sinks.append(HistogramSink(arg or None))
+            else:
+                sinks.append(JsonLinesSink(arg or "vexine_spans.jsonl"))
+    except OSError:
+        for sink in sinks:
+            if isinstance(sink, JsonLinesSink):
+                sink.close()
+        raise
+    _sinks.extend(sinks)
+    _register_shutdown()
+
+
+def start_profile(spec):
+    """Start a cProfile or tracemalloc session from a VEXINE_PROFILE-style spec"""
+    global _profiler, _profile_path
+    kind, _, path = spec.partition(':')
+    if kind == "cprofile":
+        import cProfile
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+        _profile_path = path or "vexine.prof"
+    elif kind == "tracemalloc":
+        import tracemalloc
+        tracemalloc.start()
+        _profiler = tracemalloc
+        _profile_path = path or "vexine_memory.txt"
+    else:
+        raise ValueError(f"Unknown profiler: {kind}")
+    _register_shutdown()
+
+
+def enabled():
+    """True when any span sink is installed"""
+    return bool(_sinks)
+
+
+def profiling():
+    """True when a profiler session is running"""
+    return _profiler is not None
+
+
+def histogram():
+    """The first installed HistogramSink, or None"""
+    for sink in _sinks:
+        if isinstance(sink, HistogramSink):
+            return sink
+    return None
+
+
+def percentiles(quantiles=DEFAULT_QUANTILES):
+    """p50/p95/p99 per span from the histogram sink ({} if none)"""
+    sink = histogram()
+    return sink.percentiles(quantiles) if sink else {}
+
+
+def dump():
+    """Write the profiler output and span percentiles now"""
+    if _profiler is not None:
+        if _profile_path and hasattr(_profiler, "dump_stats"):
+            _profiler.dump_stats(_profile_path)
+        elif _profile_path:
+            snapshot = _profiler.take_snapshot()
+            with open(_profile_path, 'w', encoding='utf-8') as f:
+                for stat in snapshot.statistics('lineno')[:50]:
+                    f.write(f"{stat}\n")
+        print(f"profile written to {_profile_path}", file=sys.stderr)
+    sink = histogram()
+    if sink is not None:
+        print_report(sink.percentiles(), sys.stderr)
+
+
+def _register_shutdown():
+    global _shutdown_registered
+    if not _shutdown_registered:
+        atexit.register(_shutdown)
+        _shutdown_registered = True
+
+
+def _shutdown():
+    if _profiler is not None:
+        dump()
+    for sink in _sinks:
+        sink.close()
+
+
+# Instrumentation
+
+def _record(name, start_ns, duration_ns, depth):
+    for sink in _sinks:
+        sink.record(name, start_ns, duration_ns, depth)
+
+
+def traced(name):
+    """Decorator timing every call as span `name` (identity when tracing is off)"""
+    def decorate(func):
+        if not _sinks:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            depth = getattr(_local, "depth", 0)
+            _local.depth = depth + 1
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(name, start, time.perf_counter_ns() - start, depth)
+                _local.depth = depth
+        return wrapper
+    return decorate
+
+
+def _configure_from_environment():
+    # A malformed variable must not stop the GUI, batch CLI or server from starting
+    for variable, setup in (("VEXINE_TRACE", configure), ("VEXINE_PROFILE", start_profile)):
+        spec = os.environ.get(variable)
+        if not spec:
+            continue
+        try:
+            setup(spec)
+        except (ValueError, OSError) as e:
+            print(f"warning: ignoring {variable}={spec!r}: {e}", file=sys.stderr)
+
+
+_configure_from_environment()
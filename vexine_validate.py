@@ -0,0 +1,226 @@
+"""Columnar validation and normalization of bulk profile feeds.
+
+Works on whole columns (the dicts vexine_batch.normalize_chunk produces)
+and never raises per row. Every row gets a RejectReason bit set, empty for
+rows that can be scored:
+
+  - numbers must be present and inside the GUI's spinbox bounds
+    (AGE_RANGE, HEIGHT_RANGE, WEIGHT_RANGE)
+  - heights in inches or metres and weights in pounds are converted to
+    cm / kg, from height_unit / weight_unit columns or, where no unit is
+    given, inferred from values that only make sense in the other unit;
+    each conversion is recorded as a Conversion bit
+  - option strings are canonicalized (case, spacing, "_"/"-", common
+    aliases such as "f" or "very_active") and unknown ones rejected
+
+    result = validate_profile(profile, units)
+    scored = result.accepted_profile()
+    result.rejected                   # row indices
+    describe(result.reasons[i])       # "HEIGHT_RANGE|UNKNOWN_GOAL"
+"""
+from dataclasses import dataclass
+from enum import IntFlag
+
+import numpy as np
+
+import vexine_engine as engine
+from vexine_cohort import encode_options
+from vexine_store import ENUM_FIELDS
+
+
+class RejectReason(IntFlag):
+    """Why a row cannot be scored (several may apply)"""
+    AGE_MISSING = 1 << 0
+    AGE_RANGE = 1 << 1
+    HEIGHT_MISSING = 1 << 2
+    HEIGHT_RANGE = 1 << 3
+    WEIGHT_MISSING = 1 << 4
+    WEIGHT_RANGE = 1 << 5
+    BODY_FAT_RANGE = 1 << 6
+    UNKNOWN_UNIT = 1 << 7
+    UNKNOWN_GENDER = 1 << 8
+    UNKNOWN_CURRENT_BODY_TYPE = 1 << 9
+    UNKNOWN_DESIRED_BODY_TYPE = 1 << 10
+    UNKNOWN_FITNESS_LEVEL = 1 << 11
+    UNKNOWN_GOAL = 1 << 12
+    UNKNOWN_ACTIVITY_LEVEL = 1 << 13
+
+
+class Conversion(IntFlag):
+    """Unit conversions applied to a row"""
+    HEIGHT_FROM_INCHES = 1 << 0
+    HEIGHT_FROM_METRES = 1 << 1
+    WEIGHT_FROM_POUNDS = 1 << 2
+
+
+CM_PER_INCH = 2.54
+CM_PER_METRE = 100.0
+KG_PER_POUND = 0.45359237
+
+# Accepted body fat percentages (only checked when a body_fat_pct column is given)
+BODY_FAT_RANGE = (2.0, 75.0)
+
+# Unit column spellings
+HEIGHT_UNITS = {"cm": 1.0, "m": CM_PER_METRE, "in": CM_PER_INCH, "inch": CM_PER_INCH, "inches": CM_PER_INCH}
+WEIGHT_UNITS = {"kg": 1.0, "lb": KG_PER_POUND, "lbs": KG_PER_POUND, "pound": KG_PER_POUND,
+                "pounds": KG_PER_POUND}
+
+# Spellings seen in feeds, after lower-casing and turning "_"/"-" into spaces
+ENUM_ALIASES = {
+    "gender": {"m": "male", "man": "male", "f": "female", "woman": "female"},
+    "activity_level": {"lightly active": "light", "moderately active": "moderate",
+                       "very": "very active"},
+    "goal": {"lose": "lose weight", "weight loss": "lose weight", "gain": "gain muscle",
+             "muscle gain": "gain muscle", "fitness": "improve fitness"}
+}
+
+_NUMERIC_REASONS = {
+    "age": (engine.AGE_RANGE, RejectReason.AGE_MISSING, RejectReason.AGE_RANGE),
+    "height_cm": (engine.HEIGHT_RANGE, RejectReason.HEIGHT_MISSING, RejectReason.HEIGHT_RANGE),
+    "weight_kg": (engine.WEIGHT_RANGE, RejectReason.WEIGHT_MISSING, RejectReason.WEIGHT_RANGE)
+}
+_ENUM_REASONS = {name: RejectReason[f"UNKNOWN_{name.upper()}"] for name in ENUM_FIELDS}
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    """Normalized columns plus per-row RejectReason and Conversion bits"""
+    profile: dict
+    reasons: np.ndarray
+    conversions: np.ndarray
+
+    def __len__(self):
+        return len(self.reasons)
+
+    @property
+    def accepted(self):
+        """Mask of rows that passed"""
+        return self.reasons == 0
+
+    @property
+    def rejected(self):
+        """Indices of rows that failed"""
+        return np.flatnonzero(self.reasons)
+
+    def accepted_profile(self):
+        """Normalized columns of the rows that passed"""
+        accepted = self.accepted
+        if accepted.all():
+            return self.profile
+        return {name: values[accepted] for name, values in self.profile.items()}
+
+    def reason_counts(self):
+        """{reason name: rows} over the whole chunk"""
+        return {reason.name: int(np.count_nonzero(self.reasons & reason)) for reason in RejectReason
+                if np.any(self.reasons & reason)}
+
+
+def describe(reasons):
+    """Readable form of a reason code, e.g. "HEIGHT_RANGE|UNKNOWN_GOAL" """
+    return "|".join(reason.name for reason in RejectReason if int(reasons) & reason)
+
+
+def canonical_options(values, name):
+    """Lower-case, trim and de-alias option strings of one enum column"""
+    text = np.char.lower(np.char.strip(np.asarray(values).astype(str)))
+    text = np.char.replace(np.char.replace(text, "_", " "), "-", " ")
+    aliases = ENUM_ALIASES.get(name)
+    if aliases:
+        # Widen first so the canonical spellings fit
+        width = max(text.dtype.itemsize // 4, max(map(len, aliases.values())))
+        text = text.astype(f"<U{width}")
+        for alias, option in aliases.items():
+            text[text == alias] = option
+    return text
+
+
+def _unit_factors(units, table, n):
+    """Per-row factor for a unit column (NaN for unknown units, 0 where blank)"""
+    if units is None:
+        return np.zeros(n)
+    text = np.char.lower(np.char.strip(np.asarray(units).astype(str)))
+    factors = np.full(n, np.nan)
+    factors[(text == "") | (text == "none") | (text == "nan")] = 0.0
+    for unit, factor in table.items():
+        factors[text == unit] = factor
+    return factors
+
+
+def normalize_units(height, weight, height_unit=None, weight_unit=None, infer=True):
+    """Heights in cm and weights in kg, with Conversion bits and unknown-unit rows
+
+    Rows with a unit column entry are converted by it. Without one, and
+    with infer set, a height that is outside the cm range but inside it
+    once read as inches (or metres) is converted, and likewise a weight
+    read as pounds; ambiguous values are left alone for the range checks.
+    """
+    n = len(height)
+    conversions = np.zeros(n, dtype=np.uint8)
+    height = np.array(height, dtype=np.float64)
+    weight = np.array(weight, dtype=np.float64)
+    height_factor = _unit_factors(height_unit, HEIGHT_UNITS, n)
+    weight_factor = _unit_factors(weight_unit, WEIGHT_UNITS, n)
+    unknown = np.isnan(height_factor) | np.isnan(weight_factor)
+
+    h_lo, h_hi, _ = engine.HEIGHT_RANGE
+    w_lo, w_hi, _ = engine.WEIGHT_RANGE
+    if infer:
+        # Only where no unit was given and the value is impossible in cm / kg
+        unstated = height_factor == 0
+        out = unstated & ~((height >= h_lo) & (height <= h_hi))
+        for factor in (CM_PER_INCH, CM_PER_METRE):
+            fits = out & (height * factor >= h_lo) & (height * factor <= h_hi)
+            height_factor[fits] = factor
+            out &= ~fits
+        unstated = weight_factor == 0
+        out = unstated & ~((weight >= w_lo) & (weight <= w_hi))
+        fits = out & (weight * KG_PER_POUND >= w_lo) & (weight * KG_PER_POUND <= w_hi)
+        weight_factor[fits] = KG_PER_POUND
+
+    height_factor[(height_factor == 0) | np.isnan(height_factor)] = 1.0
+    weight_factor[(weight_factor == 0) | np.isnan(weight_factor)] = 1.0
+    conversions[height_factor == CM_PER_INCH] |= int(Conversion.HEIGHT_FROM_INCHES)
+    conversions[height_factor == CM_PER_METRE] |= int(Conversion.HEIGHT_FROM_METRES)
+    conversions[weight_factor == KG_PER_POUND] |= int(Conversion.WEIGHT_FROM_POUNDS)
+    return height * height_factor, weight * weight_factor, conversions, unknown
+
+
+def validate_profile(profile, units=None, infer_units=True):
+    """Validate and normalize profile columns
+
+    profile maps HealthProfile field names (plus optional body_fat_pct) to
+    equal-length arrays, numeric ones as float64 with NaN for missing or
+    unparsable cells. units may hold "height_unit" / "weight_unit"
+    columns. Returns a ValidationResult; nothing is raised for bad rows.
+    """
+    units = units or {}
+    n = len(profile["height_cm"])
+    reasons = np.zeros(n, dtype=np.uint32)
+    normalized = dict(profile)
+
+    height, weight, conversions, unknown_unit = normalize_units(
+        profile["height_cm"], profile["weight_kg"],
+        units.get("height_unit"), units.get("weight_unit"), infer_units)
+    normalized["height_cm"] = height
+    normalized["weight_kg"] = weight
+    reasons[unknown_unit] |= int(RejectReason.UNKNOWN_UNIT)
+
+    for name, ((lo, hi, _), missing, out_of_range) in _NUMERIC_REASONS.items():
+        values = np.asarray(normalized[name], dtype=np.float64)
+        absent = np.isnan(values)
+        reasons[absent] |= int(missing)
+        # NaN compares False both ways, so absent rows do not also count as out of range
+        reasons[(values < lo) | (values > hi)] |= int(out_of_range)
+
+    body_fat = normalized.get("body_fat_pct")
+    if body_fat is not None:
+        lo, hi = BODY_FAT_RANGE
+        reasons[(body_fat < lo) | (body_fat > hi)] |= int(RejectReason.BODY_FAT_RANGE)
+
+    for name, options in ENUM_FIELDS.items():
+        values = canonical_options(profile[name], name)
+        codes = encode_options(values, options, name)
+        reasons[codes == len(options)] |= int(_ENUM_REASONS[name])
+        normalized[name] = np.array(options + ("",), dtype=object)[codes]
+
+    return ValidationResult(normalized, reasons, conversions)
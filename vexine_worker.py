@@ -0,0 +1,93 @@
+"""Background jobs for the GUI without blocking the Tk event loop.
+
+Jobs run on a worker thread and their outcomes are handed back through a
+queue that the event loop drains with poll(), typically from a repeating
+root.after() callback. Every submit() starts a new generation; outcomes of
+older generations are stale (their inputs have changed since) and poll()
+drops them, and a job that is still queued when it goes stale is never
+started. A running job can check stale() before side effects such as a
+history write.
+
+    worker = AnalysisWorker()
+    worker.submit(analyze, profile)
+    ...
+    for outcome in worker.poll():       # on the Tk thread
+        show(outcome.value)
+"""
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Outcome:
+    """Result of one job: value, or the exception it raised"""
+    generation: int
+    value: object = None
+    error: BaseException = None
+
+
+class AnalysisWorker:
+    """Single background thread with generation-based cancellation
+
+    One thread keeps jobs in submission order and lets them share state
+    that is not thread-safe (an AnalysisCache, a SQLite connection) as
+    long as only jobs touch it.
+    """
+
+    def __init__(self):
+        self.generation = 0
+        self._running = None
+        self._waiting = None
+        self._outcomes = queue.SimpleQueue()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vexine-worker")
+
+    @property
+    def busy(self):
+        """Whether the current generation's outcome has not been polled yet"""
+        return self._waiting is not None
+
+    def submit(self, func, *args, **kwargs):
+        """Run func(*args, **kwargs) in the background, superseding earlier jobs"""
+        self.generation += 1
+        self._waiting = self.generation
+        self._executor.submit(self._run, self.generation, func, args, kwargs)
+        return self.generation
+
+    def cancel(self):
+        """Make every submitted job stale"""
+        self.generation += 1
+        self._waiting = None
+
+    def stale(self):
+        """Whether the running job has been cancelled or superseded (call from a job)"""
+        return self._running != self.generation
+
+    def _run(self, generation, func, args, kwargs):
+        if generation != self.generation:
+            return
+        self._running = generation
+        try:
+            outcome = Outcome(generation, func(*args, **kwargs))
+        except Exception as e:
+            outcome = Outcome(generation, error=e)
+        finally:
+            self._running = None
+        self._outcomes.put(outcome)
+
+    def poll(self):
+        """Finished outcomes of the current generation (call from the UI thread)"""
+        outcomes = []
+        while True:
+            try:
+                outcome = self._outcomes.get_nowait()
+            except queue.Empty:
+                return outcomes
+            if outcome.generation == self._waiting:
+                self._waiting = None
+                outcomes.append(outcome)
+
+    def shutdown(self, wait=True):
+        """Cancel pending jobs and stop the thread"""
+        self.cancel()
+        self._executor.shutdown(wait=wait, cancel_futures=True)